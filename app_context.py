@@ -3,7 +3,7 @@ class AppContext:
     Holds references to all manager instances (DAOs) to be passed around
     the application, avoiding long argument lists and circular dependency issues.
     """
-    def __init__(self, user_manager, camp_manager, activity_manager, daily_report_manager, message_manager, announcement_manager, system_notification_manager, audit_log_manager, camper_manager):
+    def __init__(self, user_manager, camp_manager, activity_manager, daily_report_manager, message_manager, announcement_manager, system_notification_manager, audit_log_manager, camper_manager, db_context=None, unit_of_work=None):
         self.user_manager = user_manager
         self.camp_manager = camp_manager
         self.activity_manager = activity_manager
@@ -13,3 +13,40 @@ class AppContext:
         self.system_notification_manager = system_notification_manager
         self.audit_log_manager = audit_log_manager
         self.camper_manager = camper_manager
+        self.db_context = db_context
+        self.unit_of_work = unit_of_work
+
+    @classmethod
+    def create(cls, db_context=None):
+        """
+        Build every manager on one shared DBContext, so the schema is checked
+        once per launch instead of once per manager, and attach a UnitOfWork
+        that the main loop opens around each menu action.
+        """
+        from persistence.db_context import DBContext
+        from persistence.unit_of_work import UnitOfWork
+        from persistence.dao.user_manager import UserManager
+        from persistence.dao.camp_manager import CampManager
+        from persistence.dao.activity_manager import ActivityManager
+        from persistence.dao.daily_report_manager import DailyReportManager
+        from persistence.dao.message_manager import MessageManager
+        from persistence.dao.announcement_manager import AnnouncementManager
+        from persistence.dao.system_notification_manager import SystemNotificationManager
+        from persistence.dao.audit_log_manager import AuditLogManager
+        from persistence.dao.camper_manager import CamperManager
+
+        db = db_context or DBContext()
+        unit_of_work = UnitOfWork(db)
+        return cls(
+            UserManager(db),
+            CampManager(db, unit_of_work=unit_of_work),
+            ActivityManager(db),
+            DailyReportManager(db),
+            MessageManager(db),
+            AnnouncementManager(db),
+            SystemNotificationManager(db),
+            AuditLogManager(db),
+            CamperManager(db),
+            db_context=db,
+            unit_of_work=unit_of_work,
+        )
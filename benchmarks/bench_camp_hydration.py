@@ -0,0 +1,91 @@
+"""
+Benchmark: camp hydration cost as the number of camps grows.
+
+Reports the number of SELECT statements and wall time for CampManager.read_all
+against a throwaway database. The query count should stay flat regardless of
+how many camps (and activities) exist.
+
+    python -m benchmarks.bench_camp_hydration
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from models.activity import Activity, Session
+from models.camp import Camp
+from models.camper import Camper
+from models.resource import Equipment
+from persistence.db_context import DBContext
+from persistence.dao.camp_manager import CampManager
+
+CAMP_COUNTS = [10, 100, 500]
+CAMPERS_PER_CAMP = 20
+ACTIVITIES_PER_CAMP = 6
+
+
+class CountingDBContext(DBContext):
+    def __init__(self, db_path):
+        self.selects = 0
+        super().__init__(db_path)
+
+    def _trace(self, statement):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.selects += 1
+
+    def get_connection(self, *args, **kwargs):
+        conn = super().get_connection(*args, **kwargs)
+        conn.set_trace_callback(self._trace)
+        return conn
+
+
+def _make_camp(index):
+    campers = [Camper(name=f"Camper {index}-{i}", age=12) for i in range(CAMPERS_PER_CAMP)]
+    activities = []
+    for i in range(ACTIVITIES_PER_CAMP):
+        act = Activity(f"Activity {i}", "2030-07-0%d" % (1 + i % 3), Session(i % 3), is_indoor=False)
+        act.campers = [c.camper_id for c in campers[::2]]
+        activities.append(act)
+    camp_id = str(uuid.uuid4())
+    return Camp(
+        camp_id=camp_id,
+        name=f"Camp {index}",
+        location="Forest",
+        camp_type="Adventure",
+        start_date=date(2030, 7, 1),
+        end_date=date(2030, 7, 3),
+        campers=campers,
+        initial_food_stock=500,
+        equipment=[Equipment(str(uuid.uuid4()), "Tent", camp_id, 10, 8)],
+        activities=activities,
+    )
+
+
+def run():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = CountingDBContext(os.path.join(tmp_dir, "bench.db"))
+        manager = CampManager(db)
+        existing = 0
+        print(f"{'camps':>8} {'selects':>8} {'seconds':>10}")
+        for target in CAMP_COUNTS:
+            for i in range(existing, target):
+                manager.add(_make_camp(i))
+            existing = target
+
+            db.selects = 0
+            start = time.perf_counter()
+            camps = manager.read_all()
+            elapsed = time.perf_counter() - start
+            assert len(camps) == target
+            print(f"{target:>8} {db.selects:>8} {elapsed:>10.4f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,72 @@
+"""
+Benchmark: CSV camper import as the file grows.
+
+Imports generated rosters into one camp of a throwaway database that
+already holds overlapping camps, so every row is checked against existing
+names. Reports wall time and the peak memory allocated during the import,
+which grows with the names held for duplicate checks rather than with the
+file itself. Times include tracemalloc overhead (about 3x on CPython 3.11).
+
+    python -m benchmarks.bench_camper_import
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from benchmarks.bench_camp_hydration import _make_camp
+from persistence.db_context import DBContext
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.camper_manager import CamperManager
+
+ROW_COUNTS = [10_000, 50_000, 100_000]
+OVERLAPPING_CAMPS = 50
+# Every n-th generated name is already registered in another camp.
+DUPLICATE_EVERY = 20
+
+
+def _write_roster(path, rows, offset):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write("name,age,contact,medical_info\n")
+        for i in range(rows):
+            f.write(f"Import {offset + i},{8 + i % 9},07700 9{i % 100000:05d},None\n")
+            if i % DUPLICATE_EVERY == 0:
+                f.write(f"Camper {i % OVERLAPPING_CAMPS}-0,10,555,None\n")
+
+
+def run():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = DBContext(os.path.join(tmp_dir, "bench.db"))
+        camps = CampManager(db)
+        for i in range(OVERLAPPING_CAMPS):
+            camps.add(_make_camp(i))
+        target = _make_camp(OVERLAPPING_CAMPS)
+        target.campers, target.activities = [], []
+        camps.add(target)
+
+        campers = CamperManager(db)
+        campers.DEF_PATH = tmp_dir
+
+        print(f"{'rows':>8} {'imported':>9} {'skipped':>8} {'seconds':>8} {'peak MB':>8}")
+        offset = 0
+        for rows in ROW_COUNTS:
+            _write_roster(os.path.join(tmp_dir, "roster.csv"), rows, offset)
+            offset += rows
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            results = campers.import_campers_from_csv(target, "roster.csv")
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+            print(f"{rows:>8} {results['imported_count']:>9} {results['skipped_count']:>8} {elapsed:>8.2f} {peak:>8.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,87 @@
+"""
+Benchmark: emergency camper lookup as the number of campers grows.
+
+Times CamperManager.search for one leader against a throwaway database
+holding tens of thousands of campers spread over many camps and leaders.
+The first lookup after a write builds the leader's index ("build ms");
+repeated lookups should stay well under a millisecond.
+
+    python -m benchmarks.bench_camper_search
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from benchmarks.bench_camp_hydration import _make_camp
+from models.camper import Camper
+from persistence.db_context import DBContext
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.camper_manager import CamperManager
+from persistence.dao.user_manager import UserManager
+
+CAMP_COUNTS = [100, 500, 1000]
+CAMPERS_PER_CAMP = 40
+LEADERS = 100
+QUERIES = ["ann", "smith", "07700 9", "jo", "zz"]
+REPEATS = 200
+
+FIRST_NAMES = ["Ann", "Joanna", "Bob", "Priya", "Liam", "Zoe", "Mohammed", "Chen", "Olivia", "Noah"]
+LAST_NAMES = ["Smith", "Jones", "Khan", "Williams", "Brown", "Taylor", "Patel", "Wilson", "Evans", "Lee"]
+
+
+def _make_leader_camp(index, rng):
+    camp = _make_camp(index)
+    camp.camp_leader = f"leader{index % LEADERS}"
+    camp.campers = [
+        Camper(
+            name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {index}-{i}",
+            age=rng.randint(8, 16),
+            contact=f"07700 9{rng.randint(0, 99999):05d}",
+        )
+        for i in range(CAMPERS_PER_CAMP)
+    ]
+    camp.activities = []
+    return camp
+
+
+def run():
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = DBContext(os.path.join(tmp_dir, "bench.db"))
+        users = UserManager(db)
+        for i in range(LEADERS):
+            users.create_user(f"leader{i}", "pw", "Leader")
+        camps = CampManager(db)
+        campers = CamperManager(db)
+
+        existing = 0
+        print(f"{'campers':>8} {'query':>10} {'results':>8} {'median ms':>10} {'build ms':>10}")
+        for target in CAMP_COUNTS:
+            for i in range(existing, target):
+                camps.add(_make_leader_camp(i, rng))
+            existing = target
+
+            start = time.perf_counter()
+            campers.search("", leader_username="leader3")
+            build_ms = (time.perf_counter() - start) * 1000
+
+            for query in QUERIES:
+                timings = []
+                for _ in range(REPEATS):
+                    start = time.perf_counter()
+                    results = campers.search(query, leader_username="leader3")
+                    timings.append(time.perf_counter() - start)
+                median_ms = statistics.median(timings) * 1000
+                print(f"{target * CAMPERS_PER_CAMP:>8} {query!r:>10} {len(results):>8} {median_ms:>10.3f} {build_ms:>10.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,87 @@
+"""
+Startup benchmark: time from interpreter start to the login prompt.
+
+Each launch runs in a fresh interpreter against a temporary database that
+already holds one user, imports main, bootstraps the AppContext and stops at
+the first login prompt. Also reports how many SQL statements bootstrap runs
+against an already-initialised database (DDL should be skipped entirely).
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app_context import AppContext
+from persistence.db_context import DBContext
+from persistence.dao.user_manager import UserManager
+
+LAUNCHES = 5
+
+LAUNCH_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import main
+import cli.input_utils as input_utils
+from persistence.db_context import DBContext
+
+def prompt(*args, **kwargs):
+    print(f"{time.perf_counter() - start:.4f}")
+    raise input_utils.QuitException()
+
+input_utils.get_input = prompt
+context = main.bootstrap(DBContext(sys.argv[1]))
+main.Session(context.user_manager).login()
+"""
+
+
+class CountingDBContext(DBContext):
+    def __init__(self, db_path):
+        self.statements = 0
+        super().__init__(db_path)
+
+    def _trace(self, statement):
+        self.statements += 1
+
+    def get_connection(self, *args, **kwargs):
+        conn = super().get_connection(*args, **kwargs)
+        conn.set_trace_callback(self._trace)
+        return conn
+
+
+def _launch(db_path, repo_root):
+    result = subprocess.run(
+        [sys.executable, "-c", LAUNCH_SCRIPT, db_path],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def run():
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        seed = DBContext(db_path)
+        UserManager(seed).create_user("admin", "admin", "Admin")
+        seed.close()
+
+        counting = CountingDBContext(db_path)
+        AppContext.create(counting)
+        counting.close()
+        print(f"statements run by bootstrap on an initialised db: {counting.statements}")
+
+        timings = [_launch(db_path, repo_root) for _ in range(LAUNCHES)]
+        print(f"{'launches':>8} {'median s':>10} {'min s':>10}")
+        print(f"{LAUNCHES:>8} {statistics.median(timings):>10.4f} {min(timings):>10.4f}")
+
+
+if __name__ == "__main__":
+    run()
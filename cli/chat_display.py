@@ -37,14 +37,15 @@ class ConversationDisplay(DisplayHelper):
         
         console_manager.print_message("═" * self.width)
 
-    def display_chat_thread(self, partner: str, messages: list[dict], current_user: str) -> None:
+    def display_chat_thread(self, partner: str, messages: list[dict], current_user: str, has_older: bool = False) -> None:
         """
-        Display full message thread with a specific partner.
+        Display message thread with a specific partner.
         
         Args:
             partner: Username of the other person
             messages: List of message dicts
             current_user: Username of the viewer
+            has_older: Whether older messages can be loaded with 'o'
         """
         console_manager.print_header(f"Chat with {partner}")
         
@@ -124,7 +125,31 @@ class ConversationDisplay(DisplayHelper):
                     console.print(Align.left(panel))
         
         console_manager.print_message("\n")
-        console_manager.print_message("[italic dim](Press Enter to refresh, 'r' to reply, or 'b' to back)[/italic dim]")
+        if has_older:
+            console_manager.print_message("[italic dim](Press Enter to refresh, 'o' for older messages, 'r' to reply, or 'b' to back)[/italic dim]")
+        else:
+            console_manager.print_message("[italic dim](Press Enter to refresh, 'r' to reply, or 'b' to back)[/italic dim]")
+
+    def display_search_results(self, results: list[dict], current_user: str) -> None:
+        """
+        Display message search results, best match first.
+        
+        Args:
+            results: List from MessageManager.search()
+            current_user: Username of the viewer
+        """
+        console_manager.print_header("MESSAGE SEARCH RESULTS")
+
+        for i, msg in enumerate(results, start=1):
+            if msg['from_user'] == current_user:
+                direction = f"To {msg['to_user']}"
+            else:
+                direction = f"From {msg['from_user']}"
+            sent_at = (msg.get('sent_at') or '')[:16].replace('T', ' ')
+            content = f"[bold medium_purple1]{i}. {direction}[/bold medium_purple1] [dim]{sent_at}[/dim]\n{console_manager.format_snippet(msg['snippet'])}"
+            console_manager.print_panel(content, style="blue")
+
+        console_manager.print_message("═" * self.width)
 
 
 # Default instance for easy import
@@ -3,12 +3,14 @@ Centralized Console Manager using Rich library.
 Handles all styled output for the application.
 """
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 from rich.style import Style
 from typing import List, Any, Optional
+from models.search_snippet import MATCH_START, MATCH_END
 
 # Custom theme for consistent styling
 custom_theme = Theme({
@@ -17,7 +19,8 @@ custom_theme = Theme({
     "error": "bold red",
     "success": "bold medium_purple1",
     "header": "bold white on blue",
-    "highlight": "medium_purple1"
+    "highlight": "medium_purple1",
+    "match": "bold yellow"
 })
 
 class ConsoleManager:
@@ -69,6 +72,10 @@ class ConsoleManager:
         """Prints a full-width centered banner."""
         self.console.print(Panel(Text.from_markup(message, justify="center"), title=title, style=style, expand=True))
 
+    def format_snippet(self, snippet: str) -> str:
+        """Returns markup for a search snippet with the matched terms highlighted."""
+        return escape(snippet or "").replace(MATCH_START, "[match]").replace(MATCH_END, "[/match]")
+
     def input(self, prompt: str) -> str:
         """
         Wrapper for input using rich console.
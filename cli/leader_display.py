@@ -126,6 +126,7 @@ class LeaderDisplay:
 1. Create New Report
 2. View Reports
 3. Delete Report
+4. Search Reports
 """, style="blue")
 
     def display_daily_reports_list(self, reports):
@@ -151,6 +152,20 @@ class LeaderDisplay:
 
         console_manager.console.print(table)
 
+    def display_report_search_results(self, reports):
+        """
+        Displays daily report search results, best match first.
+        """
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("Date", width=12)
+        table.add_column("Camp")
+        table.add_column("Match", width=50)
+
+        for r in reports:
+            table.add_row(r["date"], r.get("camp_name", ""), console_manager.format_snippet(r.get("snippet")))
+
+        console_manager.console.print(table)
+
     def display_reports_for_deletion(self, reports):
         """
         Displays reports as a simple list for deletion selection.
@@ -216,6 +231,7 @@ class LeaderDisplay:
 4. Search Activity Library
 5. Assign Campers to Activities
 6. Remove Activity
+7. Import Activity Rosters from CSV
 """, style="blue")
 
     def display_search_activity_results(self, matches):
@@ -314,6 +330,67 @@ class LeaderDisplay:
         from cli.input_utils import wait_for_enter
         wait_for_enter()
 
+    def display_bulk_import_results(self, report):
+        """
+        Displays one row per imported file, then the totals.
+        """
+        table = Table(title="Bulk Camper Import", show_header=True, header_style="bold cyan")
+        table.add_column("File")
+        table.add_column("Camp")
+        table.add_column("Imported", justify="right")
+        table.add_column("Skipped", justify="right")
+        table.add_column("Errors", justify="right")
+
+        for result in report["files"]:
+            table.add_row(
+                result["file"],
+                result["camp"],
+                str(result["imported_count"]),
+                str(result["skipped_count"]),
+                str(len(result["errors"])),
+            )
+        console_manager.console.print(table)
+
+        for result in report["files"]:
+            for e in result["errors"]:
+                console_manager.print_error(f"{result['file']}: {e}")
+
+        console_manager.print_success(
+            f"Imported {report['imported_count']} campers from {len(report['files'])} files. "
+            f"(Skipped {report['skipped_count']}, errors {report['error_count']})"
+        )
+        from cli.input_utils import wait_for_enter
+        wait_for_enter()
+
+    def display_roster_import_results(self, results, camp_name):
+        """
+        Displays per-activity results of an activity roster import.
+        """
+        for w in results["warnings"]:
+            console_manager.print_warning(w)
+        for e in results["errors"]:
+            console_manager.print_error(e)
+
+        table = Table(title=f"Roster Import - {camp_name}", show_header=True, header_style="bold cyan")
+        table.add_column("Activity")
+        table.add_column("Date")
+        table.add_column("Session")
+        table.add_column("Added", justify="right")
+        table.add_column("Already Assigned", justify="right")
+        for activity in results["activities"]:
+            table.add_row(
+                activity["name"],
+                activity["date"],
+                activity["session"],
+                str(activity["imported_count"]),
+                str(activity["skipped_count"]),
+            )
+        console_manager.console.print(table)
+
+        console_manager.print_success(f"Roster imported. (Skipped {results['skipped_count']} unmatched rows)")
+        from cli.input_utils import wait_for_enter
+        wait_for_enter()
+
     def display_conflict_resolution(self, existing, new_name):
         """
         Displays a conflict resolution screen comparing existing and new activities.
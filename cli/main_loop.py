@@ -1,5 +1,9 @@
 # cli/main_loop.py
 """Main program loop and command processing."""
+import sqlite3
+from contextlib import nullcontext
+
+from cli.console_manager import console_manager
 from cli.input_utils import get_input, QuitException, BackException
 
 HOME_PROMPT = "> "
@@ -55,8 +59,14 @@ def run_program(user, handler):
             print("Please enter a number from the list.")
             continue
         
+        # One unit of work per action: camps are loaded once and saved together.
+        unit_of_work = getattr(handler.context, "unit_of_work", None)
         try:
-            handler.commands[choice - 1]["command"]()
+            with unit_of_work.scope() if unit_of_work else nullcontext():
+                handler.commands[choice - 1]["command"]()
         except QuitException:
             print("Goodbye!")
             break
+        except sqlite3.Error as e:
+            # A failed flush is rolled back as a whole; report it and keep the session.
+            console_manager.print_error(f"Could not save changes: {e}")
@@ -3,8 +3,8 @@ from persistence.dao.user_manager import UserManager
 
 # Not a proper class
 class Session:
-    def __init__(self):
-        self.user_manager = UserManager()
+    def __init__(self, user_manager=None):
+        self.user_manager = user_manager or UserManager()
 
     def login(self):
         from cli.console_manager import console_manager
@@ -43,6 +43,6 @@ class Session:
             
             console_manager.print_success(f"Welcome {found_user['username']}")
 
-            user_class = user_from_dict(found_user)
+            user_class = user_from_dict(found_user, user_manager=self.user_manager)
 
             return user_class
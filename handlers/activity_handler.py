@@ -42,6 +42,8 @@ class ActivityHandler(BaseHandler):
                 self.manage_activity_roster()
             elif choice == "6":
                 self.remove_activity()
+            elif choice == "7":
+                self.import_activity_rosters()
             elif choice.lower() == "b":
                 break
             else:
@@ -49,8 +51,7 @@ class ActivityHandler(BaseHandler):
 
     @cancellable
     def view_weekly_schedule(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
         
         if not my_camps:
             self.display.display_error("You don't supervise any camps.")
@@ -64,8 +65,7 @@ class ActivityHandler(BaseHandler):
 
     @cancellable
     def remove_activity(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
         
         if not my_camps:
             self.display.display_error("You don't supervise any camps.")
@@ -119,9 +119,7 @@ class ActivityHandler(BaseHandler):
 
     @cancellable
     def add_activities_to_camp(self):
-        camps = self.context.camp_manager.read_all()
-        # Filter for camps supervised by current user
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You don't supervise any camps.")
@@ -222,6 +220,39 @@ class ActivityHandler(BaseHandler):
             else:
                 break
 
+    @cancellable
+    def import_activity_rosters(self):
+        camp = self._select_camp_delegated()
+        if not camp: return
+
+        if not camp.activities:
+            self.display.display_error("No activities scheduled for this camp.")
+            return
+
+        for i, act in enumerate(camp.activities, 1):
+            snap = self._activity_snapshot(act)
+            self.display.display_info(f"{i}. {snap.get('name')} ({snap.get('date')} - {snap.get('session')})")
+        choice = get_input("Activity numbers separated by commas (Enter for all): ").strip()
+        activity_ids = None
+        if choice:
+            try:
+                chosen = [camp.activities[int(part) - 1] for part in choice.split(",") if part.strip()]
+            except (ValueError, IndexError):
+                self.display.display_error("Invalid selection.")
+                return
+            if any(act.activity_id is None for act in chosen):
+                # Activities that were never saved get their ids from the insert.
+                self.context.camp_manager.update(camp)
+                if self.context.unit_of_work is not None:
+                    self.context.unit_of_work.flush()
+            activity_ids = [act.activity_id for act in chosen]
+
+        csv_file = self.display.select_csv_file(self.context.camper_manager.get_available_csv_files())
+        if not csv_file: return
+
+        results = self.context.camper_manager.import_roster_to_activities(camp, csv_file, activity_ids, self.context)
+        self.display.display_roster_import_results(results, camp.name)
+
     def add_all_campers_to_activity(self, activity_data, camp, activity_index):
         success, message = self.activity_service.add_all_campers_to_activity(camp.name, activity_index)
         if success:
@@ -272,8 +303,7 @@ class ActivityHandler(BaseHandler):
 
     @cancellable
     def view_camp_activities(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You don't supervise any camps.")
@@ -286,7 +316,7 @@ class ActivityHandler(BaseHandler):
             index = int(choice) - 1
             if not (0 <= index < len(my_camps)):
                  return
-            camp = my_camps[index]
+            camp = self.context.camp_manager.get_camp_by_id(my_camps[index].camp_id, lazy=True)
         except:
              return
 
@@ -324,7 +354,7 @@ class ActivityHandler(BaseHandler):
         """
         Helper to select a camp for the current leader.
         """
-        my_camps = self.context.camp_manager.get_camps_by_leader(self.user.username)
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
         
         if not my_camps:
             self.display.display_error("You do not supervise any camps.")
@@ -340,6 +370,6 @@ class ActivityHandler(BaseHandler):
 
             index = int(choice) - 1
             if 0 <= index < len(my_camps):
-                return my_camps[index]
+                return self.context.camp_manager.get_camp_by_id(my_camps[index].camp_id, lazy=True)
             
             self.display.display_error("Invalid selection. Try again.")
@@ -1,6 +1,5 @@
 import uuid
 import os
-import json
 from datetime import datetime
 from handlers.base_handler import BaseHandler
 from cli.input_utils import get_input, cancellable, wait_for_enter
@@ -13,6 +12,7 @@ from services.user_service import UserService
 from rich.table import Table
 from rich.console import Console
 from cli.coordinator_display import coordinator_display
+from persistence import backup
 
 
 
@@ -492,63 +492,65 @@ class AdminHandler(BaseHandler):
 
     @cancellable
     def handle_backup_data(self):
-        """Backs up all system data to a JSON file."""
-        backup_dir = "persistence/data/backups"
-        os.makedirs(backup_dir, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"backup_{timestamp}.json"
-        filepath = os.path.join(backup_dir, filename)
-        
-        console_manager.print_info(f"Creating backup: {filename}...")
-        
+        """Backs up the database as a full snapshot, an incremental backup or a JSON export."""
+        console_manager.print_info("1. Full database snapshot (compressed)")
+        console_manager.print_info("2. Incremental backup (changes since the last backup)")
+        console_manager.print_info("3. JSON export")
+        choice = get_input("Select backup type or 'b' to go back: ")
+        if choice not in ("1", "2", "3"):
+            console_manager.print_error("Invalid selection.")
+            return
+
+        # Snapshots read committed data, so write out anything this action has pending.
+        if self.context.unit_of_work is not None:
+            self.context.unit_of_work.flush()
+        db = self.context.db_context or self.context.camp_manager.db
+
         try:
-            # Gather data
-            # Note: CampManager returns objects, need to convert to dicts
-            camps_data = [c.to_dict() for c in self.context.camp_manager.read_all()]
-            
-            backup_data = {
-                "timestamp": timestamp,
-                "users": self.context.user_manager.read_all(),
-                "camps": camps_data,
-                "messages": self.context.message_manager.read_all(),
-                "announcements": self.context.announcement_manager.read_all(),
-                "notifications": self.context.system_notification_manager.read_all(),
-                "audit_logs": self.context.audit_log_manager.read_all()
-            }
-            
-            with open(filepath, "w") as f:
-                json.dump(backup_data, f, indent=4)
-                
+            with console_manager.console.status("Creating backup...") as status:
+                if choice == "1":
+                    def progress(copied, total):
+                        status.update(f"Copying database: {copied}/{total} pages...")
+
+                    filepath = backup.create_backup(db, progress=progress)
+                elif choice == "2":
+                    def progress(written, total):
+                        status.update(f"Saving changes: {written}/{total}...")
+
+                    filepath = backup.create_incremental_backup(db, progress=progress)
+                else:
+                    def progress(table, rows):
+                        status.update(f"Exporting {table}: {rows} rows...")
+
+                    filepath = backup.export_json(db, progress=progress)
+
+            if filepath is None:
+                console_manager.print_info("Nothing has changed since the last backup.")
+                wait_for_enter()
+                return
+
+            filename = os.path.basename(filepath)
             console_manager.print_success(f"Backup created successfully at {filepath}")
             self.context.audit_log_manager.log_event(self.user.username, "System Backup", f"Created backup {filename}")
-            
+
         except Exception as e:
             console_manager.print_error(f"Backup failed: {e}")
-            
+
         wait_for_enter()
 
     @cancellable
     def handle_restore_data(self):
-        """Restores system data from a backup file."""
-        backup_dir = "persistence/data/backups"
-        if not os.path.exists(backup_dir):
-            console_manager.print_error("No backups directory found.")
-            wait_for_enter()
-            return
-            
-        files = [f for f in os.listdir(backup_dir) if f.endswith(".json")]
+        """Restores system data from a database snapshot or JSON export, optionally to a point in time."""
+        files = backup.list_backups()
         if not files:
             console_manager.print_error("No backup files found.")
             wait_for_enter()
             return
-            
-        files.sort(reverse=True) # Newest first
-        
+
         console_manager.print_info("Available Backups:")
         for i, f in enumerate(files, 1):
             print(f"{i}. {f}")
-            
+
         choice = get_input("Select backup to restore (number) or 'b' to go back: ")
         try:
             idx = int(choice) - 1
@@ -559,64 +561,49 @@ class AdminHandler(BaseHandler):
         except ValueError:
             console_manager.print_error("Invalid input.")
             return
-            
+
+        filepath = os.path.join(backup.BACKUP_DIR, selected_file)
+        replay, until = False, None
+        changes = backup.change_files_for(filepath)
+        if changes:
+            first, last = changes[0][1]["first_change_at"][:19], changes[-1][1]["last_change_at"][:19]
+            console_manager.print_info(f"{len(changes)} incremental backups hold changes from {first} to {last}.")
+            point = get_input("Replay changes up to (yyyy-mm-dd hh:mm[:ss]), Enter for all, or 'n' for the snapshot only: ").strip()
+            if point.lower() != "n":
+                replay = True
+                if point:
+                    try:
+                        until = datetime.strptime(point, "%Y-%m-%d %H:%M:%S" if point.count(":") == 2 else "%Y-%m-%d %H:%M")
+                    except ValueError:
+                        console_manager.print_error("Invalid date and time.")
+                        return
+
         confirm = get_input(f"WARNING: This will OVERWRITE all current system data with data from {selected_file}.\nType 'CONFIRM' to proceed: ")
         if confirm != "CONFIRM":
             console_manager.print_info("Restore cancelled.")
             return
-            
-        filepath = os.path.join(backup_dir, selected_file)
-        console_manager.print_info(f"Restoring from {selected_file}...")
-        
+
+        db = self.context.db_context or self.context.camp_manager.db
+
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-                
-            # Restore Users
-            # UserManager caches data in memory, so we update memory and save
-            if "users" in data:
-                self.context.user_manager.users = data["users"]
-                self.context.user_manager.save_data()
-                print("✓ Users restored")
-                
-            # Restore Camps
-            if "camps" in data:
-                with open(self.context.camp_manager.filepath, "w") as f:
-                    json.dump(data["camps"], f, indent=4)
-                print("✓ Camps restored")
-                
-            # Restore Messages
-            if "messages" in data:
-                with open(self.context.message_manager.filepath, "w") as f:
-                    json.dump(data["messages"], f, indent=4)
-                print("✓ Messages restored")
-                
-            # Restore Announcements
-            if "announcements" in data:
-                # AnnouncementManager uses 'data_file'
-                with open(self.context.announcement_manager.data_file, "w") as f:
-                    json.dump(data["announcements"], f, indent=4)
-                print("✓ Announcements restored")
-                
-            # Restore Notifications
-            if "notifications" in data:
-                # SystemNotificationManager uses 'file_path'
-                with open(self.context.system_notification_manager.file_path, "w") as f:
-                    json.dump(data["notifications"], f, indent=4)
-                print("✓ Notifications restored")
-                
-            # Restore Audit Logs
-            if "audit_logs" in data:
-                with open(self.context.audit_log_manager.filepath, "w") as f:
-                    json.dump(data["audit_logs"], f, indent=4)
-                print("✓ Audit Logs restored")
-                
+            with console_manager.console.status(f"Restoring from {selected_file}...") as status:
+                def progress(table, rows):
+                    status.update(f"Loading {table}: {rows} rows...")
+
+                counts = backup.restore_backup(db, filepath, progress=progress, replay=replay, until=until)
+
+            # Anything loaded or queued before the restore belongs to the old data.
+            if self.context.unit_of_work is not None:
+                self.context.unit_of_work.discard()
+
+            for table, count in counts.items():
+                print(f"✓ {table}: {count} rows")
             console_manager.print_success("System restore completed successfully.")
-            self.context.audit_log_manager.log_event(self.user.username, "System Restore", f"Restored from {selected_file}")
-            
+            console_manager.print_info("Incremental backups resume after the next full backup.")
+            restored_to = f" up to {until}" if until else ""
+            self.context.audit_log_manager.log_event(self.user.username, "System Restore", f"Restored from {selected_file}{restored_to}")
+
         except Exception as e:
-            console_manager.print_error(f"Restore failed: {e}")
-            import traceback
-            traceback.print_exc()
-            
-        wait_for_enter()
\ No newline at end of file
+            console_manager.print_error(f"Restore failed, no data was changed: {e}")
+
+        wait_for_enter()
@@ -24,6 +24,7 @@ class BaseHandler:
             {"name": "View specific chat", "command": self.view_chat},
             {"name": "Send new message", "command": self.send_message},
             {"name": "Search conversation", "command": self.search_conversation},
+            {"name": "Search messages", "command": self.search_messages},
         ]
         
         # Optimization: Cache summaries to avoid redundant reads between menus
@@ -40,16 +41,27 @@ class BaseHandler:
 
         self._interact_with_chat(partner)
 
+    def search_messages(self):
+        """Full-text search over the user's messages; open the chat of a result."""
+        text = get_input("Enter words to search for: ")
+        results = self.context.message_manager.search(self.user.username, text)
+        if not results:
+            console_manager.print_info("No matching messages.")
+            return
+
+        conversation_display.display_search_results(results, self.user.username)
+        choice = get_input("Enter a result number to open its chat, or press Enter to go back: ")
+        if choice.isdigit() and 1 <= int(choice) <= len(results):
+            match = results[int(choice) - 1]
+            partner = match['to_user'] if match['from_user'] == self.user.username else match['from_user']
+            self._interact_with_chat(partner)
+
     def _interact_with_chat(self, partner):
         """Helper to display and interact with a chat thread."""
         try:
-            messages = self.context.message_manager.read_all()
-            
-            chat = []
-            for m in messages:
-                if (m['from_user'] == self.user.username and m['to_user'] == partner) or \
-                   (m['from_user'] == partner and m['to_user'] == self.user.username):
-                    chat.append(m)
+            message_manager = self.context.message_manager
+            page_size = message_manager.THREAD_PAGE_SIZE
+            chat = message_manager.get_thread(self.user.username, partner, limit=page_size)
 
             if not chat:
                 console_manager.print_info(f"No message history with {partner}.")
@@ -58,26 +70,34 @@ class BaseHandler:
                 return
 
             # Mark unread messages as read
-            unread_ids = [m['message_id'] for m in chat 
-                         if m['to_user'] == self.user.username and not m.get('mark_as_read', False)]
-            
-            if unread_ids:
-                self.context.message_manager.mark_as_read_batch(unread_ids)
+            if any(m['to_user'] == self.user.username and not m.get('mark_as_read', False) for m in chat):
+                message_manager.mark_thread_as_read(self.user.username, partner)
+
+            # A full page means there may be older messages to load on demand.
+            has_older = len(chat) == page_size
 
             while True:
-                conversation_display.display_chat_thread(partner, chat, self.user.username)
+                conversation_display.display_chat_thread(partner, chat, self.user.username, has_older=has_older)
                 
                 action = get_input("")
                 
+                if action.lower() == 'o' and has_older:
+                    oldest = chat[0]
+                    older = message_manager.get_thread(
+                        self.user.username, partner,
+                        before=(oldest['sent_at'], oldest['message_id']), limit=page_size,
+                    )
+                    has_older = len(older) == page_size
+                    chat = older + chat
+                    continue
+
                 if action.lower() == 'r':
                     self.send_message(recipient_username=partner)
-                    all_messages = self.context.message_manager.read_all()
-                    
-                    chat = []
-                    for m in all_messages:
-                        if (m['from_user'] == self.user.username and m['to_user'] == partner) or \
-                           (m['from_user'] == partner and m['to_user'] == self.user.username):
-                            chat.append(m)
+                    # Only the newest page can have changed; keep the older history already loaded.
+                    latest = message_manager.get_thread(self.user.username, partner, limit=page_size)
+                    if latest:
+                        newest_kept = (latest[0]['sent_at'], latest[0]['message_id'])
+                        chat = [m for m in chat if (m['sent_at'], m['message_id']) < newest_kept] + latest
                     continue
                 
                 break
@@ -293,6 +313,23 @@ class BaseHandler:
                   console_manager.print_panel(content, style="blue")
         
         console_manager.print_message("═"*40)
+        if not announcements:
+            wait_for_enter()
+        elif get_input("Enter 's' to search announcements, or press Enter to continue: ").lower() == 's':
+            self.search_announcements()
+
+    def search_announcements(self):
+        """Full-text search over announcements, best match first."""
+        text = get_input("Enter words to search for: ")
+        results = self.context.announcement_manager.search(text)
+
+        console_manager.print_header("ANNOUNCEMENT SEARCH RESULTS")
+        if not results:
+            console_manager.print_info("No matching announcements.")
+        for a in results:
+            content = f"[bold]{a['author']}[/bold] ({a['created_at']}):\n{console_manager.format_snippet(a['snippet'])}"
+            console_manager.print_panel(content, style="blue")
+        console_manager.print_message("═"*40)
         wait_for_enter()
 
 
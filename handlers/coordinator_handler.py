@@ -54,7 +54,7 @@ class CoordinatorHandler(BaseHandler):
         return notifications
 
     def get_camps_with_food_shortages(self):
-        camps = self.context.camp_manager.read_all()
+        camps = self.context.camp_manager.list_summaries()
 
         shortage_messages = [
             f"{camp.name} has a food shortage"
@@ -188,7 +188,7 @@ class CoordinatorHandler(BaseHandler):
 
     @cancellable
     def top_up_food_stock(self):
-        camps = self.context.camp_manager.read_all()
+        camps = self.context.camp_manager.list_summaries()
         camps.sort(key=lambda c: c.start_date)
         if not camps:
             print("No camps available.")
@@ -229,7 +229,7 @@ class CoordinatorHandler(BaseHandler):
     @cancellable
     def edit_camp_location(self):
         """Allow coordinator to edit a camp's location."""
-        camps = self.context.camp_manager.read_all()
+        camps = self.context.camp_manager.list_summaries()
         camps.sort(key=lambda c: c.start_date)
         if not camps:
             console_manager.print_error("No camps available.")
@@ -279,7 +279,7 @@ class CoordinatorHandler(BaseHandler):
         """
         from cli.prompts import get_valid_date_range
 
-        camps = self.context.camp_manager.read_all()
+        camps = self.context.camp_manager.list_summaries()
         camps.sort(key=lambda c: c.start_date)
 
         if not camps:
@@ -417,7 +417,7 @@ class CoordinatorHandler(BaseHandler):
 
     @cancellable
     def view_weather_forecast(self):
-        camps = self.context.camp_manager.read_all()
+        camps = self.context.camp_manager.list_summaries()
 
         if not camps:
             console_manager.print_error("No camps available.")
@@ -465,7 +465,7 @@ class CoordinatorHandler(BaseHandler):
 
     @cancellable
     def manage_equipment(self):
-        camps = self.context.camp_manager.read_all()
+        camps = self.context.camp_manager.list_summaries()
 
         if not camps:
             console_manager.print_error("No camps available.")
@@ -475,7 +475,7 @@ class CoordinatorHandler(BaseHandler):
 
         try:
             choice = int(get_input("Enter number: ")) - 1
-            camp = camps[choice]
+            camp = self.context.camp_manager.get_camp_by_id(camps[choice].camp_id, lazy=True)
         except (ValueError, IndexError):
             console_manager.print_error("Invalid selection")
             return
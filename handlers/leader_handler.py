@@ -1,4 +1,5 @@
 from datetime import datetime
+import os
 import uuid
 import json
 
@@ -25,6 +26,8 @@ import pandas as pd
 
 class LeaderHandler(BaseHandler):
 
+    REPORTS_PAGE_SIZE = 10
+
     def __init__(self, user, context):
         super().__init__(user, context)
 
@@ -37,6 +40,7 @@ class LeaderHandler(BaseHandler):
             {"name": "Select Camps to Supervise", "command": self.select_camps},
             {"name": "Edit Camp Food Settings", "command": self.edit_camp},
             {"name": "Assign Campers from CSV", "command": self.assign_campers_ui},
+            {"name": "Bulk Import Camper CSVs", "command": self.bulk_import_campers_ui},
             {"name": "View Campers", "command": self.view_campers},
             {"name": "Search Campers for Emergency Details", "command": self.search_camper},
             {"name": "Manage Activities", "command": self.activities_menu},
@@ -52,7 +56,7 @@ class LeaderHandler(BaseHandler):
 
     @cancellable
     def select_camps(self):
-        camps = self.context.camp_manager.read_all()
+        camps = self.context.camp_manager.list_summaries()
         
         self.display.display_camp_selection(camps, self.user.username)
 
@@ -89,8 +93,7 @@ class LeaderHandler(BaseHandler):
 
     @cancellable
     def edit_camp(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You don't supervise any camps.")
@@ -100,6 +103,8 @@ class LeaderHandler(BaseHandler):
         if not camp:
             return
 
+        camp = self.context.camp_manager.get_camp_by_id(camp.camp_id, lazy=True)
+
         new_food = get_positive_int("Enter food per camper per day: ")
         camp.food_per_camper_per_day = new_food
         self.context.camp_manager.update(camp)
@@ -117,8 +122,7 @@ class LeaderHandler(BaseHandler):
 
     @cancellable
     def assign_campers_ui(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You don't supervise any camps.")
@@ -137,7 +141,13 @@ class LeaderHandler(BaseHandler):
 
         try:
             # Data: Perform import (validation is handled inside)
-            results = self.context.camper_manager.import_campers_from_csv(camp, csv_file, self.context)
+            with console_manager.console.status(f"Importing {csv_file}...") as status:
+                def progress(rows_read, imported):
+                    status.update(f"Importing {csv_file}: {rows_read} rows read, {imported} campers added...")
+
+                results = self.context.camper_manager.import_campers_from_csv(
+                    camp, csv_file, self.context, progress=progress
+                )
             
             # UI: Show results
             self.display.display_import_results(results, camp.name)
@@ -147,10 +157,46 @@ class LeaderHandler(BaseHandler):
             wait_for_enter()
 
 
+    @cancellable
+    def bulk_import_campers_ui(self):
+        """Import every roster CSV in a directory, one file per supervised camp."""
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
+
+        if not my_camps:
+            self.display.display_error("You don't supervise any camps.")
+            return
+
+        camper_manager = self.context.camper_manager
+        directory = get_input(f"Directory of roster CSVs (Enter for {camper_manager.DEF_PATH}): ").strip()
+        directory = directory or camper_manager.DEF_PATH
+        csv_files = camper_manager.get_available_csv_files(directory)
+        if not csv_files:
+            self.display.display_error(f"No CSV files found in {directory}.")
+            wait_for_enter()
+            return
+
+        matched, unmatched = camper_manager.match_roster_files(csv_files, my_camps)
+        for filename in unmatched:
+            console_manager.print_warning(f"'{filename}' does not match any of your camps by name.")
+            self.display.display_camp_selection_simple(my_camps)
+            choice = get_input("Choose camp number for this file (Enter to skip): ").strip()
+            if choice.isdigit() and 0 < int(choice) <= len(my_camps):
+                matched.append((my_camps[int(choice) - 1], filename))
+
+        if not matched:
+            console_manager.print_info("No files to import.")
+            wait_for_enter()
+            return
+
+        assignments = [(camp, os.path.join(directory, filename)) for camp, filename in matched]
+        with console_manager.console.status(f"Importing {len(assignments)} roster files..."):
+            report = camper_manager.import_campers_bulk(assignments, self.context)
+
+        self.display.display_bulk_import_results(report)
+
     @cancellable
     def view_campers(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You supervise no camps.")
@@ -160,27 +206,24 @@ class LeaderHandler(BaseHandler):
         if not camp:
             return
 
+        camp = self.context.camp_manager.get_camp_by_id(camp.camp_id, lazy=True)
+
         self.display.display_campers(camp)
         wait_for_enter()
 
     @cancellable
     def search_camper(self):
         """Search for a camper in supervised camps (Global Search & Emergency Info)."""
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
         
         if not my_camps:
             self.display.display_error("You don't supervise any camps.")
             return
 
         while True:
-            query = get_input("Enter camper name (or part of name) to search: ").lower()
+            query = get_input("Enter camper name or contact (or part of it) to search: ")
             
-            found = []
-            for camp in my_camps:
-                for camper in camp.campers:
-                    if query in camper.name.lower():
-                        found.append((camp.name, camper))
+            found = self.context.camper_manager.search(query, leader_username=self.user.username)
             
             if not found:
                 console_manager.print_error(f"No campers found matching '{query}'. Please try again.")
@@ -221,6 +264,8 @@ class LeaderHandler(BaseHandler):
                 self.view_daily_reports()
             elif choice == "3":
                 self.delete_daily_report()
+            elif choice == "4":
+                self.search_daily_reports()
             elif choice == "b":
                 break
             else:
@@ -230,8 +275,7 @@ class LeaderHandler(BaseHandler):
     @cancellable
     def create_daily_report(self):
 
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You supervise no camps.")
@@ -241,6 +285,8 @@ class LeaderHandler(BaseHandler):
         if not camp:
             return
 
+        camp = self.context.camp_manager.get_camp_by_id(camp.camp_id, lazy=True)
+
         # Validation: Cannot create report for future camps
         today = datetime.now().date()
         try:
@@ -292,8 +338,7 @@ class LeaderHandler(BaseHandler):
 
     @cancellable
     def view_daily_reports(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You supervise no camps.")
@@ -303,20 +348,68 @@ class LeaderHandler(BaseHandler):
         if not camp:
             return
 
-        reports = self.report_service.get_reports_for_camp(camp.camp_id)
+        page = 0
+        while True:
+            # Fetch one extra row to know whether a next page exists.
+            reports = self.report_service.get_reports_for_camp(
+                camp.camp_id, limit=self.REPORTS_PAGE_SIZE + 1, offset=page * self.REPORTS_PAGE_SIZE
+            )
+            has_next = len(reports) > self.REPORTS_PAGE_SIZE
+            reports = reports[:self.REPORTS_PAGE_SIZE]
+
+            if not reports and page == 0:
+                console_manager.print_info("No reports available.")
+                return
+
+            self.display.display_daily_reports_list(reports)
+            options = ["'d' for a date range"]
+            if has_next:
+                options.append("'n' for older reports")
+            if page > 0:
+                options.append("'p' for newer reports")
+            choice = get_input(f"Enter {', '.join(options)}, or press Enter to go back: ").lower()
+
+            if choice == 'n' and has_next:
+                page += 1
+            elif choice == 'p' and page > 0:
+                page -= 1
+            elif choice == 'd':
+                self._view_reports_in_range(camp)
+            else:
+                return
+
+    def _view_reports_in_range(self, camp):
+        try:
+            start = datetime.strptime(get_input("From date (yyyy-mm-dd): "), "%Y-%m-%d").date()
+            end = datetime.strptime(get_input("To date (yyyy-mm-dd): "), "%Y-%m-%d").date()
+        except ValueError:
+            console_manager.print_error("Invalid date format. Please use yyyy-mm-dd.")
+            return
+
+        reports = self.report_service.get_reports_between(camp.camp_id, start.isoformat(), end.isoformat())
+        if not reports:
+            console_manager.print_info(f"No reports between {start} and {end}.")
+        else:
+            self.display.display_daily_reports_list(reports)
+        wait_for_enter()
+
+
+    @cancellable
+    def search_daily_reports(self):
+        text = get_input("Enter words to search your camps' reports for: ")
+        reports = self.report_service.search_reports(self.user.username, text)
 
         if not reports:
-            console_manager.print_info("No reports available.")
+            console_manager.print_info("No matching reports.")
             return
 
-        self.display.display_daily_reports_list(reports)
+        self.display.display_report_search_results(reports)
         wait_for_enter()
 
 
     @cancellable
     def delete_daily_report(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You supervise no camps.")
@@ -326,6 +419,8 @@ class LeaderHandler(BaseHandler):
         if not camp:
             return
 
+        camp = self.context.camp_manager.get_camp_by_id(camp.camp_id, lazy=True)
+
         reports = self.report_service.get_reports_for_camp(camp.camp_id)
 
         if not reports:
@@ -353,8 +448,7 @@ class LeaderHandler(BaseHandler):
 
     @cancellable
     def show_statistics(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(leader_username=self.user.username)
 
         if not my_camps:
             console_manager.print_warning("You are not supervising any camps.")
@@ -411,8 +505,7 @@ class LeaderHandler(BaseHandler):
         
     @cancellable
     def view_equipment(self):
-        camps = self.context.camp_manager.read_all()
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.get_camps_by_leader(self.user.username, lazy=True)
 
         if not my_camps:
             console_manager.print_error("You are not supervising any camps.")
@@ -448,9 +541,7 @@ class LeaderHandler(BaseHandler):
     
     @cancellable
     def view_weather_forecast(self):
-        camps = self.context.camp_manager.read_all()
-
-        my_camps = [c for c in camps if c.camp_leader == self.user.username]
+        my_camps = self.context.camp_manager.list_summaries(self.user.username)
 
         if not my_camps:
             self.display.display_error("You don't supervise any camps")
@@ -460,6 +551,8 @@ class LeaderHandler(BaseHandler):
         if not camp:
             return
         
+        camp = self.context.camp_manager.get_camp_by_id(camp.camp_id, lazy=True)
+        
         console = Console()
         with console.status("[bold green]Fetching live weather data, please hold on...[/]"):
             ws = WeatherService()
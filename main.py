@@ -4,16 +4,6 @@ try:
     from cli.session import Session
     from cli.main_loop import run_program
 
-    from persistence.dao.user_manager import UserManager
-    from persistence.dao.camp_manager import CampManager
-    from persistence.dao.activity_manager import ActivityManager
-    from persistence.dao.daily_report_manager import DailyReportManager
-    from persistence.dao.message_manager import MessageManager
-    from persistence.dao.announcement_manager import AnnouncementManager
-    from persistence.dao.system_notification_manager import SystemNotificationManager
-    from persistence.dao.audit_log_manager import AuditLogManager
-    from persistence.dao.camper_manager import CamperManager
-
     from handlers.admin_handler import AdminHandler
     from handlers.coordinator_handler import CoordinatorHandler
     from handlers.leader_handler import LeaderHandler
@@ -43,42 +33,25 @@ def create_handler(user, context):
     handler_class = HANDLERS.get(user.role, BaseHandler)
     return handler_class(user, context)
 
+def bootstrap(db_context=None):
+    """Open the database once and build every manager on it."""
+    return AppContext.create(db_context)
+
 def main():
-    # Create managers ONCE (dependency injection)
-    user_manager = UserManager()
-    camp_manager = CampManager()
-    activity_manager = ActivityManager()
-    daily_report_manager = DailyReportManager()
-    message_manager = MessageManager()
-    announcement_manager = AnnouncementManager()
-    system_notification_manager = SystemNotificationManager()
-    audit_log_manager = AuditLogManager()
-    camper_manager = CamperManager()
+    # Create managers ONCE (dependency injection), all sharing one DBContext
+    context = bootstrap()
 
     # Startup Banner
     from cli.startup_display import startup_display
     startup_display.display_welcome_banner()
 
     # Login
-    session = Session()
+    session = Session(context.user_manager)
     user = session.login()
     
     if user is None:
         return
 
-    # Create Context
-    context = AppContext(
-        user_manager,
-        camp_manager,
-        activity_manager,
-        daily_report_manager,
-        message_manager,
-        announcement_manager,
-        system_notification_manager,
-        audit_log_manager,
-        camper_manager,
-    )
-
     # Create handler for this user's role
     handler = create_handler(user, context)
 
@@ -1,11 +1,16 @@
 from enum import Enum
+from models.change_tracking import ChangeTracker
+
 class Session(Enum):
     Morning = 0
     Afternoon = 1
     Evening = 2
 
-class Activity:
-    def __init__(self, name, date, session: Session, is_indoor: bool):
+class Activity(ChangeTracker):
+    TRACKED_FIELDS = ("name", "date", "session", "is_indoor", "campers")
+
+    def __init__(self, name, date, session: Session, is_indoor: bool, activity_id=None):
+        self.activity_id = activity_id
         self.name = name
         self.date = date
         self.session = session
@@ -14,6 +19,7 @@ class Activity:
 
     def to_dict(self):
         return {
+            "activity_id": self.activity_id,
             "name": self.name,
             "date": str(self.date),
             "session": self.session.name,  
@@ -32,7 +38,8 @@ class Activity:
             name=data["name"], 
             date=data["date"], 
             session=session,
-            is_indoor = data.get("is_indoor", False)
+            is_indoor = data.get("is_indoor", False),
+            activity_id=data.get("activity_id"),
         )
         activity.campers = data.get("camper_ids", [])
         return activity
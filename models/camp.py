@@ -3,8 +3,27 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict
 from models.camper import Camper
 from models.resource import Equipment
+from models.change_tracking import ChangeTracker
+
+class Camp(ChangeTracker):
+    TRACKED_FIELDS = (
+        "name",
+        "location",
+        "camp_type",
+        "start_date",
+        "end_date",
+        "camp_leader",
+        "food_per_camper_per_day",
+        "initial_food_stock",
+        "current_food_stock",
+    )
+    # Child collections and the attribute identifying each persisted member.
+    COLLECTION_KEYS = {
+        "campers": "camper_id",
+        "activities": "activity_id",
+        "equipment": "resource_id",
+    }
 
-class Camp:
     def __init__(
         self,
         camp_id: Optional[str],
@@ -14,12 +33,12 @@ class Camp:
         start_date: date,
         end_date: date,
         camp_leader: Optional[str] = None,
-        campers: List = [],
+        campers: Optional[List] = None,
         food_per_camper_per_day: int = 1,
         initial_food_stock: int = 0,
         current_food_stock: int=0,
         food_usage: Optional[Dict] = None,
-        equipment: List = [],
+        equipment: Optional[List] = None,
         activities: Optional[List] = None
     ):
         self.camp_id = camp_id if camp_id else str(uuid.uuid4())
@@ -29,14 +48,41 @@ class Camp:
         self.start_date = start_date
         self.end_date = end_date
         self.camp_leader = camp_leader
-        self.campers = campers
+        self.campers = campers if campers is not None else []
         self.food_per_camper_per_day = food_per_camper_per_day
         self.initial_food_stock = initial_food_stock
         self.current_food_stock = initial_food_stock
         self.food_usage = {}
-        self.equipment = equipment
+        self.equipment = equipment if equipment is not None else []
         self.activities = activities if activities is not None else []
 
+    def loaded_collections(self):
+        """Names of child collections currently held in memory."""
+        return tuple(self.COLLECTION_KEYS)
+
+    def mark_clean(self):
+        """Record scalar fields, collection membership and children as persisted."""
+        super().mark_clean()
+        self._clean_members = {}
+        for collection in self.loaded_collections():
+            self.mark_collection_clean(collection)
+
+    def mark_collection_clean(self, collection):
+        key = self.COLLECTION_KEYS[collection]
+        members = getattr(self, collection)
+        if getattr(self, "_clean_members", None) is None:
+            self._clean_members = {}
+        self._clean_members[collection] = {
+            getattr(m, key, None) for m in members if getattr(m, key, None) is not None
+        }
+        for member in members:
+            if isinstance(member, ChangeTracker):
+                member.mark_clean()
+
+    def clean_member_ids(self, collection):
+        """Member ids of a collection as last persisted, or None if unknown."""
+        return (getattr(self, "_clean_members", None) or {}).get(collection)
+
     def add_food(self, amount: int):
         if amount < 0:
             raise ValueError("amount must be positive")
@@ -113,11 +159,15 @@ class Camp:
         days = (self.end_date - self.start_date).days + 1
         return total_campers * self.food_per_camper_per_day * days
 
+    @property
+    def camper_count(self):
+        return len(self.campers)
+
     def is_food_shortage(self):
         if self.has_camp_finished():
             return False
 
-        total_campers = len(self.campers)
+        total_campers = self.camper_count
         total_stock = self.current_food_stock
 
         if not self.has_camp_started():
@@ -201,3 +251,49 @@ class Camp:
             return "Full"
             
         return "Partial"
+
+
+def _lazy_collection(name):
+    def getter(self):
+        if name not in self._collections:
+            self._loader(name)
+            # A loader that could not supply this camp leaves it empty (and untracked).
+            self._collections.setdefault(name, [])
+        return self._collections[name]
+
+    def setter(self, value):
+        self._collections[name] = value
+
+    return property(getter, setter)
+
+
+class LazyCamp(Camp):
+    """
+    Camp whose campers, activities and equipment are fetched on first access.
+
+    loader(collection) is called the first time a collection is read and is
+    expected to supply it through set_loaded_collection(), typically for every
+    camp of the same result set at once. Assigning a collection directly
+    replaces it without loading.
+    """
+    campers = _lazy_collection("campers")
+    activities = _lazy_collection("activities")
+    equipment = _lazy_collection("equipment")
+
+    def __init__(self, *args, loader=None, **kwargs):
+        self._collections = {}
+        super().__init__(*args, **kwargs)
+        # Camp.__init__ assigned empty defaults; they are not loaded data.
+        self._collections = {}
+        self._loader = loader or (lambda collection: None)
+
+    def loaded_collections(self):
+        return tuple(c for c in self.COLLECTION_KEYS if c in self._collections)
+
+    def set_loaded_collection(self, collection, members):
+        """Install persisted members for a collection that has not been loaded or replaced yet."""
+        if collection in self._collections:
+            return
+        self._collections[collection] = members
+        self.mark_collection_clean(collection)
+
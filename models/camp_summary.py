@@ -0,0 +1,75 @@
+from datetime import datetime
+from models.camp import Camp
+
+
+class CampSummary:
+    """
+    Read-only projection of a camp for menus and pickers.
+
+    Carries the camps row plus a few counts, so listing camps never loads
+    campers, activities or equipment. Fetch the full Camp with
+    CampManager.get_camp_by_id(summary.camp_id) once one is selected.
+    """
+
+    def __init__(
+        self,
+        camp_id,
+        name,
+        location,
+        camp_type,
+        start_date,
+        end_date,
+        camp_leader=None,
+        food_per_camper_per_day=1,
+        current_food_stock=0,
+        camper_count=0,
+        activity_count=0,
+        scheduled_days=0,
+    ):
+        self.camp_id = camp_id
+        self.name = name
+        self.location = location
+        self.camp_type = camp_type
+        self.start_date = start_date
+        self.end_date = end_date
+        self.camp_leader = camp_leader
+        self.food_per_camper_per_day = food_per_camper_per_day
+        self.current_food_stock = current_food_stock
+        self.camper_count = camper_count
+        self.activity_count = activity_count
+        # Distinct camp days that have at least one scheduled activity.
+        self.scheduled_days = scheduled_days
+
+    # Date rules only need the scalar fields and camper_count, so share Camp's implementation.
+    has_camp_started = Camp.has_camp_started
+    has_camp_finished = Camp.has_camp_finished
+    can_edit_dates = Camp.can_edit_dates
+    get_date_range = Camp.get_date_range
+    is_food_shortage = Camp.is_food_shortage
+
+    def get_schedule_status(self) -> str:
+        """Same result as Camp.get_schedule_status, from the counts."""
+        if not self.activity_count:
+            return "Empty"
+        if self.scheduled_days >= (self.end_date - self.start_date).days + 1:
+            return "Full"
+        return "Partial"
+
+    @classmethod
+    def from_row(cls, row):
+        start_date = datetime.strptime(row[4], "%Y-%m-%d").date() if row[4] else None
+        end_date = datetime.strptime(row[5], "%Y-%m-%d").date() if row[5] else None
+        return cls(
+            camp_id=row[0],
+            name=row[1],
+            location=row[2],
+            camp_type=row[3],
+            start_date=start_date,
+            end_date=end_date,
+            camp_leader=row[6],
+            food_per_camper_per_day=row[7],
+            current_food_stock=row[8],
+            camper_count=row[9],
+            activity_count=row[10],
+            scheduled_days=row[11],
+        )
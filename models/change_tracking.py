@@ -0,0 +1,40 @@
+class ChangeTracker:
+    """
+    Mixin that remembers the last persisted state of an entity so the
+    persistence layer can write only what actually changed.
+
+    Subclasses list the attributes to watch in TRACKED_FIELDS. The DAO calls
+    mark_clean() after loading or saving; until then the entity counts as
+    new and every tracked field is reported as changed.
+    """
+    TRACKED_FIELDS = ()
+
+    def mark_clean(self):
+        """Record the current values as the persisted baseline."""
+        self._clean_state = self._tracked_state()
+
+    def is_tracked(self) -> bool:
+        return getattr(self, "_clean_state", None) is not None
+
+    def changed_fields(self) -> set:
+        """Names of tracked fields that differ from the persisted baseline."""
+        if not self.is_tracked():
+            return set(self.TRACKED_FIELDS)
+        current = self._tracked_state()
+        return {f for f in self.TRACKED_FIELDS if current[f] != self._clean_state[f]}
+
+    def clean_value(self, field):
+        """Value of field as of the last mark_clean() (None if never persisted)."""
+        if not self.is_tracked():
+            return None
+        return self._clean_state[field]
+
+    def _tracked_state(self):
+        return {f: self._freeze(getattr(self, f, None)) for f in self.TRACKED_FIELDS}
+
+    @staticmethod
+    def _freeze(value):
+        # Collections are compared by content so in-place mutation is detected.
+        if isinstance(value, (list, set, tuple)):
+            return frozenset(value)
+        return value
@@ -1,3 +1,5 @@
+from models.change_tracking import ChangeTracker
+
 class Resource:
     def __init__(self, resource_id, name, camp_id):
             self.resource_id = resource_id
@@ -13,7 +15,9 @@ class Resource:
 
          }
 
-class Equipment(Resource):
+class Equipment(Resource, ChangeTracker):
+    TRACKED_FIELDS = ("name", "target_quantity", "current_quantity", "condition")
+
     def __init__(self, resource_id, name, camp_id, target_quantity: int, current_quantity: int, condition: str = "Good"):
         super().__init__(resource_id, name, camp_id)
         self.condition = condition
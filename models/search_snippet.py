@@ -0,0 +1,8 @@
+"""
+Markers around the matched terms in search snippets.
+
+Search results carry snippets with matches wrapped in MATCH_START and
+MATCH_END; the DAOs produce them and displays turn them into markup.
+"""
+MATCH_START = "\x02"
+MATCH_END = "\x03"
@@ -8,10 +8,10 @@ class Admin(User):
     Admin model class. Inherits from User.
     Represents an administrator with full system access.
     """
-    def __init__(self, username, password, role="Admin", enabled=True):
+    def __init__(self, username, password, role="Admin", enabled=True, user_manager=None):
         super().__init__(username, password, role, enabled)
        
-        self.user_manager = UserManager()
+        self.user_manager = user_manager or UserManager()
 
     def create_user(self, username, password, role, **kwargs):
         """
@@ -7,10 +7,11 @@ def register(role):
     return decorator
 
 
-def user_from_dict(user_dict):
+def user_from_dict(user_dict, **dependencies):
     """
     Convert a dictionary from JSON into the correct User subclass.
-    The user class is expected to construct its own UserManager / CampManager.
+    Shared managers (e.g. user_manager=...) are passed through to classes
+    whose __init__ accepts them; other classes simply ignore them.
     """
     role = user_dict.get("role")
     cls = CLASS_MAP.get(role)
@@ -23,5 +24,6 @@ def user_from_dict(user_dict):
     sig = inspect.signature(cls.__init__)
     allowed_keys = set(sig.parameters.keys()) - {"self", "args", "kwargs"}
     filtered_dict = {k: v for k, v in user_dict.items() if k in allowed_keys}
+    filtered_dict.update({k: v for k, v in dependencies.items() if k in allowed_keys})
 
     return cls(**filtered_dict)
\ No newline at end of file
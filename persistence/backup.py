@@ -0,0 +1,554 @@
+"""
+Online backups, streaming JSON exports and restores of the SQLite database.
+
+create_backup() copies the live database with the sqlite3 backup API a
+few pages at a time, so other connections keep writing between steps and
+the copy is still a consistent snapshot. create_incremental_backup() saves
+only the change_log rows written since the last backup, chained to the
+full backup they build on; writes are captured once a full backup exists. export_json() writes the base tables as JSON
+without loading them into memory. restore_backup() loads a snapshot
+(optionally replaying its incremental backups up to a point in time) or an
+export into a staging database, validates it there and only then copies it
+over the live one.
+"""
+import gzip
+import json
+import logging
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+
+from persistence.bulk_load import (
+    change_capture_suspended, derived_triggers_dropped, indexes_dropped, rebuild_derived_tables,
+)
+from persistence.db_context import DBContext
+from persistence.json_stream import iter_json_array
+from persistence.migrations import LATEST_VERSION, get_schema_version
+
+BACKUP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "data", "backups"))
+BACKUP_PAGES = 256
+EXPORT_FORMAT = "camptrack-export"
+EXPORT_CHUNK_ROWS = 1000
+BACKUP_SUFFIXES = (".db", ".db.gz", ".json", ".json.gz")
+CHANGES_FORMAT = "camptrack-changes"
+CHANGES_PREFIX = "changes_"
+
+# Base tables, parents before children. Search indexes, conversations and
+# camp_stats are derived from these and rebuilt on restore.
+EXPORT_TABLES = (
+    "users",
+    "activity_library",
+    "camps",
+    "campers",
+    "camp_campers",
+    "equipment",
+    "scheduled_activities",
+    "activity_attendance",
+    "messages",
+    "announcements",
+    "system_notifications",
+    "audit_logs",
+    "daily_reports",
+)
+
+
+def _timestamp():
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def _open_output(path, compress):
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def _open_input(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _remove_database(path):
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def _publish(partial_path, path):
+    """Move a finished file into place so a half-written backup is never listed."""
+    os.replace(partial_path, path)
+    return path
+
+
+def _change_high_water(conn):
+    """seq of the newest change ever logged, including rows already pruned."""
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'").fetchone()
+    return row[0] if row else 0
+
+
+def _record_checkpoint(db, seq, base, filename):
+    """Mark the change log as backed up to seq and prune the rows that are now covered."""
+    conn = db.get_connection()
+    try:
+        conn.execute(
+            "INSERT INTO backup_checkpoints (seq, base, file, created_at) VALUES (?, ?, ?, ?)",
+            (seq, base, filename, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
+        conn.execute("DELETE FROM change_log WHERE seq <= ?", (seq,))
+        conn.commit()
+    except Exception as exc:
+        logging.error(f"Error recording backup checkpoint: {exc}")
+        raise
+    finally:
+        conn.close()
+
+
+def _start_change_capture(db, filename):
+    """
+    Insert a checkpoint for filename when there is none yet, so change
+    capture is on before the first snapshot is copied and writes made
+    meanwhile are logged. Returns whether one was inserted.
+    """
+    conn = db.get_connection()
+    try:
+        if conn.execute("SELECT 1 FROM backup_checkpoints LIMIT 1").fetchone():
+            return False
+        conn.execute(
+            "INSERT INTO backup_checkpoints (seq, base, file, created_at) VALUES (?, ?, ?, ?)",
+            (_change_high_water(conn), filename, filename, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
+        conn.commit()
+        return True
+    finally:
+        conn.close()
+
+
+def _stop_change_capture(db, filename):
+    """Undo _start_change_capture() after the backup for filename failed."""
+    conn = db.get_connection()
+    try:
+        conn.execute("DELETE FROM backup_checkpoints WHERE file = ?", (filename,))
+        conn.execute("DELETE FROM change_log WHERE NOT EXISTS (SELECT 1 FROM backup_checkpoints)")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def create_backup(db, directory=BACKUP_DIR, compress=True, progress=None, pages=BACKUP_PAGES):
+    """
+    Snapshot the database into directory as backup_<timestamp>.db (.db.gz
+    when compress is True) and return the file path. The snapshot becomes
+    the base that later incremental backups build on.
+
+    progress(pages_copied, total_pages) is called after every step.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"backup_{_timestamp()}.db")
+    snapshot_path = path + ".partial"
+
+    def report(status, remaining, total):
+        if progress:
+            progress(total - remaining, total)
+
+    filename = os.path.basename(path) + (".gz" if compress else "")
+    capture_started = _start_change_capture(db, filename)
+    try:
+        # A connection of our own, so a transaction open on the shared one is not copied half-done.
+        source = db.get_connection()
+        try:
+            target = sqlite3.connect(snapshot_path)
+            try:
+                source.backup(target, pages=pages, progress=report)
+                seq = _change_high_water(target)
+            finally:
+                target.close()
+        finally:
+            source.close()
+
+        if compress:
+            path += ".gz"
+            with open(snapshot_path, "rb") as src, gzip.open(path + ".partial", "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.remove(snapshot_path)
+            _publish(path + ".partial", path)
+        else:
+            _publish(snapshot_path, path)
+    except Exception as exc:
+        logging.error(f"Error creating backup: {exc}")
+        for leftover in (snapshot_path, path + ".partial"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        if capture_started:
+            _stop_change_capture(db, filename)
+        raise
+
+    _record_checkpoint(db, seq, filename, filename)
+    return path
+
+
+def create_incremental_backup(db, directory=BACKUP_DIR, progress=None):
+    """
+    Write the changes logged since the last full or incremental backup to
+    directory as changes_<timestamp>_<seq>.json.gz and return the file path, or
+    None when nothing has changed. Raises ValueError when there is no full
+    backup to build on (none yet, or the data was restored or reseeded
+    since).
+
+    The file is one JSON array: a header naming the base snapshot and the
+    change_log range it covers, then chunks of change rows in seq order:
+        [{"format": ..., "base": ..., "after_seq": ..., "last_seq": ..., ...},
+         {"rows": [[seq, changed_at, table, op, row_key, row_data], ...]}, ...]
+    progress(rows_written, total_rows) is called after every chunk.
+    """
+    os.makedirs(directory, exist_ok=True)
+    partial_path = None
+
+    try:
+        conn = db.get_connection()
+        try:
+            conn.execute("BEGIN")
+            checkpoint = conn.execute(
+                "SELECT seq, base FROM backup_checkpoints ORDER BY seq DESC, rowid DESC LIMIT 1"
+            ).fetchone()
+            if checkpoint is None:
+                raise ValueError("No full backup to build on; create a full backup first")
+            after_seq, base = checkpoint
+            last_seq, total, first_at, last_at = conn.execute(
+                "SELECT MAX(seq), COUNT(*), MIN(changed_at), MAX(changed_at) FROM change_log WHERE seq > ?",
+                (after_seq,),
+            ).fetchone()
+            if last_seq is None:
+                return None
+
+            # The seq keeps names unique even for backups taken within the same second.
+            path = os.path.join(directory, f"{CHANGES_PREFIX}{_timestamp()}_{last_seq}.json.gz")
+            partial_path = path + ".partial"
+            with _open_output(partial_path, True) as out:
+                header = {
+                    "format": CHANGES_FORMAT,
+                    "base": base,
+                    "after_seq": after_seq,
+                    "last_seq": last_seq,
+                    "first_change_at": first_at,
+                    "last_change_at": last_at,
+                    "created_at": datetime.now().isoformat(),
+                }
+                out.write("[\n" + json.dumps(header))
+                cursor = conn.execute(
+                    """
+                    SELECT seq, changed_at, table_name, op, row_key, row_data FROM change_log
+                    WHERE seq > ? AND seq <= ? ORDER BY seq
+                    """,
+                    (after_seq, last_seq),
+                )
+                written = 0
+                while rows := cursor.fetchmany(EXPORT_CHUNK_ROWS):
+                    out.write(",\n" + json.dumps({"rows": rows}, ensure_ascii=False))
+                    written += len(rows)
+                    if progress:
+                        progress(written, total)
+                out.write("\n]\n")
+        finally:
+            conn.close()
+        _publish(partial_path, path)
+    except Exception as exc:
+        logging.error(f"Error creating incremental backup: {exc}")
+        if partial_path and os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    _record_checkpoint(db, last_seq, base, os.path.basename(path))
+    return path
+
+
+def export_json(db, directory=BACKUP_DIR, compress=False, progress=None, tables=EXPORT_TABLES):
+    """
+    Write tables to directory as export_<timestamp>.json (.json.gz when
+    compress is True) and return the file path.
+
+    The file is one JSON array: a header object, then chunks of up to
+    EXPORT_CHUNK_ROWS rows per table:
+        [{"format": ..., "schema_version": ..., "created_at": ..., "tables": [...]},
+         {"table": "users", "columns": [...], "rows": [[...], ...]}, ...]
+    Rows are read from a single read transaction and written as they are
+    fetched, so the export is consistent and memory stays at one chunk.
+    progress(table, rows_written) is called after every chunk.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"export_{_timestamp()}.json" + (".gz" if compress else ""))
+    partial_path = path + ".partial"
+
+    try:
+        conn = db.get_connection()
+        try:
+            with _open_output(partial_path, compress) as out:
+                # BEGIN holds one read snapshot across every table.
+                conn.execute("BEGIN")
+                header = {
+                    "format": EXPORT_FORMAT,
+                    "schema_version": get_schema_version(conn),
+                    "created_at": datetime.now().isoformat(),
+                    "tables": list(tables),
+                }
+                out.write("[\n" + json.dumps(header))
+                for table in tables:
+                    cursor = conn.execute(f"SELECT * FROM {table}")
+                    columns = [col[0] for col in cursor.description]
+                    written = 0
+                    while rows := cursor.fetchmany(EXPORT_CHUNK_ROWS):
+                        chunk = {"table": table, "columns": columns, "rows": rows}
+                        out.write(",\n" + json.dumps(chunk, ensure_ascii=False))
+                        written += len(rows)
+                        if progress:
+                            progress(table, written)
+                out.write("\n]\n")
+        finally:
+            conn.close()
+        return _publish(partial_path, path)
+    except Exception as exc:
+        logging.error(f"Error exporting JSON: {exc}")
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+
+def list_backups(directory=BACKUP_DIR):
+    """Full backups and exports in directory, newest first (incremental backups are listed by change_files_for)."""
+    if not os.path.isdir(directory):
+        return []
+    files = [f for f in os.listdir(directory) if f.endswith(BACKUP_SUFFIXES) and not f.startswith(CHANGES_PREFIX)]
+    return sorted(files, key=lambda f: os.path.getmtime(os.path.join(directory, f)), reverse=True)
+
+
+def _check_version(version, path):
+    if version > LATEST_VERSION:
+        raise ValueError(f"{path} was written by a newer version (schema {version}, this build supports {LATEST_VERSION})")
+
+
+def _stage_snapshot(path, staging_path):
+    """Copy a (possibly gzipped) database snapshot into staging and bring its schema up to date."""
+    with _open_input(path) as src, open(staging_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    conn = sqlite3.connect(staging_path)
+    try:
+        _check_version(get_schema_version(conn), path)
+    finally:
+        conn.close()
+    # Opening it through DBContext applies any migrations the snapshot predates.
+    return DBContext(staging_path)
+
+
+def _stage_export(path, staging_path, progress=None):
+    """Load a JSON export into a new staging database with one executemany per chunk."""
+    elements = iter_json_array(path)
+    header = next(elements, None)
+    if not isinstance(header, dict) or header.get("format") != EXPORT_FORMAT:
+        raise ValueError(f"{path} is not a CampTrack export")
+    _check_version(header.get("schema_version", 0), path)
+
+    staging = DBContext(staging_path)
+    conn = staging.get_connection()
+    try:
+        # References are checked once the load is complete (see _validate).
+        conn.execute("PRAGMA foreign_keys = OFF")
+        with change_capture_suspended(conn), derived_triggers_dropped(conn), indexes_dropped(conn, EXPORT_TABLES):
+            columns = {}
+            counts = {}
+            conn.execute("BEGIN")
+            try:
+                for chunk in elements:
+                    table = chunk["table"]
+                    if table not in EXPORT_TABLES:
+                        raise ValueError(f"Unexpected table {table!r} in {path}")
+                    if table not in columns:
+                        columns[table] = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                    unknown = set(chunk["columns"]) - columns[table]
+                    if unknown:
+                        raise ValueError(f"Unknown {table} columns in {path}: {', '.join(sorted(unknown))}")
+
+                    column_list = ", ".join(chunk["columns"])
+                    placeholders = ", ".join("?" * len(chunk["columns"]))
+                    conn.executemany(f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})", chunk["rows"])
+                    counts[table] = counts.get(table, 0) + len(chunk["rows"])
+                    if progress:
+                        progress(table, counts[table])
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    finally:
+        conn.close()
+    rebuild_derived_tables(staging)
+    return staging
+
+
+def change_files_for(path):
+    """Incremental backups built on the snapshot at path, oldest first, as (path, header) pairs."""
+    directory, base = os.path.split(path)
+    chain = []
+    for name in os.listdir(directory):
+        if not (name.startswith(CHANGES_PREFIX) and name.endswith(".json.gz")):
+            continue
+        change_path = os.path.join(directory, name)
+        header = next(iter_json_array(change_path), None)
+        if isinstance(header, dict) and header.get("format") == CHANGES_FORMAT and header.get("base") == base:
+            chain.append((change_path, header))
+    return sorted(chain, key=lambda item: item[1]["after_seq"])
+
+
+def _logged_changes(path, seq):
+    """Yield the change rows chained to the snapshot at path that come after seq, in order."""
+    for change_path, header in change_files_for(path):
+        if header["last_seq"] <= seq:
+            continue
+        if header["after_seq"] != seq:
+            raise ValueError(f"An incremental backup between change {seq} and {os.path.basename(change_path)} is missing")
+        elements = iter_json_array(change_path)
+        next(elements)
+        for chunk in elements:
+            yield from chunk["rows"]
+        seq = header["last_seq"]
+
+
+def _change_statement(conn, columns, table, op, row_key, row_data):
+    """SQL and parameters that repeat one logged write."""
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"Unexpected table {table!r} in change log")
+    if table not in columns:
+        info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        key = [row[1] for row in sorted(info, key=lambda row: row[5]) if row[5]]
+        columns[table] = ({row[1] for row in info}, key)
+    known, key = columns[table]
+    where = " AND ".join(f"{column} = ?" for column in key)
+    if op == "D":
+        return f"DELETE FROM {table} WHERE {where}", json.loads(row_key)
+
+    data = json.loads(row_data)
+    unknown = set(data) - known
+    if unknown:
+        raise ValueError(f"Unknown {table} columns in change log: {', '.join(sorted(unknown))}")
+    if op == "I":
+        # REPLACE mirrors writes that replaced an existing row without logging a delete.
+        placeholders = ", ".join("?" * len(data))
+        return f"INSERT OR REPLACE INTO {table} ({', '.join(data)}) VALUES ({placeholders})", list(data.values())
+    assignments = ", ".join(f"{column} = ?" for column in data)
+    return f"UPDATE {table} SET {assignments} WHERE {where}", list(data.values()) + json.loads(row_key)
+
+
+def _replay_changes(staging, path, until=None, progress=None):
+    """
+    Apply the incremental backups of the snapshot at path to staging, up to
+    and including the changes made at until (a datetime; None replays all).
+    Consecutive identical statements are batched into one executemany.
+    """
+    cutoff = until.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] if until else None
+    conn = staging.get_connection()
+    try:
+        # The log already holds each cascade and reference in commit order.
+        conn.execute("PRAGMA foreign_keys = OFF")
+        with change_capture_suspended(conn), derived_triggers_dropped(conn):
+            columns = {}
+            sql, batch = None, []
+            replayed = 0
+            conn.execute("BEGIN")
+            try:
+                for _, changed_at, table, op, row_key, row_data in _logged_changes(path, _change_high_water(conn)):
+                    if cutoff and changed_at > cutoff:
+                        break
+                    statement, params = _change_statement(conn, columns, table, op, row_key, row_data)
+                    if statement != sql and batch:
+                        conn.executemany(sql, batch)
+                        batch = []
+                    sql = statement
+                    batch.append(params)
+                    replayed += 1
+                    if progress and replayed % EXPORT_CHUNK_ROWS == 0:
+                        progress("changes", replayed)
+                if batch:
+                    conn.executemany(sql, batch)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    finally:
+        conn.close()
+    rebuild_derived_tables(staging)
+    return replayed
+
+
+def _validate(staging, path):
+    """Raise ValueError unless the staged database is intact; return its base table row counts."""
+    with staging.connection() as conn:
+        # quick_check skips the index-vs-table cross checks, which dominate on large files.
+        result = conn.execute("PRAGMA quick_check").fetchone()[0]
+        if result != "ok":
+            raise ValueError(f"{path} failed the integrity check: {result}")
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            table, rowid, parent, _ = violations[0]
+            raise ValueError(
+                f"{path} has {len(violations)} broken references (first: {table} row {rowid} -> missing {parent})"
+            )
+        return {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in EXPORT_TABLES}
+
+
+def restore_backup(db, path, progress=None, replay=False, until=None):
+    """
+    Replace the contents of db with the snapshot or JSON export at path and
+    return the restored row count of every base table.
+
+    With replay, the incremental backups built on a snapshot are applied
+    on top of it, stopping after the last change made at or before until
+    (a datetime) when it is given: a point-in-time restore.
+
+    The file is loaded into a staging database next to db and validated
+    there. Only then is staging copied over db with the backup API in a
+    single step, which SQLite runs as one write transaction: a file that
+    fails to load or validate leaves db untouched, and connections already
+    open on db see the restored data on their next query. The restored
+    data starts a new backup chain, so the next incremental backup needs a
+    full backup first.
+    progress(table, rows_loaded) is called per chunk of a JSON export or
+    of replayed changes (with table "changes").
+    """
+    staging_path = db.db_path + ".restore"
+    _remove_database(staging_path)
+    staging = None
+    try:
+        if path.endswith((".json", ".json.gz")):
+            if replay:
+                raise ValueError("Incremental backups build on database snapshots, not JSON exports")
+            staging = _stage_export(path, staging_path, progress)
+        else:
+            staging = _stage_snapshot(path, staging_path)
+            if replay:
+                _replay_changes(staging, path, until, progress)
+        with staging.connection() as conn:
+            conn.execute("DELETE FROM change_log")
+            conn.execute("DELETE FROM backup_checkpoints")
+            conn.commit()
+        counts = _validate(staging, path)
+        staging.close()
+
+        source = sqlite3.connect(staging_path)
+        try:
+            target = db.get_connection()
+            try:
+                # Move the restored cache counters past the live ones, so results cached from the old data reload.
+                for name, version in target.execute("SELECT name, version FROM cache_versions").fetchall():
+                    source.execute("UPDATE cache_versions SET version = MAX(version, ?) + 1 WHERE name = ?", (version, name))
+                source.commit()
+                source.backup(target)
+            finally:
+                target.close()
+        finally:
+            source.close()
+        return counts
+    except Exception as exc:
+        logging.error(f"Error restoring {path}: {exc}")
+        raise
+    finally:
+        if staging is not None:
+            staging.close()
+        _remove_database(staging_path)
@@ -0,0 +1,112 @@
+"""
+Helpers shared by the bulk loaders (the JSON seeder and backup restore).
+
+Loaders write rows straight into the base tables. Suspending the triggers
+that maintain derived data and rebuilding it once afterwards is much
+faster than letting every insert update it row by row.
+
+Dropped indexes and triggers are recorded in suspended_schema in the same
+transaction that drops them, and removed from it in the one that recreates
+them. If a load is killed in between, DBContext.initialize_db() puts them
+back the next time the database is opened.
+"""
+import logging
+import time
+from contextlib import contextmanager
+
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.message_manager import MessageManager
+from persistence.search import rebuild_search_indexes
+
+
+@contextmanager
+def _schema_suspended(conn, objects):
+    """Drop objects ((type, name, sql) rows of sqlite_master) for the duration of the block, then recreate them."""
+    conn.execute("BEGIN")
+    for kind, name, sql in objects:
+        conn.execute("INSERT OR REPLACE INTO suspended_schema (name, sql) VALUES (?, ?)", (name, sql))
+        conn.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+    conn.commit()
+    try:
+        yield
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.execute("BEGIN")
+        # Another process opening the database may already have put them back.
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')")}
+        for _, name, sql in objects:
+            if name not in existing:
+                conn.execute(sql)
+            conn.execute("DELETE FROM suspended_schema WHERE name = ?", (name,))
+        conn.commit()
+
+
+@contextmanager
+def indexes_dropped(conn, tables):
+    """
+    Drop the non-unique indexes on tables for the duration of the block and
+    recreate them afterwards. Unique indexes stay, since they enforce keys.
+    """
+    placeholders = ", ".join("?" * len(tables))
+    indexes = conn.execute(
+        f"""
+        SELECT type, name, sql FROM sqlite_master
+        WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})
+          AND sql NOT LIKE 'CREATE UNIQUE%'
+        """,
+        tables,
+    ).fetchall()
+    with _schema_suspended(conn, indexes):
+        yield
+        started = time.perf_counter()
+    logging.info("Rebuilt %d indexes in %.2fs", len(indexes), time.perf_counter() - started)
+
+
+@contextmanager
+def _triggers_dropped(conn, pattern):
+    triggers = conn.execute(f"SELECT type, name, sql FROM sqlite_master WHERE type = 'trigger' AND ({pattern})").fetchall()
+    with _schema_suspended(conn, triggers):
+        yield
+
+
+@contextmanager
+def derived_triggers_dropped(conn):
+    """
+    Drop the triggers that maintain search indexes, camp_stats and cache
+    counters while loading; callers run rebuild_derived_tables() afterwards.
+    """
+    pattern = (
+        r"name LIKE '%\_fts\_%' ESCAPE '\' OR name LIKE 'camp\_stats\_%' ESCAPE '\'"
+        r" OR name LIKE 'cache\_version\_%' ESCAPE '\'"
+    )
+    with _triggers_dropped(conn, pattern):
+        yield
+
+
+@contextmanager
+def change_capture_suspended(conn):
+    """
+    Drop the change_log triggers while loading. Rows loaded meanwhile never
+    reach the change log, so the backup checkpoints are cleared as well:
+    the next incremental backup then needs a new full backup to build on.
+    """
+    try:
+        with _triggers_dropped(conn, r"name LIKE 'change\_log\_%' ESCAPE '\'"):
+            yield
+    finally:
+        conn.execute("DELETE FROM backup_checkpoints")
+        conn.commit()
+
+
+def rebuild_derived_tables(db):
+    """
+    Derive the inbox rows, camp statistics and search indexes from the base
+    tables, and move every cache counter so cached results reload.
+    """
+    MessageManager(db).rebuild_conversations()
+    CampManager(db).rebuild_camp_stats()
+    rebuild_search_indexes(db)
+    with db.connection() as conn:
+        conn.execute("UPDATE cache_versions SET version = version + 1")
+        conn.commit()
@@ -0,0 +1,102 @@
+import copy
+import threading
+
+
+class DataVersionCache:
+    """
+    Read-through cache that is invalidated by any write to the database,
+    including writes made by other processes.
+
+    Before serving an entry it reads a token made of PRAGMA data_version
+    (which moves when another connection commits) and the connection's
+    total_changes (which moves on this connection's own writes). A hit costs
+    that one pragma; any change since the entry was stored reloads it.
+
+    data_version is only comparable on the same connection, so entries are
+    kept per thread, matching DBContext's per-thread connections.
+    """
+
+    def __init__(self, db_context):
+        self.db = db_context
+        self._local = threading.local()
+
+    def _entries(self):
+        entries = getattr(self._local, "entries", None)
+        if entries is None:
+            entries = self._local.entries = {}
+        return entries
+
+    @staticmethod
+    def _token(conn):
+        return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+    def get(self, key, loader, copier=copy.deepcopy):
+        """
+        Return the cached value for key, calling loader() when the database
+        changed since it was stored. Callers receive copier(value) so they can
+        mutate the result freely; pass copier=None for immutable values.
+        """
+        entries = self._entries()
+        with self.db.connection() as conn:
+            token = self._token(conn)
+            entry = entries.get(key)
+            if entry is None or entry[0] != token:
+                value = loader()
+                # Reads do not move the token, so the pre-load token stays valid.
+                entries[key] = (token, value)
+            else:
+                value = entry[1]
+        return copier(value) if copier else value
+
+    def invalidate(self, key=None):
+        """Drop one entry (or all of them) for the calling thread."""
+        if key is None:
+            self._entries().clear()
+        else:
+            self._entries().pop(key, None)
+
+    def clear(self):
+        """Drop every thread's entries."""
+        self._local = threading.local()
+
+
+class CounterCache:
+    """
+    Read-through cache for results that depend on only a few tables.
+
+    Triggers bump a named counter in cache_versions whenever one of those
+    tables changes, and an entry is served while the counter still holds
+    the value it had when the entry was loaded. A hit costs one primary-key
+    lookup and, unlike DataVersionCache, writes to unrelated tables leave
+    entries valid. The counter is stored data, so entries are shared by all
+    threads and still notice writes from other processes.
+    """
+
+    def __init__(self, db_context, counter):
+        self.db = db_context
+        self.counter = counter
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, loader, copier=copy.deepcopy):
+        """
+        Return the cached value for key, calling loader() when the counter
+        moved since it was stored. Callers receive copier(value), as with
+        DataVersionCache.get().
+        """
+        with self.db.connection() as conn:
+            version = conn.execute("SELECT version FROM cache_versions WHERE name = ?", (self.counter,)).fetchone()[0]
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            # Read after the counter, so the value is never older than the version it is stored under.
+            value = loader()
+            with self._lock:
+                self._entries[key] = (version, value)
+        else:
+            value = entry[1]
+        return copier(value) if copier else value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,5 +1,6 @@
 import logging
 from persistence.db_context import DBContext
+from persistence.search import SEARCH_LIMIT, snippet_sql, to_match_query
 
 
 class AnnouncementManager:
@@ -9,64 +10,91 @@ class AnnouncementManager:
         self.db = db_context or DBContext()
 
     def read_all(self):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT announcement_id, author, content, created_at FROM announcements")
-            rows = cursor.fetchall()
-            return [
-                {
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT announcement_id, author, content, created_at FROM announcements")
+                rows = cursor.fetchall()
+                return [
+                    {
+                        "announcement_id": row[0],
+                        "author": row[1],
+                        "content": row[2],
+                        "created_at": row[3],
+                    }
+                    for row in rows
+                ]
+            except Exception as exc:
+                logging.error(f"Error reading announcements: {exc}")
+                return []
+
+    def add(self, announcement_data):
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "INSERT INTO announcements (announcement_id, author, content, created_at) VALUES (?, ?, ?, ?)",
+                    (
+                        announcement_data.get("announcement_id"),
+                        announcement_data.get("author"),
+                        announcement_data.get("content"),
+                        announcement_data.get("created_at"),
+                    ),
+                )
+                conn.commit()
+            except Exception as exc:
+                logging.error(f"Error adding announcement: {exc}")
+                raise
+
+    def get_latest(self):
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT announcement_id, author, content, created_at FROM announcements ORDER BY created_at DESC LIMIT 1"
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                return {
                     "announcement_id": row[0],
                     "author": row[1],
                     "content": row[2],
                     "created_at": row[3],
                 }
-                for row in rows
-            ]
-        except Exception as exc:
-            logging.error(f"Error reading announcements: {exc}")
-            return []
-        finally:
-            conn.close()
-
-    def add(self, announcement_data):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "INSERT INTO announcements (announcement_id, author, content, created_at) VALUES (?, ?, ?, ?)",
-                (
-                    announcement_data.get("announcement_id"),
-                    announcement_data.get("author"),
-                    announcement_data.get("content"),
-                    announcement_data.get("created_at"),
-                ),
-            )
-            conn.commit()
-        except Exception as exc:
-            logging.error(f"Error adding announcement: {exc}")
-            raise
-        finally:
-            conn.close()
-
-    def get_latest(self):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "SELECT announcement_id, author, content, created_at FROM announcements ORDER BY created_at DESC LIMIT 1"
-            )
-            row = cursor.fetchone()
-            if not row:
+            except Exception as exc:
+                logging.error(f"Error getting latest announcement: {exc}")
                 return None
-            return {
-                "announcement_id": row[0],
-                "author": row[1],
-                "content": row[2],
-                "created_at": row[3],
-            }
-        except Exception as exc:
-            logging.error(f"Error getting latest announcement: {exc}")
-            return None
-        finally:
-            conn.close()
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT):
+        """Full-text search over announcement text and authors, best match first."""
+        query = to_match_query(text)
+        if not query:
+            return []
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"""
+                    SELECT a.announcement_id, a.author, a.content, a.created_at, {snippet_sql("announcements_fts", column=1)}
+                    FROM announcements_fts JOIN announcements a ON a.rowid = announcements_fts.rowid
+                    WHERE announcements_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                    """,
+                    (query, limit),
+                )
+                rows = cursor.fetchall()
+                return [
+                    {
+                        "announcement_id": row[0],
+                        "author": row[1],
+                        "content": row[2],
+                        "created_at": row[3],
+                        "snippet": row[4],
+                    }
+                    for row in rows
+                ]
+            except Exception as exc:
+                logging.error(f"Error searching announcements: {exc}")
+                return []
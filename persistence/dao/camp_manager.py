@@ -1,271 +1,523 @@
+from collections import defaultdict
 from datetime import datetime
 import logging
 import numpy as np
 import pandas as pd
 from models.activity import Activity, Session
-from models.camp import Camp
+from models.camp import Camp, LazyCamp
+from models.camp_summary import CampSummary
 from models.camper import Camper
 from models.resource import Equipment
+from persistence.cache import CounterCache
 from persistence.db_context import DBContext
 
+CAMP_STATS_COLUMNS = (
+    "camper_count, report_count, participation_total, injured_total, "
+    "activity_total, achievement_total, food_consumed, food_added"
+)
+
+# Recount everything derivable from current rows. Food movements have no
+# history, so existing counters are kept and new rows start from
+# initial minus current stock.
+REBUILD_CAMP_STATS_SQL = """
+    INSERT INTO camp_stats (
+        camp_id, camper_count, report_count, participation_total, injured_total,
+        activity_total, achievement_total, food_consumed
+    )
+    SELECT c.camp_id,
+           (SELECT COUNT(*) FROM camp_campers cc WHERE cc.camp_id = c.camp_id),
+           COUNT(r.report_id),
+           COALESCE(SUM(r.daily_participation), 0),
+           COALESCE(SUM(r.injured_count), 0),
+           COALESCE(SUM(r.activity_count), 0),
+           COALESCE(SUM(r.achievement_count), 0),
+           MAX(COALESCE(c.initial_food_stock, 0) - COALESCE(c.current_food_stock, 0), 0)
+    FROM camps c LEFT JOIN daily_reports r ON r.camp_id = c.camp_id
+    GROUP BY c.camp_id
+    ON CONFLICT(camp_id) DO UPDATE SET
+        camper_count = excluded.camper_count,
+        report_count = excluded.report_count,
+        participation_total = excluded.participation_total,
+        injured_total = excluded.injured_total,
+        activity_total = excluded.activity_total,
+        achievement_total = excluded.achievement_total
+"""
+
 
 class CampManager:
     """SQLite-backed camp persistence."""
 
-    def __init__(self, db_context=None):
+    def __init__(self, db_context=None, unit_of_work=None):
         self.db = db_context or DBContext()
-
-    def read_all(self):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT * FROM camps")
-            camp_rows = cursor.fetchall()
-            camps = [self._build_camp_from_row(cursor, row) for row in camp_rows]
+        self.unit_of_work = unit_of_work
+        self.engagement_cache = CounterCache(self.db, "engagement")
+        if unit_of_work is not None:
+            unit_of_work.register_writer("camp", self._write_changes)
+
+    def _in_unit_of_work(self):
+        return self.unit_of_work is not None and self.unit_of_work.active
+
+    def _flush_pending(self):
+        # Aggregates and trigger-maintained tables only see committed rows, so queued camps go first.
+        if self._in_unit_of_work():
+            self.unit_of_work.flush()
+
+    def _identity_mapped(self, camps):
+        """Swap in the unit of work's instance for camps it already holds."""
+        if not self._in_unit_of_work():
             return camps
-        except Exception as exc:
-            logging.error(f"Error reading camps: {exc}")
-            return []
-        finally:
-            conn.close()
-
-    def find_camp(self, name: str):
-        """Find a camp by name (case-sensitive)."""
-        camps = self.read_all()
-        for camp in camps:
-            if camp.name == name:
+        return [self.unit_of_work.attach("camp", camp.camp_id, camp) for camp in camps]
+
+    def read_all(self, lazy=False):
+        """
+        Load every camp. With lazy=True the campers, activities and equipment
+        are only fetched when first accessed, one query per collection for
+        the whole result set.
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                camp_rows = self._fetch_all(cursor, "SELECT * FROM camps")
+                if lazy:
+                    return self._identity_mapped(self._build_lazy_camps(camp_rows))
+                return self._identity_mapped(self._hydrate_camps(cursor, camp_rows))
+            except Exception as exc:
+                logging.error(f"Error reading camps: {exc}")
+                return []
+
+    def find_camp(self, name: str, lazy=False):
+        """Find a camp by name (case-sensitive), hydrating only that camp."""
+        if self._in_unit_of_work():
+            camp = self.unit_of_work.find("camp", lambda c: c.name == name)
+            if camp is not None:
                 return camp
-        return None
+        return self._get_one("SELECT * FROM camps WHERE name = ?", (name,), lazy)
 
-    def _build_camp_from_row(self, cursor, row):
-        camp_id = row[0]
+    def name_exists(self, name: str) -> bool:
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1 FROM camps WHERE name = ? LIMIT 1", (name,))
+                return cursor.fetchone() is not None
+            except Exception as exc:
+                logging.error(f"Error checking camp name: {exc}")
+                raise
+
+    def _get_one(self, query, params, lazy=False):
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                if lazy:
+                    camps = self._build_lazy_camps([row], "?", (row[0],))
+                else:
+                    camps = self._hydrate_camps(cursor, [row], "?", (row[0],))
+                return self._identity_mapped(camps)[0]
+            except Exception as exc:
+                logging.error(f"Error getting camp: {exc}")
+                return None
+
+    def _hydrate_camps(self, cursor, camp_rows, camp_ids_sql=None, params=()):
+        """
+        Build the full Camp graph for camp_rows with a fixed number of queries.
 
-        cursor.execute(
-            """
-            SELECT c.camper_id, c.name, c.age, c.contact, c.medical_info
-            FROM campers c
-            JOIN camp_campers cc ON c.camper_id = cc.camper_id
-            WHERE cc.camp_id = ?
+        camp_ids_sql is an optional SQL expression yielding the camp_ids of
+        camp_rows (e.g. "?" or "SELECT camp_id FROM camps WHERE ..."), used to
+        restrict the child queries; without it every child row is loaded.
+        """
+        if not camp_rows:
+            return []
+
+        campers_by_camp = self._load_campers(cursor, camp_ids_sql, params)
+        activities_by_camp = self._load_activities(cursor, camp_ids_sql, params)
+        equipment_by_camp = self._load_equipment(cursor, camp_ids_sql, params)
+
+        camps = []
+        for row in camp_rows:
+            camp = self._build_camp_from_row(
+                row,
+                campers=campers_by_camp.get(row[0], []),
+                activities=activities_by_camp.get(row[0], []),
+                equipment=equipment_by_camp.get(row[0], []),
+            )
+            camp.mark_clean()
+            camps.append(camp)
+        return camps
+
+    def _build_lazy_camps(self, camp_rows, camp_ids_sql=None, params=()):
+        """Build LazyCamps for camp_rows sharing one loader per collection."""
+        camps_by_id = {}
+        loaders = {
+            "campers": self._load_campers,
+            "activities": self._load_activities,
+            "equipment": self._load_equipment,
+        }
+
+        def load(collection):
+            with self.db.connection() as conn:
+                try:
+                    members_by_camp = loaders[collection](conn.cursor(), camp_ids_sql, params)
+                except Exception as exc:
+                    logging.error(f"Error loading camp {collection}: {exc}")
+                    raise
+            for camp_id, camp in camps_by_id.items():
+                camp.set_loaded_collection(collection, members_by_camp.get(camp_id, []))
+
+        for row in camp_rows:
+            camp = self._build_camp_from_row(row, camp_class=LazyCamp, loader=load)
+            camp.mark_clean()
+            camps_by_id[camp.camp_id] = camp
+        return list(camps_by_id.values())
+
+    def _fetch_all(self, cursor, sql, params=()):
+        """
+        Run a read and return its rows. Whole-table reads (no params) are
+        served from the data_version cache until any connection writes.
+        """
+        if params:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        return self.db.cache.get(("camps", sql), lambda: cursor.execute(sql).fetchall(), copier=None)
+
+    @staticmethod
+    def _scope(column, camp_ids_sql):
+        return f"WHERE {column} IN ({camp_ids_sql})" if camp_ids_sql else ""
+
+    def _load_campers(self, cursor, camp_ids_sql=None, params=()):
+        campers_by_camp = defaultdict(list)
+        rows = self._fetch_all(
+            cursor,
+            f"""
+            SELECT cc.camp_id, c.camper_id, c.name, c.age, c.contact, c.medical_info
+            FROM camp_campers cc
+            JOIN campers c ON c.camper_id = cc.camper_id
+            {self._scope('cc.camp_id', camp_ids_sql)}
             """,
-            (camp_id,)
+            params,
         )
-        camper_rows = cursor.fetchall()
-        campers = [Camper(name=r[1], age=r[2], contact=r[3], medical_info=r[4]) for r in camper_rows]
-        for idx, camper in enumerate(campers):
-            camper.camper_id = camper_rows[idx][0]
-
-        cursor.execute(
-            "SELECT id, name, date, session, is_indoor FROM scheduled_activities WHERE camp_id = ?",
-            (camp_id,)
+        for r in rows:
+            camper = Camper(name=r[2], age=r[3], contact=r[4], medical_info=r[5])
+            camper.camper_id = r[1]
+            campers_by_camp[r[0]].append(camper)
+        return campers_by_camp
+
+    def _load_activities(self, cursor, camp_ids_sql=None, params=()):
+        attendance_by_activity = defaultdict(list)
+        rows = self._fetch_all(
+            cursor,
+            f"""
+            SELECT aa.scheduled_activity_id, aa.camper_id
+            FROM activity_attendance aa
+            JOIN scheduled_activities sa ON sa.id = aa.scheduled_activity_id
+            {self._scope('sa.camp_id', camp_ids_sql)}
+            """,
+            params,
         )
-        activity_rows = cursor.fetchall()
-        activities = []
-        for act_row in activity_rows:
-            act_id = act_row[0]
-            cursor.execute(
-                "SELECT camper_id FROM activity_attendance WHERE scheduled_activity_id = ?",
-                (act_id,)
-            )
-            attendees = [a[0] for a in cursor.fetchall()]
-
+        for act_id, camper_id in rows:
+            attendance_by_activity[act_id].append(camper_id)
+
+        activities_by_camp = defaultdict(list)
+        rows = self._fetch_all(
+            cursor,
+            f"SELECT id, camp_id, name, date, session, is_indoor FROM scheduled_activities {self._scope('camp_id', camp_ids_sql)} ORDER BY id",
+            params,
+        )
+        for act_row in rows:
             session_enum = Session.Morning
             try:
-                session_enum = Session[act_row[3]]
+                session_enum = Session[act_row[4]]
             except Exception:
                 pass
 
             activity = Activity(
-                name=act_row[1],
-                date=act_row[2],
+                name=act_row[2],
+                date=act_row[3],
                 session=session_enum,
-                is_indoor=bool(act_row[4])
+                is_indoor=bool(act_row[5]),
+                activity_id=act_row[0],
             )
-            activity.campers = attendees
-            activities.append(activity)
-
-        cursor.execute(
-            "SELECT resource_id, name, target_quantity, current_quantity, condition FROM equipment WHERE camp_id = ?",
-            (camp_id,)
+            activity.campers = attendance_by_activity.get(act_row[0], [])
+            activities_by_camp[act_row[1]].append(activity)
+        return activities_by_camp
+
+    def _load_equipment(self, cursor, camp_ids_sql=None, params=()):
+        equipment_by_camp = defaultdict(list)
+        rows = self._fetch_all(
+            cursor,
+            f"SELECT resource_id, camp_id, name, target_quantity, current_quantity, condition FROM equipment {self._scope('camp_id', camp_ids_sql)}",
+            params,
         )
-        equipment_rows = cursor.fetchall()
-        equipment = [
-            Equipment(
-                resource_id=eq[0],
-                name=eq[1],
-                camp_id=camp_id,
-                target_quantity=eq[2],
-                current_quantity=eq[3],
-                condition=eq[4],
+        for eq in rows:
+            equipment_by_camp[eq[1]].append(
+                Equipment(
+                    resource_id=eq[0],
+                    name=eq[2],
+                    camp_id=eq[1],
+                    target_quantity=eq[3],
+                    current_quantity=eq[4],
+                    condition=eq[5],
+                )
             )
-            for eq in equipment_rows
-        ]
+        return equipment_by_camp
 
+    def _build_camp_from_row(self, row, camp_class=Camp, **collections):
         start_date = datetime.strptime(row[4], "%Y-%m-%d").date() if row[4] else None
         end_date = datetime.strptime(row[5], "%Y-%m-%d").date() if row[5] else None
 
-        camp = Camp(
-            camp_id=camp_id,
+        camp = camp_class(
+            camp_id=row[0],
             name=row[1],
             location=row[2],
             camp_type=row[3],
             start_date=start_date,
             end_date=end_date,
             camp_leader=row[6],
-            campers=campers,
             food_per_camper_per_day=row[7],
             initial_food_stock=row[8],
             current_food_stock=row[9],
-            equipment=equipment,
-            activities=activities,
+            **collections,
         )
+        # Camp.__init__ resets the stock to the initial value; restore the persisted one.
+        camp.current_food_stock = row[9]
         return camp
 
     def add(self, camp: Camp):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                """
-                INSERT INTO camps (camp_id, name, location, camp_type, start_date, end_date, camp_leader, food_per_camper_per_day, initial_food_stock, current_food_stock)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    camp.camp_id,
-                    camp.name,
-                    camp.location,
-                    camp.camp_type,
-                    str(camp.start_date),
-                    str(camp.end_date),
-                    camp.camp_leader,
-                    camp.food_per_camper_per_day,
-                    camp.initial_food_stock,
-                    camp.current_food_stock,
-                ),
-            )
-
-            for camper in camp.campers:
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
                 cursor.execute(
-                    "SELECT camper_id FROM campers WHERE camper_id = ?",
-                    (camper.camper_id,),
+                    """
+                    INSERT INTO camps (camp_id, name, location, camp_type, start_date, end_date, camp_leader, food_per_camper_per_day, initial_food_stock, current_food_stock)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        camp.camp_id,
+                        camp.name,
+                        camp.location,
+                        camp.camp_type,
+                        str(camp.start_date),
+                        str(camp.end_date),
+                        camp.camp_leader,
+                        camp.food_per_camper_per_day,
+                        camp.initial_food_stock,
+                        camp.current_food_stock,
+                    ),
                 )
-                if not cursor.fetchone():
+
+                for camper in camp.campers:
+                    cursor.execute(
+                        "SELECT camper_id FROM campers WHERE camper_id = ?",
+                        (camper.camper_id,),
+                    )
+                    if not cursor.fetchone():
+                        cursor.execute(
+                            "INSERT INTO campers (camper_id, name, age, contact, medical_info) VALUES (?, ?, ?, ?, ?)",
+                            (
+                                camper.camper_id,
+                                camper.name,
+                                camper.age,
+                                camper.contact,
+                                camper.medical_info,
+                            ),
+                        )
+                    cursor.execute(
+                        "INSERT INTO camp_campers (camp_id, camper_id) VALUES (?, ?)",
+                        (camp.camp_id, camper.camper_id),
+                    )
+
+                for act in camp.activities:
                     cursor.execute(
-                        "INSERT INTO campers (camper_id, name, age, contact, medical_info) VALUES (?, ?, ?, ?, ?)",
+                        "INSERT INTO scheduled_activities (camp_id, name, date, session, is_indoor) VALUES (?, ?, ?, ?, ?)",
+                        (camp.camp_id, act.name, str(act.date), act.session.name, 1 if act.is_indoor else 0),
+                    )
+                    act_id = cursor.lastrowid
+                    act.activity_id = act_id
+                    for cid in act.campers:
+                        cursor.execute(
+                            "INSERT INTO activity_attendance (scheduled_activity_id, camper_id) VALUES (?, ?)",
+                            (act_id, cid),
+                        )
+
+                for eq in camp.equipment:
+                    cursor.execute(
+                        """
+                        INSERT INTO equipment (resource_id, camp_id, name, target_quantity, current_quantity, condition)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
                         (
-                            camper.camper_id,
-                            camper.name,
-                            camper.age,
-                            camper.contact,
-                            camper.medical_info,
+                            eq.resource_id,
+                            camp.camp_id,
+                            eq.name,
+                            eq.target_quantity,
+                            eq.current_quantity,
+                            eq.condition,
                         ),
                     )
-                cursor.execute(
-                    "INSERT INTO camp_campers (camp_id, camper_id) VALUES (?, ?)",
-                    (camp.camp_id, camper.camper_id),
-                )
 
-            for act in camp.activities:
+                conn.commit()
+                camp.mark_clean()
+                self._identity_mapped([camp])
+            except Exception as exc:
+                logging.error(f"Error adding camp: {exc}")
+                conn.rollback()
+                raise
+
+    # Camp attribute -> camps column, in the order used by add().
+    CAMP_COLUMNS = {
+        "name": "name",
+        "location": "location",
+        "camp_type": "camp_type",
+        "start_date": "start_date",
+        "end_date": "end_date",
+        "camp_leader": "camp_leader",
+        "food_per_camper_per_day": "food_per_camper_per_day",
+        "initial_food_stock": "initial_food_stock",
+        "current_food_stock": "current_food_stock",
+    }
+
+    def update(self, updated_camp: Camp):
+        """
+        Persist only what changed on updated_camp since it was loaded.
+
+        Camps that were not loaded through this manager have no baseline, so
+        the persisted rows are read first and diffed against instead. Inside
+        a unit-of-work scope the write is queued until the scope flushes.
+        """
+        if self._in_unit_of_work():
+            self.unit_of_work.mark_dirty("camp", updated_camp.camp_id, updated_camp)
+            return
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                self._write_changes(cursor, updated_camp)
+                conn.commit()
+                updated_camp.mark_clean()
+            except Exception as exc:
+                logging.error(f"Error updating camp: {exc}")
+                conn.rollback()
+                raise
+
+    def _write_changes(self, cursor, camp: Camp):
+        changed = camp.changed_fields()
+        if changed:
+            columns = [c for c in self.CAMP_COLUMNS if c in changed]
+            assignments = ", ".join(f"{self.CAMP_COLUMNS[c]}=?" for c in columns)
+            values = [self._column_value(camp, c) for c in columns]
+            cursor.execute(f"UPDATE camps SET {assignments} WHERE camp_id=?", (*values, camp.camp_id))
+
+        loaded = camp.loaded_collections()
+        if "campers" in loaded:
+            self._write_camper_changes(cursor, camp)
+        if "activities" in loaded:
+            self._write_activity_changes(cursor, camp)
+        if "equipment" in loaded:
+            self._write_equipment_changes(cursor, camp)
+
+    def _column_value(self, camp, attribute):
+        value = getattr(camp, attribute)
+        if attribute in ("start_date", "end_date"):
+            return str(value)
+        return value
+
+    def _persisted_ids(self, cursor, camp, collection, query):
+        ids = camp.clean_member_ids(collection)
+        if ids is not None:
+            return set(ids)
+        cursor.execute(query, (camp.camp_id,))
+        return {row[0] for row in cursor.fetchall()}
+
+    def _write_camper_changes(self, cursor, camp):
+        old_ids = self._persisted_ids(
+            cursor, camp, "campers", "SELECT camper_id FROM camp_campers WHERE camp_id = ?"
+        )
+        current = {c.camper_id: c for c in camp.campers}
+
+        removed = old_ids - current.keys()
+        if removed:
+            cursor.executemany(
+                "DELETE FROM camp_campers WHERE camp_id = ? AND camper_id = ?",
+                [(camp.camp_id, cid) for cid in removed],
+            )
+
+        added = [c for cid, c in current.items() if cid not in old_ids]
+        if added:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO campers (camper_id, name, age, contact, medical_info) VALUES (?, ?, ?, ?, ?)",
+                [(c.camper_id, c.name, c.age, c.contact, c.medical_info) for c in added],
+            )
+            cursor.executemany(
+                "INSERT INTO camp_campers (camp_id, camper_id) VALUES (?, ?)",
+                [(camp.camp_id, c.camper_id) for c in added],
+            )
+
+    def _write_activity_changes(self, cursor, camp):
+        old_ids = self._persisted_ids(
+            cursor, camp, "activities", "SELECT id FROM scheduled_activities WHERE camp_id = ?"
+        )
+        current_ids = {a.activity_id for a in camp.activities if a.activity_id is not None}
+
+        removed = [(act_id,) for act_id in old_ids - current_ids]
+        if removed:
+            cursor.executemany("DELETE FROM activity_attendance WHERE scheduled_activity_id = ?", removed)
+            cursor.executemany("DELETE FROM scheduled_activities WHERE id = ?", removed)
+
+        for act in camp.activities:
+            if act.activity_id is None or act.activity_id not in old_ids:
                 cursor.execute(
                     "INSERT INTO scheduled_activities (camp_id, name, date, session, is_indoor) VALUES (?, ?, ?, ?, ?)",
                     (camp.camp_id, act.name, str(act.date), act.session.name, 1 if act.is_indoor else 0),
                 )
-                act_id = cursor.lastrowid
-                for cid in act.campers:
-                    cursor.execute(
-                        "INSERT INTO activity_attendance (scheduled_activity_id, camper_id) VALUES (?, ?)",
-                        (act_id, cid),
-                    )
+                act.activity_id = cursor.lastrowid
+                cursor.executemany(
+                    "INSERT INTO activity_attendance (scheduled_activity_id, camper_id) VALUES (?, ?)",
+                    [(act.activity_id, cid) for cid in act.campers],
+                )
+                continue
 
-            for eq in camp.equipment:
+            changed = act.changed_fields()
+            if changed - {"campers"}:
                 cursor.execute(
-                    """
-                    INSERT INTO equipment (resource_id, camp_id, name, target_quantity, current_quantity, condition)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        eq.resource_id,
-                        camp.camp_id,
-                        eq.name,
-                        eq.target_quantity,
-                        eq.current_quantity,
-                        eq.condition,
-                    ),
+                    "UPDATE scheduled_activities SET name=?, date=?, session=?, is_indoor=? WHERE id=?",
+                    (act.name, str(act.date), act.session.name, 1 if act.is_indoor else 0, act.activity_id),
                 )
+            if "campers" in changed:
+                self._write_attendance_changes(cursor, act)
 
-            conn.commit()
-        except Exception as exc:
-            logging.error(f"Error adding camp: {exc}")
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
-
-    def update(self, updated_camp: Camp):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
+    def _write_attendance_changes(self, cursor, act):
+        old_attendees = act.clean_value("campers")
+        if old_attendees is None:
             cursor.execute(
-                """
-                UPDATE camps
-                SET name=?, location=?, camp_type=?, start_date=?, end_date=?, camp_leader=?, food_per_camper_per_day=?, initial_food_stock=?, current_food_stock=?
-                WHERE camp_id=?
-                """,
-                (
-                    updated_camp.name,
-                    updated_camp.location,
-                    updated_camp.camp_type,
-                    str(updated_camp.start_date),
-                    str(updated_camp.end_date),
-                    updated_camp.camp_leader,
-                    updated_camp.food_per_camper_per_day,
-                    updated_camp.initial_food_stock,
-                    updated_camp.current_food_stock,
-                    updated_camp.camp_id,
-                ),
+                "SELECT camper_id FROM activity_attendance WHERE scheduled_activity_id = ?",
+                (act.activity_id,),
             )
+            old_attendees = {row[0] for row in cursor.fetchall()}
+        current = set(act.campers)
 
-            cursor.execute("DELETE FROM camp_campers WHERE camp_id = ?", (updated_camp.camp_id,))
-            for camper in updated_camp.campers:
-                cursor.execute(
-                    "SELECT camper_id FROM campers WHERE camper_id = ?",
-                    (camper.camper_id,),
-                )
-                if not cursor.fetchone():
-                    cursor.execute(
-                        "INSERT INTO campers (camper_id, name, age, contact, medical_info) VALUES (?, ?, ?, ?, ?)",
-                        (
-                            camper.camper_id,
-                            camper.name,
-                            camper.age,
-                            camper.contact,
-                            camper.medical_info,
-                        ),
-                    )
-                cursor.execute(
-                    "INSERT INTO camp_campers (camp_id, camper_id) VALUES (?, ?)",
-                    (updated_camp.camp_id, camper.camper_id),
-                )
+        cursor.executemany(
+            "DELETE FROM activity_attendance WHERE scheduled_activity_id = ? AND camper_id = ?",
+            [(act.activity_id, cid) for cid in old_attendees - current],
+        )
+        cursor.executemany(
+            "INSERT INTO activity_attendance (scheduled_activity_id, camper_id) VALUES (?, ?)",
+            [(act.activity_id, cid) for cid in current - old_attendees],
+        )
 
-            cursor.execute("SELECT id FROM scheduled_activities WHERE camp_id = ?", (updated_camp.camp_id,))
-            old_act_ids = [row[0] for row in cursor.fetchall()]
-            for act_id in old_act_ids:
-                cursor.execute("DELETE FROM activity_attendance WHERE scheduled_activity_id = ?", (act_id,))
-            cursor.execute("DELETE FROM scheduled_activities WHERE camp_id = ?", (updated_camp.camp_id,))
+    def _write_equipment_changes(self, cursor, camp):
+        old_ids = self._persisted_ids(
+            cursor, camp, "equipment", "SELECT resource_id FROM equipment WHERE camp_id = ?"
+        )
+        current_ids = {eq.resource_id for eq in camp.equipment}
 
-            for act in updated_camp.activities:
-                cursor.execute(
-                    "INSERT INTO scheduled_activities (camp_id, name, date, session, is_indoor) VALUES (?, ?, ?, ?, ?)",
-                    (updated_camp.camp_id, act.name, str(act.date), act.session.name, 1 if act.is_indoor else 0),
-                )
-                new_act_id = cursor.lastrowid
-                for cid in act.campers:
-                    cursor.execute(
-                        "INSERT INTO activity_attendance (scheduled_activity_id, camper_id) VALUES (?, ?)",
-                        (new_act_id, cid),
-                    )
+        removed = [(rid,) for rid in old_ids - current_ids]
+        if removed:
+            cursor.executemany("DELETE FROM equipment WHERE resource_id = ?", removed)
 
-            cursor.execute("DELETE FROM equipment WHERE camp_id = ?", (updated_camp.camp_id,))
-            for eq in updated_camp.equipment:
+        for eq in camp.equipment:
+            if eq.resource_id not in old_ids:
                 cursor.execute(
                     """
                     INSERT INTO equipment (resource_id, camp_id, name, target_quantity, current_quantity, condition)
@@ -273,91 +525,176 @@ class CampManager:
                     """,
                     (
                         eq.resource_id,
-                        updated_camp.camp_id,
+                        camp.camp_id,
                         eq.name,
                         eq.target_quantity,
                         eq.current_quantity,
                         eq.condition,
                     ),
                 )
+            elif eq.changed_fields():
+                cursor.execute(
+                    "UPDATE equipment SET name=?, target_quantity=?, current_quantity=?, condition=? WHERE resource_id=?",
+                    (eq.name, eq.target_quantity, eq.current_quantity, eq.condition, eq.resource_id),
+                )
 
-            conn.commit()
-        except Exception as exc:
-            logging.error(f"Error updating camp: {exc}")
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
-
-    def get_camp_by_id(self, camp_id):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT * FROM camps WHERE camp_id = ?", (camp_id,))
-            row = cursor.fetchone()
-            if not row:
-                return None
-            return self._build_camp_from_row(cursor, row)
-        except Exception as exc:
-            logging.error(f"Error getting camp by id: {exc}")
-            return None
-        finally:
-            conn.close()
-
-    def get_camps_by_leader(self, leader_username: str) -> list:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT * FROM camps WHERE camp_leader = ?", (leader_username,))
-            rows = cursor.fetchall()
-            return [self._build_camp_from_row(cursor, row) for row in rows]
-        except Exception as exc:
-            logging.error(f"Error getting camps by leader: {exc}")
-            return []
-        finally:
-            conn.close()
-
-    def get_global_activity_engagement(self) -> dict:
-        camps = self.read_all()
-        global_unique_campers = set()
-        activity_data = []
-
-        for camp in camps:
-            for camper in getattr(camp, "campers", []):
-                global_unique_campers.add(camper.name)
-
-            for act in getattr(camp, "activities", []):
-                act_name = act.get("name") if isinstance(act, dict) else getattr(act, "name", "Unknown")
-                camper_ids = act.get("camper_ids", []) if isinstance(act, dict) else getattr(act, "campers", [])
-                for cid in camper_ids:
-                    activity_data.append({"activity": act_name, "camper": cid})
-
-        total_unique = len(global_unique_campers)
-        if total_unique == 0 or not activity_data:
-            return {}
+    def get_camp_by_id(self, camp_id, lazy=False):
+        if self._in_unit_of_work():
+            camp = self.unit_of_work.get("camp", camp_id)
+            if camp is not None:
+                return camp
+        return self._get_one("SELECT * FROM camps WHERE camp_id = ?", (camp_id,), lazy)
 
-        try:
-            df = pd.DataFrame(activity_data)
-            engagement_series = df.groupby("activity")["camper"].nunique()
-            metrics = (engagement_series / total_unique).round(2).to_dict()
-            return metrics
-        except ImportError:
-            logging.error("Pandas not installed.")
-            return {}
-        except Exception as exc:
-            logging.error(f"Error in engagement calculation: {exc}")
-            return {}
+    def get_camps_by_leader(self, leader_username: str, lazy=False) -> list:
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT * FROM camps WHERE camp_leader = ?", (leader_username,))
+                rows = cursor.fetchall()
+                camp_ids_sql = "SELECT camp_id FROM camps WHERE camp_leader = ?"
+                if lazy:
+                    return self._identity_mapped(self._build_lazy_camps(rows, camp_ids_sql, (leader_username,)))
+                return self._identity_mapped(self._hydrate_camps(cursor, rows, camp_ids_sql, (leader_username,)))
+            except Exception as exc:
+                logging.error(f"Error getting camps by leader: {exc}")
+                return []
+
+    def list_summaries(self, leader_username=None) -> list:
+        """
+        One CampSummary per camp (optionally only one leader's camps) from a
+        single aggregate query; no child rows are loaded.
+        """
+        self._flush_pending()
+        where = "WHERE c.camp_leader = ?" if leader_username is not None else ""
+        params = (leader_username,) if leader_username is not None else ()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                rows = self._fetch_all(
+                    cursor,
+                    f"""
+                    SELECT c.camp_id, c.name, c.location, c.camp_type, c.start_date, c.end_date,
+                           c.camp_leader, c.food_per_camper_per_day, c.current_food_stock,
+                           COALESCE(st.camper_count, 0),
+                           (SELECT COUNT(*) FROM scheduled_activities sa WHERE sa.camp_id = c.camp_id),
+                           (SELECT COUNT(DISTINCT sa.date) FROM scheduled_activities sa
+                             WHERE sa.camp_id = c.camp_id AND sa.date BETWEEN c.start_date AND c.end_date)
+                    FROM camps c LEFT JOIN camp_stats st ON st.camp_id = c.camp_id
+                    {where}
+                    """,
+                    params,
+                )
+                return [CampSummary.from_row(row) for row in rows]
+            except Exception as exc:
+                logging.error(f"Error listing camp summaries: {exc}")
+                return []
+
+    def get_camp_stats(self, camp_id) -> dict:
+        """
+        Precomputed statistics for one camp from camp_stats, which triggers
+        keep current on roster, report and food stock writes.
+        """
+        self._flush_pending()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"SELECT {CAMP_STATS_COLUMNS} FROM camp_stats WHERE camp_id = ?", (camp_id,))
+                row = cursor.fetchone()
+            except Exception as exc:
+                logging.error(f"Error reading stats for camp {camp_id}: {exc}")
+                row = None
+        row = row or (0,) * 8
+        return {
+            "campers": row[0],
+            "reports": row[1],
+            "participation_total": row[2],
+            "average_participation": row[2] / row[1] if row[1] else 0,
+            "injured": row[3],
+            "activities": row[4],
+            "achievements": row[5],
+            "food_consumed": row[6],
+            "food_added": row[7],
+        }
+
+    def rebuild_camp_stats(self) -> int:
+        """Recompute camp_stats from the camps, rosters and reports; returns the camp count."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("DELETE FROM camp_stats WHERE camp_id NOT IN (SELECT camp_id FROM camps)")
+                cursor.execute(REBUILD_CAMP_STATS_SQL)
+                cursor.execute("SELECT COUNT(*) FROM camp_stats")
+                count = cursor.fetchone()[0]
+                conn.commit()
+                return count
+            except Exception as exc:
+                logging.error(f"Error rebuilding camp stats: {exc}")
+                conn.rollback()
+                raise
+
+    def get_global_activity_engagement(self, camp_id=None, start_date=None, end_date=None) -> dict:
+        """
+        Share of enrolled campers who attended each activity, by activity
+        name: {name: ratio rounded to 2 places}. Campers are counted once by
+        ID however many sessions they attended. camp_id limits both the
+        enrolment and the activities to one camp; start_date and end_date
+        (inclusive) limit the activities by date.
+
+        Results are cached until enrolment, scheduled activities or
+        attendance change.
+        """
+        self._flush_pending()
+        key = (camp_id, str(start_date) if start_date else None, str(end_date) if end_date else None)
+        return self.engagement_cache.get(key, lambda: self._load_activity_engagement(*key), copier=dict)
+
+    def _load_activity_engagement(self, camp_id, start_date, end_date) -> dict:
+        conditions, params = [], []
+        enrolled_scope = ""
+        if camp_id:
+            enrolled_scope = "WHERE camp_id = ?"
+            params.append(camp_id)
+            conditions.append("sa.camp_id = ?")
+            params.append(camp_id)
+        if start_date:
+            conditions.append("sa.date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("sa.date <= ?")
+            params.append(end_date)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self.db.connection() as conn:
+            try:
+                rows = conn.execute(
+                    f"""
+                    WITH enrolled AS (
+                        SELECT COUNT(DISTINCT camper_id) AS total FROM camp_campers {enrolled_scope}
+                    )
+                    SELECT sa.name, ROUND(COUNT(DISTINCT aa.camper_id) * 1.0 / NULLIF(enrolled.total, 0), 2)
+                    FROM scheduled_activities sa
+                    JOIN activity_attendance aa ON aa.scheduled_activity_id = sa.id
+                    CROSS JOIN enrolled
+                    {where}
+                    GROUP BY sa.name
+                    ORDER BY sa.name
+                    """,
+                    params,
+                ).fetchall()
+            except Exception as exc:
+                logging.error(f"Error in engagement calculation: {exc}")
+                return {}
+        return {name: ratio for name, ratio in rows if ratio is not None}
 
     def get_camp_overview_stats(self) -> dict:
-        camps = self.read_all()
+        camps = self.list_summaries()
         if not camps:
             return {"aggregates": {}, "details": []}
 
         data = []
         for camp in camps:
             leader = camp.camp_leader if camp.camp_leader else None
-            stock = getattr(camp, "current_food_stock", 0)
-            camper_count = len(getattr(camp, "campers", []))
+            stock = camp.current_food_stock or 0
+            camper_count = camp.camper_count
 
             data.append(
                 {
@@ -1,33 +1,184 @@
 import csv
+import heapq
 import os
 import logging
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from models.camper import Camper
-from models.camp import Camp
+from persistence.cache import CounterCache
+from persistence.db_context import DBContext
+from persistence.search import SEARCH_LIMIT, NGramIndex
+
+IMPORT_CHUNK_SIZE = 1000
+# Skipped rows beyond this are only counted, to keep results small for big files.
+MAX_IMPORT_WARNINGS = 100
+
+
+def _new_results():
+    return {
+        "imported_count": 0,
+        "skipped_count": 0,
+        "errors": [],
+        "warnings": []
+    }
+
+
+def _camper_from_row(row):
+    """(name, age, contact, medical_info) for a CSV row, or None if it has no name."""
+    name = (row.get("name") or "").strip()
+    if not name:
+        return None
+    age_raw = (row.get("age") or "").strip()
+    age = int(age_raw) if age_raw.isdigit() else 0
+    return name, age, (row.get("contact") or "").strip(), (row.get("medical_info") or "").strip()
+
+
+def _parse_roster(path):
+    """
+    Read and normalise one roster file; runs in a worker process.
+
+    Returns {"campers": [tuples], "duplicates": [names], "error": str or None},
+    keeping the first row for a name listed more than once.
+    """
+    parsed = {"campers": [], "duplicates": [], "error": None}
+    seen = set()
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                camper = _camper_from_row(row)
+                if camper is None:
+                    continue
+                key = camper[0].lower()
+                if key in seen:
+                    parsed["duplicates"].append(camper[0])
+                    continue
+                seen.add(key)
+                parsed["campers"].append(camper)
+    except Exception as exc:
+        parsed = {"campers": [], "duplicates": [], "error": str(exc)}
+    return parsed
+
 
 class CamperManager:
     """
-    Manages camper-related operations, primarily CSV importing.
+    Manages camper-related operations: CSV importing and camper search.
     """
     DEF_PATH = os.path.join("persistence", "data", "campers")
 
-    def __init__(self):
+    def __init__(self, db_context=None):
+        self.db = db_context or DBContext()
+        self.search_cache = CounterCache(self.db, "camper_search")
         if not os.path.exists(self.DEF_PATH):
             os.makedirs(self.DEF_PATH, exist_ok=True)
 
-    def get_available_csv_files(self):
-        """Returns a list of .csv filenames available for import."""
-        if not os.path.exists(self.DEF_PATH):
+    def search(self, text, leader_username=None, limit=SEARCH_LIMIT):
+        """
+        Find campers whose name or contact contains text (case-insensitive),
+        optionally only in camps led by leader_username.
+
+        Returns (camp_name, Camper) tuples, best match first: exact names,
+        then names starting with text, then other name matches, then contact
+        matches. Lookups go through an in-memory n-gram index of the leader's
+        campers, rebuilt only after campers, enrolments or camp names and
+        leaders have changed.
+        """
+        needle = (text or "").strip().lower()
+        try:
+            index = self.search_cache.get(
+                leader_username,
+                lambda: self._build_search_index(leader_username),
+                copier=None,
+            )
+        except Exception as exc:
+            logging.error(f"Error searching campers: {exc}")
+            return []
+
+        def rank(row):
+            name = row[6]
+            if name == needle:
+                return 0, name
+            if name.startswith(needle):
+                return 1, name
+            return (2 if needle in name else 3), name
+
+        matches = heapq.nsmallest(limit, index.search(needle), key=rank)
+        return [
+            (
+                row[5],
+                Camper.from_dict(
+                    {"camper_id": row[0], "name": row[1], "age": row[2], "contact": row[3], "medical_info": row[4]}
+                ),
+            )
+            for row in matches
+        ]
+
+    def _build_search_index(self, leader_username):
+        leader_filter = "WHERE k.camp_leader = ?" if leader_username is not None else ""
+        params = (leader_username,) if leader_username is not None else ()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"""
+                    SELECT c.camper_id, c.name, c.age, c.contact, c.medical_info, k.name
+                    FROM camps k
+                    JOIN camp_campers cc ON cc.camp_id = k.camp_id
+                    JOIN campers c ON c.camper_id = cc.camper_id
+                    {leader_filter}
+                    """,
+                    params,
+                )
+                # Keep the lowercased name alongside each row for ranking.
+                rows = [(*row, row[1].lower()) for row in cursor.fetchall()]
+            except Exception as exc:
+                logging.error(f"Error loading campers for search: {exc}")
+                raise
+        return NGramIndex(rows, texts=lambda row: (row[1], row[3]))
+
+    def get_available_csv_files(self, directory=None):
+        """Returns a sorted list of .csv filenames available for import (in DEF_PATH by default)."""
+        directory = directory or self.DEF_PATH
+        if not os.path.isdir(directory):
             return []
-        return [f for f in os.listdir(self.DEF_PATH) if f.endswith(".csv")]
+        return sorted(f for f in os.listdir(directory) if f.endswith(".csv"))
 
-    def import_campers_from_csv(self, camp, filename, context):
+    @staticmethod
+    def match_roster_files(filenames, camps):
+        """
+        Pair roster files with camps by name: "lake_side.csv" matches a camp
+        called "Lake Side" (case, underscores and hyphens are ignored).
+
+        Returns (matched, unmatched): a list of (camp, filename) pairs and a
+        list of filenames that match no camp.
+        """
+        def key(text):
+            return " ".join(text.replace("_", " ").replace("-", " ").lower().split())
+
+        by_name = {key(camp.name): camp for camp in camps}
+        matched, unmatched = [], []
+        for filename in filenames:
+            camp = by_name.get(key(os.path.splitext(os.path.basename(filename))[0]))
+            if camp is None:
+                unmatched.append(filename)
+            else:
+                matched.append((camp, filename))
+        return matched, unmatched
+
+    def import_campers_from_csv(self, camp, filename, context=None, progress=None, chunk_size=IMPORT_CHUNK_SIZE):
         """
         Imports campers from a CSV file into the given camp.
-        
+
+        The file is streamed and inserted chunk by chunk with executemany in a
+        single transaction, so memory grows with the set of names rather than
+        the file. Names are checked against one query of the campers already
+        in this camp or any camp whose dates overlap it.
+
         Args:
-            camp (Camp): The target camp object.
-            filename (str): Name of the file (e.g. "campers.csv").
-            context (AppContext): For accessing camp_manager to read other camps for validation.
+            camp (Camp): The target camp (only camp_id and dates are used; reload it to see the new campers).
+            filename (str): Name of the file (e.g. "campers.csv"), or a full path.
+            context (AppContext): Optional; pending unit-of-work changes are flushed first and the camp evicted after.
+            progress (callable): Optional progress(rows_read, imported_count), called after each chunk.
+            chunk_size (int): Rows per executemany batch.
 
         Returns:
             dict: {
@@ -37,123 +188,309 @@ class CamperManager:
                 "warnings": list[str]
             }
         """
-        results = {
-            "imported_count": 0,
-            "skipped_count": 0,
-            "errors": [],
-            "warnings": []
-        }
-        
+        results = _new_results()
         csv_path = os.path.join(self.DEF_PATH, filename)
+        unit_of_work = getattr(context, "unit_of_work", None)
+        if unit_of_work is not None:
+            unit_of_work.flush()
 
-        # Identify conflicting camps
-        all_camps = context.camp_manager.read_all()
-        conflicting_camps = []
-        for other_camp in all_camps:
-            if other_camp.camp_id == camp.camp_id:
-                continue
-            if Camp.dates_overlap(camp.start_date, camp.end_date, other_camp.start_date, other_camp.end_date):
-                conflicting_camps.append(other_camp)
-
-        try:
+        def rows():
             with open(csv_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                
-                for row in reader:
-                    name = row.get("name")
-                    if not name:
-                        continue
+                for row in csv.DictReader(f):
+                    yield _camper_from_row(row)
+
+        self._store_campers(camp, rows(), results, progress, chunk_size)
+        self._finish(results, camp, unit_of_work)
+        return results
+
+    def import_campers_bulk(self, assignments, context=None, max_workers=None):
+        """
+        Imports several roster files, each into its own camp.
+
+        Files are read and normalised in a process pool (age coercion,
+        trimmed fields, duplicates within a file). Names are then checked and
+        inserted here one file at a time, in the order given, with a commit
+        per file; a camper listed for two overlapping camps therefore goes to
+        the first and is skipped for the second.
+
+        Args:
+            assignments (list): (camp, filename) pairs; filenames may be full paths.
+            context (AppContext): Optional, as for import_campers_from_csv.
+            max_workers (int): Pool size; 1 parses in this process.
+
+        Returns:
+            dict: {
+                "files": list of per-file results, each with "file" and "camp" added,
+                "imported_count": int,
+                "skipped_count": int,
+                "error_count": int
+            }
+        """
+        unit_of_work = getattr(context, "unit_of_work", None)
+        if unit_of_work is not None:
+            unit_of_work.flush()
+
+        paths = [os.path.join(self.DEF_PATH, filename) for _, filename in assignments]
+        if len(paths) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                rosters = list(pool.map(_parse_roster, paths))
+        else:
+            rosters = [_parse_roster(path) for path in paths]
+
+        report = {"files": [], "imported_count": 0, "skipped_count": 0, "error_count": 0}
+        for (camp, filename), roster in zip(assignments, rosters):
+            results = {"file": os.path.basename(filename), "camp": camp.name, **_new_results()}
+            if roster["error"]:
+                results["errors"].append(f"CSV Error: {roster['error']}")
+            else:
+                for name in roster["duplicates"]:
+                    self._skip(results, f"Skipping '{name}': Listed more than once in this file.")
+                self._store_campers(camp, roster["campers"], results)
+            self._finish(results, camp, unit_of_work)
 
-                    # Check if already in current camp
-                    if any(c.name.lower() == name.lower() for c in camp.campers):
-                        results["warnings"].append(f"Skipping '{name}': Already registered in this camp.")
-                        results["skipped_count"] += 1
+            report["files"].append(results)
+            report["imported_count"] += results["imported_count"]
+            report["skipped_count"] += results["skipped_count"]
+            report["error_count"] += len(results["errors"])
+        return report
+
+    def _store_campers(self, camp, campers, results, progress=None, chunk_size=IMPORT_CHUNK_SIZE):
+        """
+        Insert normalised camper tuples (None for rows without a name) into
+        camp in one transaction, skipping names already registered.
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                registered = self._registered_names(cursor, camp)
+                rows_read = 0
+                chunk = []
+                for camper in campers:
+                    rows_read += 1
+                    if camper is None:
                         continue
-                        
-                    # Check overlapping camps
-                    conflict_found = False
-                    for other_camp in conflicting_camps:
-                        if any(c.name.lower() == name.lower() for c in other_camp.campers):
-                            results["warnings"].append(f"Skipping '{name}': Already registered in overlapping camp '{other_camp.name}'.")
-                            conflict_found = True
-                            break
-                    
-                    if conflict_found:
-                        results["skipped_count"] += 1
+
+                    name = camper[0]
+                    key = name.lower()
+                    if key in registered:
+                        other_camp = registered[key]
+                        if other_camp is None:
+                            self._skip(results, f"Skipping '{name}': Already registered in this camp.")
+                        else:
+                            self._skip(results, f"Skipping '{name}': Already registered in overlapping camp '{other_camp}'.")
                         continue
 
-                    # Create Camper
-                    age_raw = row.get("age")
-                    age = int(age_raw) if age_raw and age_raw.isdigit() else 0
-
-                    new_camper = Camper(
-                        name=name,
-                        age=age,
-                        contact=row.get("contact") or "",
-                        medical_info=row.get("medical_info") or ""
-                    )
-                    camp.campers.append(new_camper)
-                    results["imported_count"] += 1
-            
-            # Persist changes
-            if results["imported_count"] > 0:
-                context.camp_manager.update(camp)
-
-        except Exception as e:
-            results["errors"].append(f"CSV Error: {str(e)}")
-            logging.error(f"Error importing campers CSV: {e}")
+                    registered[key] = None
+                    chunk.append((str(uuid.uuid4()), *camper))
+                    if len(chunk) >= chunk_size:
+                        self._insert_campers(cursor, camp.camp_id, chunk)
+                        results["imported_count"] += len(chunk)
+                        chunk.clear()
+                        if progress:
+                            progress(rows_read, results["imported_count"])
 
-        return results
+                if chunk:
+                    self._insert_campers(cursor, camp.camp_id, chunk)
+                    results["imported_count"] += len(chunk)
+                conn.commit()
+                if progress:
+                    progress(rows_read, results["imported_count"])
+            except Exception as e:
+                conn.rollback()
+                results["imported_count"] = 0
+                results["errors"].append(f"CSV Error: {str(e)}")
+                logging.error(f"Error importing campers CSV: {e}")
 
-    def import_roster_to_activity(self, activity_data, filename, camp):
+    @staticmethod
+    def _finish(results, camp, unit_of_work):
+        hidden = results["skipped_count"] - MAX_IMPORT_WARNINGS
+        if hidden > 0:
+            results["warnings"].append(f"... and {hidden} more rows skipped.")
+        if unit_of_work is not None:
+            unit_of_work.evict("camp", camp.camp_id)
+
+    @staticmethod
+    def _registered_names(cursor, camp):
+        """
+        Map each lowercased camper name in this camp or an overlapping camp to
+        the camp it blocks: None for this camp, otherwise the other camp's name.
+        CROSS JOIN keeps camps (narrowed by idx_camps_dates) as the outer loop.
         """
-        Imports a list of camper names from CSV and assigns them to the activity.
-        Must match existing campers in the camp.
+        cursor.execute(
+            """
+            SELECT k.camp_id, k.name, c.name
+            FROM camps k
+            CROSS JOIN camp_campers cc ON cc.camp_id = k.camp_id
+            JOIN campers c ON c.camper_id = cc.camper_id
+            WHERE k.start_date <= ? AND k.end_date >= ?
+            """,
+            (str(camp.end_date), str(camp.start_date)),
+        )
+        registered = {}
+        for camp_id, camp_name, camper_name in cursor:
+            key = camper_name.lower()
+            if camp_id == camp.camp_id:
+                registered[key] = None
+            else:
+                registered.setdefault(key, camp_name)
+        return registered
+
+    @staticmethod
+    def _insert_campers(cursor, camp_id, rows):
+        cursor.executemany(
+            "INSERT INTO campers (camper_id, name, age, contact, medical_info) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        cursor.executemany(
+            "INSERT INTO camp_campers (camp_id, camper_id) VALUES (?, ?)",
+            [(camp_id, row[0]) for row in rows],
+        )
+
+    @staticmethod
+    def _skip(results, warning):
+        results["skipped_count"] += 1
+        if len(results["warnings"]) < MAX_IMPORT_WARNINGS:
+            results["warnings"].append(warning)
+
+    def import_roster_to_activities(self, camp, filename, activity_ids=None, context=None, chunk_size=IMPORT_CHUNK_SIZE):
         """
-        results = {
-            "imported_count": 0,
-            "skipped_count": 0,
-            "errors": [],
-            "warnings": []
-        }
-        
+        Imports an attendance roster from CSV into scheduled activities of a camp.
+
+        The CSV needs a 'name' column, matched case-insensitively against the
+        camp's campers through an index built once. An optional 'activity'
+        column sends a row only to the selected activities of that name;
+        rows without one go to every selected activity. Attendance rows are
+        written with executemany in a single transaction.
+
+        Args:
+            camp (Camp): The camp whose campers and activities are matched.
+            filename (str): Name of the file in DEF_PATH, or a full path.
+            activity_ids (list): scheduled activity ids to fill; None for all of the camp's activities.
+            context (AppContext): Optional; pending unit-of-work changes are flushed first and the camp evicted after.
+            chunk_size (int): Rows per executemany batch.
+
+        Returns:
+            dict: {
+                "activities": list of {"activity_id", "name", "date", "session",
+                                       "imported_count", "skipped_count"} in schedule order,
+                "skipped_count": int (rows naming an unknown camper or activity),
+                "errors": list[str],
+                "warnings": list[str]
+            }
+        """
+        results = {"activities": [], "skipped_count": 0, "errors": [], "warnings": []}
         csv_path = os.path.join(self.DEF_PATH, filename)
-        
-        try:
-            with open(csv_path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                
-                # Check for 'name' column
-                if reader.fieldnames and 'name' not in reader.fieldnames:
-                     results["errors"].append("CSV missing 'name' column header.")
-                     return results
-
-                current_roster = set(activity_data.get('camper_ids', []))
-                
-                for row in reader:
-                    name = row.get("name")
-                    if not name: continue
-                    
-                    # 1. Find camper in Camp
-                    camper_obj = next((c for c in camp.campers if c.name.lower() == name.lower()), None)
-                    
-                    if not camper_obj:
-                        results["warnings"].append(f"Skipped '{name}': Not found in this camp.")
-                        results["skipped_count"] += 1
-                        continue
-                        
-                    # 2. Check if already in Activity
-                    if camper_obj.name in current_roster:
-                        results["skipped_count"] += 1
+        unit_of_work = getattr(context, "unit_of_work", None)
+        if unit_of_work is not None:
+            unit_of_work.flush()
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT id, name, date, session FROM scheduled_activities WHERE camp_id = ? ORDER BY date, id",
+                    (camp.camp_id,),
+                )
+                selected = None if activity_ids is None else set(activity_ids)
+                per_activity = {}
+                by_name = {}
+                for activity_id, name, date, session in cursor.fetchall():
+                    if selected is not None and activity_id not in selected:
                         continue
-                        
-                    # 3. Add to Activity
-                    activity_data['camper_ids'].append(camper_obj.name)
-                    current_roster.add(camper_obj.name)
-                    results["imported_count"] += 1
-                    
-        except Exception as e:
-             results["errors"].append(f"CSV Error: {str(e)}")
-             logging.error(f"Error importing roster: {e}")
-             
+                    per_activity[activity_id] = {
+                        "activity_id": activity_id,
+                        "name": name,
+                        "date": date,
+                        "session": session,
+                        "imported_count": 0,
+                        "skipped_count": 0,
+                    }
+                    by_name.setdefault(name.casefold(), []).append(activity_id)
+                results["activities"] = list(per_activity.values())
+                if not per_activity:
+                    results["errors"].append("No matching activities scheduled for this camp.")
+                    return results
+
+                cursor.execute(
+                    """
+                    SELECT c.name, c.camper_id
+                    FROM camp_campers cc JOIN campers c ON c.camper_id = cc.camper_id
+                    WHERE cc.camp_id = ?
+                    """,
+                    (camp.camp_id,),
+                )
+                camper_index = {}
+                for name, camper_id in cursor.fetchall():
+                    camper_index.setdefault(name.casefold(), camper_id)
+
+                cursor.execute(
+                    """
+                    SELECT aa.scheduled_activity_id, aa.camper_id
+                    FROM scheduled_activities sa
+                    CROSS JOIN activity_attendance aa ON aa.scheduled_activity_id = sa.id
+                    WHERE sa.camp_id = ?
+                    """,
+                    (camp.camp_id,),
+                )
+                attending = set(cursor.fetchall())
+
+                chunk = []
+                with open(csv_path, newline="", encoding="utf-8") as f:
+                    reader = csv.DictReader(f)
+                    if not reader.fieldnames or "name" not in reader.fieldnames:
+                        results["errors"].append("CSV missing 'name' column header.")
+                        return results
+
+                    all_selected = list(per_activity)
+                    for row in reader:
+                        name = (row.get("name") or "").strip()
+                        if not name:
+                            continue
+
+                        camper_id = camper_index.get(name.casefold())
+                        if camper_id is None:
+                            self._skip(results, f"Skipped '{name}': Not found in this camp.")
+                            continue
+
+                        activity_name = (row.get("activity") or "").strip()
+                        targets = by_name.get(activity_name.casefold()) if activity_name else all_selected
+                        if not targets:
+                            self._skip(results, f"Skipped '{name}': No selected activity named '{activity_name}'.")
+                            continue
+
+                        for activity_id in targets:
+                            if (activity_id, camper_id) in attending:
+                                per_activity[activity_id]["skipped_count"] += 1
+                                continue
+                            attending.add((activity_id, camper_id))
+                            chunk.append((activity_id, camper_id))
+                            per_activity[activity_id]["imported_count"] += 1
+
+                        if len(chunk) >= chunk_size:
+                            self._insert_attendance(cursor, chunk)
+                            chunk.clear()
+
+                if chunk:
+                    self._insert_attendance(cursor, chunk)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                for activity in results["activities"]:
+                    activity["imported_count"] = 0
+                results["errors"].append(f"CSV Error: {str(e)}")
+                logging.error(f"Error importing roster: {e}")
+            finally:
+                if unit_of_work is not None:
+                    unit_of_work.evict("camp", camp.camp_id)
+
+        hidden = results["skipped_count"] - MAX_IMPORT_WARNINGS
+        if hidden > 0:
+            results["warnings"].append(f"... and {hidden} more rows skipped.")
         return results
+
+    @staticmethod
+    def _insert_attendance(cursor, rows):
+        cursor.executemany(
+            "INSERT INTO activity_attendance (scheduled_activity_id, camper_id) VALUES (?, ?)",
+            rows,
+        )
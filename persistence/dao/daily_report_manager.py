@@ -2,97 +2,180 @@ import json
 import logging
 from datetime import datetime
 from persistence.db_context import DBContext
+from persistence.search import SEARCH_LIMIT, snippet_sql, to_match_query
+
+
+# Figures copied out of the JSON payload into their own columns for SQL aggregates.
+STAT_COLUMNS = ("daily_participation", "injury", "injured_count", "activity_count", "achievement_count")
+
+INSERT_REPORT_SQL = f"""
+    INSERT INTO daily_reports (report_id, camp_id, date, content, created_at, {", ".join(STAT_COLUMNS)})
+    VALUES (?, ?, ?, ?, ?, {", ".join("?" * len(STAT_COLUMNS))})
+"""
+
+
+def report_stat_values(report_dict):
+    """STAT_COLUMNS values for a report payload; missing or bad figures count as 0."""
+    def as_int(value):
+        try:
+            return int(value or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    return (
+        as_int(report_dict.get("daily_participation")),
+        1 if report_dict.get("injury") else 0,
+        as_int(report_dict.get("injured_count")),
+        len(report_dict.get("activities") or []),
+        len(report_dict.get("achievements") or []),
+    )
+
+
+def report_insert_params(report_dict):
+    """Parameters for INSERT_REPORT_SQL from a report payload."""
+    return (
+        report_dict.get("report_id") or report_dict.get("id"),
+        report_dict.get("camp_id"),
+        report_dict.get("date"),
+        json.dumps(report_dict, ensure_ascii=False),
+        report_dict.get("created_at") or datetime.now().isoformat(),
+        *report_stat_values(report_dict),
+    )
 
 
 class DailyReportManager:
-    """SQLite-backed daily reports with JSON payload stored in content column."""
+    """
+    SQLite-backed daily reports with JSON payload stored in content column.
+
+    The figures statistics need are also stored in STAT_COLUMNS so they can
+    be aggregated per camp without parsing any JSON.
+    """
 
     def __init__(self, db_context=None):
         self.db = db_context or DBContext()
 
-    def _serialize(self, report_dict):
-        return json.dumps(report_dict, ensure_ascii=False)
-
     def _deserialize(self, content):
         try:
             return json.loads(content)
         except Exception:
             return {"content": content}
 
-    def read_all(self):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "SELECT report_id, camp_id, date, content, created_at FROM daily_reports ORDER BY date DESC"
-            )
-            rows = cursor.fetchall()
-            reports = []
-            for row in rows:
-                payload = self._deserialize(row[3])
-                payload.update(
-                    {
-                        "report_id": row[0],
-                        "camp_id": row[1],
-                        "date": row[2],
-                        "created_at": row[4],
-                    }
-                )
-                reports.append(payload)
-            return reports
-        except Exception as exc:
-            logging.error(f"Error reading daily reports: {exc}")
-            return []
-        finally:
-            conn.close()
+    def _report_from_row(self, row):
+        payload = self._deserialize(row[3])
+        payload.update(
+            {
+                "report_id": row[0],
+                "camp_id": row[1],
+                "date": row[2],
+                "created_at": row[4],
+            }
+        )
+        return payload
 
-    def save_all(self, reports):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("DELETE FROM daily_reports")
-            for report in reports:
+    def _query_reports(self, where, params, suffix=""):
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
                 cursor.execute(
-                    "INSERT INTO daily_reports (report_id, camp_id, date, content, created_at) VALUES (?, ?, ?, ?, ?)",
-                    (
-                        report.get("report_id") or report.get("id"),
-                        report.get("camp_id"),
-                        report.get("date"),
-                        self._serialize(report),
-                        report.get("created_at") or datetime.now().isoformat(),
-                    ),
+                    f"SELECT report_id, camp_id, date, content, created_at FROM daily_reports {where} {suffix}",
+                    params,
                 )
-            conn.commit()
-        except Exception as exc:
-            logging.error(f"Error saving daily reports: {exc}")
-            raise
-        finally:
-            conn.close()
+                rows = cursor.fetchall()
+            except Exception as exc:
+                logging.error(f"Error reading daily reports: {exc}")
+                return []
+        return [self._report_from_row(row) for row in rows]
 
-    def add_report(self, report_dict):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "INSERT INTO daily_reports (report_id, camp_id, date, content, created_at) VALUES (?, ?, ?, ?, ?)",
-                (
-                    report_dict.get("report_id") or report_dict.get("id"),
-                    report_dict.get("camp_id"),
-                    report_dict.get("date"),
-                    self._serialize(report_dict),
-                    report_dict.get("created_at") or datetime.now().isoformat(),
-                ),
-            )
-            conn.commit()
-        except Exception as exc:
-            logging.error(f"Error adding daily report: {exc}")
-            raise
-        finally:
-            conn.close()
+    def read_all(self):
+        return self._query_reports("", (), "ORDER BY date DESC")
 
+    def get_reports_for_camp(self, camp_id, limit=None, offset=0):
+        """
+        One camp's reports, newest first (by date, then creation time).
+        Pass limit/offset to page through them.
+        """
+        params = [camp_id]
+        page = ""
+        if limit is not None:
+            page = "LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        return self._query_reports("WHERE camp_id = ?", params, f"ORDER BY date DESC, created_at DESC {page}")
 
+    def get_reports_between(self, camp_id, start_date, end_date):
+        """One camp's reports dated start_date..end_date (inclusive, ISO dates), newest first."""
+        return self._query_reports(
+            "WHERE camp_id = ? AND date BETWEEN ? AND ?",
+            (camp_id, str(start_date), str(end_date)),
+            "ORDER BY date DESC, created_at DESC",
+        )
 
-    
+    def delete_report(self, report_id):
+        """Delete one report; returns False if it did not exist."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("DELETE FROM daily_reports WHERE report_id = ?", (report_id,))
+                conn.commit()
+                return cursor.rowcount > 0
+            except Exception as exc:
+                logging.error(f"Error deleting daily report {report_id}: {exc}")
+                raise
 
+    def save_all(self, reports):
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("DELETE FROM daily_reports")
+                for report in reports:
+                    cursor.execute(INSERT_REPORT_SQL, report_insert_params(report))
+                conn.commit()
+            except Exception as exc:
+                logging.error(f"Error saving daily reports: {exc}")
+                raise
 
+    def add_report(self, report_dict):
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(INSERT_REPORT_SQL, report_insert_params(report_dict))
+                conn.commit()
+            except Exception as exc:
+                logging.error(f"Error adding daily report: {exc}")
+                raise
 
+
+
+    
+
+    def search(self, text, camp_ids=None, limit=SEARCH_LIMIT):
+        """
+        Full-text search over report text and incident details, best match
+        first, optionally limited to camp_ids. Results are report dicts as
+        returned by read_all plus a 'snippet'.
+        """
+        query = to_match_query(text)
+        if not query or camp_ids == []:
+            return []
+        camp_filter, params = "", [query]
+        if camp_ids is not None:
+            camp_filter = f"AND r.camp_id IN ({','.join(['?'] * len(camp_ids))})"
+            params.extend(camp_ids)
+        params.append(limit)
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"""
+                    SELECT r.report_id, r.camp_id, r.date, r.content, r.created_at, {snippet_sql("daily_reports_fts")}
+                    FROM daily_reports_fts JOIN daily_reports r ON r.rowid = daily_reports_fts.rowid
+                    WHERE daily_reports_fts MATCH ? {camp_filter}
+                    ORDER BY rank
+                    LIMIT ?
+                    """,
+                    params,
+                )
+                rows = cursor.fetchall()
+            except Exception as exc:
+                logging.error(f"Error searching daily reports: {exc}")
+                return []
+        return [{**self._report_from_row(row), "snippet": row[5]} for row in rows]
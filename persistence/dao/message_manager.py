@@ -1,194 +1,403 @@
 import logging
-from collections import defaultdict
 from persistence.db_context import DBContext
+from persistence.search import SEARCH_LIMIT, snippet_sql, to_match_query
+
+
+MESSAGE_COLUMNS = "message_id, from_user, to_user, content, sent_at, mark_as_read"
+JOINED_MESSAGE_COLUMNS = ", ".join(f"m.{column}" for column in MESSAGE_COLUMNS.split(", "))
+
+REBUILD_CONVERSATIONS_SQL = """
+    INSERT INTO conversations (user_low, user_high, last_message_id, last_sent_at, unread_low, unread_high)
+    SELECT user_low, user_high,
+           MAX(CASE WHEN position = 1 THEN message_id END),
+           MAX(CASE WHEN position = 1 THEN sent_at END),
+           SUM(to_user = user_low AND mark_as_read = 0),
+           SUM(to_user <> user_low AND mark_as_read = 0)
+    FROM (
+        SELECT message_id, sent_at, to_user, mark_as_read,
+               MIN(from_user, to_user) AS user_low, MAX(from_user, to_user) AS user_high,
+               ROW_NUMBER() OVER (
+                   PARTITION BY MIN(from_user, to_user), MAX(from_user, to_user)
+                   ORDER BY sent_at DESC, message_id DESC
+               ) AS position
+        FROM messages
+        WHERE from_user IS NOT NULL AND to_user IS NOT NULL
+    )
+    GROUP BY user_low, user_high
+"""
 
 
 class MessageManager:
-    """SQLite-backed message persistence."""
+    """
+    SQLite-backed message persistence.
+
+    Every write also maintains the conversations table (one row per pair of
+    users with the last message and unread counts) in the same transaction,
+    so the inbox is read without touching messages in bulk.
+    """
+
+    THREAD_PAGE_SIZE = 20
 
     def __init__(self, db_context=None):
         self.db = db_context or DBContext()
 
     def read_all(self):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "SELECT message_id, from_user, to_user, content, sent_at, mark_as_read FROM messages"
-            )
-            rows = cursor.fetchall()
-            return [
-                {
-                    "message_id": row[0],
-                    "from_user": row[1],
-                    "to_user": row[2],
-                    "content": row[3],
-                    "sent_at": row[4],
-                    "mark_as_read": bool(row[5]),
-                }
-                for row in rows
-            ]
-        except Exception as exc:
-            logging.error(f"Error reading messages: {exc}")
-            return []
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"SELECT {MESSAGE_COLUMNS} FROM messages"
+                )
+                rows = cursor.fetchall()
+                return [self._message_from_row(row) for row in rows]
+            except Exception as exc:
+                logging.error(f"Error reading messages: {exc}")
+                return []
 
     def add(self, message):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                """
-                INSERT INTO messages (message_id, from_user, to_user, content, sent_at, mark_as_read)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    message.get("message_id"),
-                    message.get("from_user"),
-                    message.get("to_user"),
-                    message.get("content"),
-                    message.get("sent_at"),
-                    1 if message.get("mark_as_read") else 0,
-                ),
-            )
-            conn.commit()
-        except Exception as exc:
-            logging.error(f"Error adding message: {exc}")
-            raise
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO messages (message_id, from_user, to_user, content, sent_at, mark_as_read)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        message.get("message_id"),
+                        message.get("from_user"),
+                        message.get("to_user"),
+                        message.get("content"),
+                        message.get("sent_at"),
+                        1 if message.get("mark_as_read") else 0,
+                    ),
+                )
+                self._record_message(cursor, message)
+                conn.commit()
+            except Exception as exc:
+                logging.error(f"Error adding message: {exc}")
+                raise
 
     def update(self, updated_message):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                """
-                UPDATE messages
-                SET from_user=?, to_user=?, content=?, sent_at=?, mark_as_read=?
-                WHERE message_id=?
-                """,
-                (
-                    updated_message.get("from_user"),
-                    updated_message.get("to_user"),
-                    updated_message.get("content"),
-                    updated_message.get("sent_at"),
-                    1 if updated_message.get("mark_as_read") else 0,
-                    updated_message.get("message_id"),
-                ),
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT from_user, to_user FROM messages WHERE message_id = ?",
+                    (updated_message.get("message_id"),),
+                )
+                previous = cursor.fetchone()
+                cursor.execute(
+                    """
+                    UPDATE messages
+                    SET from_user=?, to_user=?, content=?, sent_at=?, mark_as_read=?
+                    WHERE message_id=?
+                    """,
+                    (
+                        updated_message.get("from_user"),
+                        updated_message.get("to_user"),
+                        updated_message.get("content"),
+                        updated_message.get("sent_at"),
+                        1 if updated_message.get("mark_as_read") else 0,
+                        updated_message.get("message_id"),
+                    ),
+                )
+                if cursor.rowcount == 0:
+                    self.add(updated_message)
+                else:
+                    # Any field may have changed, including who the message is between.
+                    pairs = {
+                        self._pair(*previous),
+                        self._pair(updated_message.get("from_user"), updated_message.get("to_user")),
+                    }
+                    for user_low, user_high in pairs:
+                        self._refresh_conversation(cursor, user_low, user_high)
+                    conn.commit()
+            except Exception as exc:
+                logging.error(f"Error updating message: {exc}")
+                raise
+
+    def get_thread(self, user_a: str, user_b: str, before=None, limit: int = THREAD_PAGE_SIZE) -> list:
+        """
+        Return up to limit messages between user_a and user_b, oldest first.
+
+        Without before this is the newest page of the chat. To load older
+        history pass before=(sent_at, message_id) of the oldest message
+        already shown. Each direction of the chat is read as its own index
+        range, so a page costs the same however long the history is.
+        """
+        if before is None:
+            keyset, keyset_params = "", ()
+        else:
+            # Row-value comparison so SQLite seeks straight to the keyset in the index.
+            keyset = "AND (sent_at, message_id) < (?, ?)"
+            keyset_params = (before[0], before[1])
+
+        direction = f"""
+            SELECT * FROM (
+                SELECT {MESSAGE_COLUMNS} FROM messages
+                WHERE from_user = ? AND to_user = ? {keyset}
+                ORDER BY sent_at DESC, message_id DESC
+                LIMIT ?
             )
-            if cursor.rowcount == 0:
-                self.add(updated_message)
-            else:
+        """
+        query = f"""
+            SELECT * FROM ({direction} UNION ALL {direction})
+            ORDER BY sent_at DESC, message_id DESC
+            LIMIT ?
+        """
+        params = (
+            (user_a, user_b, *keyset_params, limit)
+            + (user_b, user_a, *keyset_params, limit)
+            + (limit,)
+        )
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+            except Exception as exc:
+                logging.error(f"Error loading chat between {user_a} and {user_b}: {exc}")
+                return []
+        return [self._message_from_row(row) for row in reversed(rows)]
+
+    def search(self, username: str, text: str, limit: int = SEARCH_LIMIT) -> list:
+        """
+        Full-text search over messages username sent or received, best match
+        first. Each result carries a 'snippet' with the matched terms marked.
+        """
+        query = to_match_query(text)
+        if not query:
+            return []
+        # The user's own messages are picked out inside the index, so only
+        # they are matched and ranked (rank is bm25() over the text). The
+        # column filter compares tokens; the SQL filter keeps exact names.
+        user_terms = to_match_query(username).replace("*", "")
+        if user_terms:
+            query = f"content : ({query}) AND {{from_user to_user}} : ({user_terms})"
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"""
+                    SELECT {JOINED_MESSAGE_COLUMNS}, {snippet_sql("messages_fts", column=0)}
+                    FROM messages_fts JOIN messages m ON m.rowid = messages_fts.rowid
+                    WHERE messages_fts MATCH ? AND (m.from_user = ? OR m.to_user = ?)
+                    ORDER BY rank
+                    LIMIT ?
+                    """,
+                    (query, username, username, limit),
+                )
+                rows = cursor.fetchall()
+            except Exception as exc:
+                logging.error(f"Error searching messages: {exc}")
+                return []
+        return [{**self._message_from_row(row), "snippet": row[6]} for row in rows]
+
+    def mark_thread_as_read(self, reader: str, partner: str):
+        """Mark every message partner sent to reader as read."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "UPDATE messages SET mark_as_read = 1 WHERE to_user = ? AND mark_as_read = 0 AND from_user = ?",
+                    (reader, partner),
+                )
+                user_low, user_high = self._pair(reader, partner)
+                cursor.execute(
+                    f"UPDATE conversations SET {self._unread_column(reader, user_low)} = 0 WHERE user_low = ? AND user_high = ?",
+                    (user_low, user_high),
+                )
                 conn.commit()
-        except Exception as exc:
-            logging.error(f"Error updating message: {exc}")
-            raise
-        finally:
-            conn.close()
+            except Exception as exc:
+                logging.error(f"Error marking chat with {partner} as read: {exc}")
+                raise
+
+    @staticmethod
+    def _message_from_row(row) -> dict:
+        return {
+            "message_id": row[0],
+            "from_user": row[1],
+            "to_user": row[2],
+            "content": row[3],
+            "sent_at": row[4],
+            "mark_as_read": bool(row[5]),
+        }
 
     def mark_as_read_batch(self, message_ids: list):
         if not message_ids:
             return
 
         placeholders = ",".join(["?"] * len(message_ids))
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                f"UPDATE messages SET mark_as_read = 1 WHERE message_id IN ({placeholders})",
-                message_ids,
-            )
-            conn.commit()
-        except Exception as exc:
-            logging.error(f"Error marking messages as read: {exc}")
-            raise
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"""
+                    SELECT to_user, from_user, COUNT(*) FROM messages
+                    WHERE message_id IN ({placeholders}) AND mark_as_read = 0
+                    GROUP BY to_user, from_user
+                    """,
+                    message_ids,
+                )
+                newly_read = cursor.fetchall()
+                cursor.execute(
+                    f"UPDATE messages SET mark_as_read = 1 WHERE message_id IN ({placeholders})",
+                    message_ids,
+                )
+                for reader, sender, count in newly_read:
+                    user_low, user_high = self._pair(reader, sender)
+                    column = self._unread_column(reader, user_low)
+                    cursor.execute(
+                        f"UPDATE conversations SET {column} = MAX({column} - ?, 0) WHERE user_low = ? AND user_high = ?",
+                        (count, user_low, user_high),
+                    )
+                conn.commit()
+            except Exception as exc:
+                logging.error(f"Error marking messages as read: {exc}")
+                raise
 
     def get_unread_message_count(self, username: str) -> int:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "SELECT COUNT(*) FROM messages WHERE to_user = ? AND mark_as_read = 0",
-                (username,),
-            )
-            row = cursor.fetchone()
-            return row[0] if row else 0
-        except Exception as exc:
-            logging.error(f"Error counting unread messages: {exc}")
-            return 0
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM messages WHERE to_user = ? AND mark_as_read = 0",
+                    (username,),
+                )
+                row = cursor.fetchone()
+                return row[0] if row else 0
+            except Exception as exc:
+                logging.error(f"Error counting unread messages: {exc}")
+                return 0
 
     def get_conversation_summaries(self, username: str) -> list:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                """
-                SELECT message_id, from_user, to_user, content, sent_at, mark_as_read
-                FROM messages
-                WHERE from_user = ? OR to_user = ?
-                ORDER BY sent_at ASC
-                """,
-                (username, username),
-            )
-            rows = cursor.fetchall()
-            messages = [
-                {
-                    "message_id": row[0],
-                    "from_user": row[1],
-                    "to_user": row[2],
-                    "content": row[3],
-                    "sent_at": row[4],
-                    "mark_as_read": bool(row[5]),
-                }
-                for row in rows
-            ]
-        except Exception as exc:
-            logging.error(f"Error loading conversations: {exc}")
-            return []
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"""
+                    SELECT c.user_high AS partner, c.unread_low AS unread, c.last_sent_at,
+                           {JOINED_MESSAGE_COLUMNS}
+                    FROM conversations c JOIN messages m ON m.message_id = c.last_message_id
+                    WHERE c.user_low = ?
+                    UNION ALL
+                    SELECT c.user_low, c.unread_high, c.last_sent_at,
+                           {JOINED_MESSAGE_COLUMNS}
+                    FROM conversations c JOIN messages m ON m.message_id = c.last_message_id
+                    WHERE c.user_high = ? AND c.user_low <> c.user_high
+                    ORDER BY last_sent_at DESC
+                    """,
+                    (username, username),
+                )
+                rows = cursor.fetchall()
+            except Exception as exc:
+                logging.error(f"Error loading conversations: {exc}")
+                return []
 
-        conversations = self._get_conversations_from_messages(messages, username)
         summaries = []
-        for partner, conv_messages in conversations.items():
-            last_message = self._get_last_message(conv_messages)
+        for row in rows:
+            last_message = self._message_from_row(row[3:])
             summaries.append(
                 {
-                    "partner": partner,
-                    "unread_count": self._count_unread_messages_in_list(conv_messages, username),
+                    "partner": row[0],
+                    "unread_count": row[1],
                     "last_message": last_message,
-                    "preview": self._truncate_last_message(last_message["content"]) if last_message else "",
+                    "preview": self._truncate_last_message(last_message["content"]),
                 }
             )
+        return summaries
+
+    def rebuild_conversations(self) -> int:
+        """Recompute the conversations table from messages; returns the number of conversations."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("DELETE FROM conversations")
+                cursor.execute(REBUILD_CONVERSATIONS_SQL)
+                conn.commit()
+                cursor.execute("SELECT COUNT(*) FROM conversations")
+                return cursor.fetchone()[0]
+            except Exception as exc:
+                logging.error(f"Error rebuilding conversations: {exc}")
+                raise
+
+    @staticmethod
+    def _pair(user_a, user_b):
+        return (user_a, user_b) if user_a <= user_b else (user_b, user_a)
+
+    @staticmethod
+    def _unread_column(reader, user_low):
+        return "unread_low" if reader == user_low else "unread_high"
 
-        summaries.sort(
-            key=lambda summary: summary["last_message"]["sent_at"] if summary["last_message"] else "",
-            reverse=True,
+    def _record_message(self, cursor, message):
+        """Fold a newly inserted message into its conversation row."""
+        user_low, user_high = self._pair(message.get("from_user"), message.get("to_user"))
+        unread = 0 if message.get("mark_as_read") else 1
+        to_low = message.get("to_user") == user_low
+        cursor.execute(
+            """
+            INSERT INTO conversations (user_low, user_high, last_message_id, last_sent_at, unread_low, unread_high)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (user_low, user_high) DO UPDATE SET
+                last_message_id = CASE WHEN (excluded.last_sent_at, excluded.last_message_id) > (last_sent_at, last_message_id)
+                                       THEN excluded.last_message_id ELSE last_message_id END,
+                last_sent_at = CASE WHEN (excluded.last_sent_at, excluded.last_message_id) > (last_sent_at, last_message_id)
+                                    THEN excluded.last_sent_at ELSE last_sent_at END,
+                unread_low = unread_low + excluded.unread_low,
+                unread_high = unread_high + excluded.unread_high
+            """,
+            (
+                user_low,
+                user_high,
+                message.get("message_id"),
+                message.get("sent_at"),
+                unread if to_low else 0,
+                0 if to_low else unread,
+            ),
         )
-        return summaries
 
-    def _get_conversations_from_messages(self, messages, username):
-        conversations = defaultdict(list)
-        for msg in messages:
-            if msg["from_user"] == username:
-                conversations[msg["to_user"]].append(msg)
-            elif msg["to_user"] == username:
-                conversations[msg["from_user"]].append(msg)
-        return conversations
-
-    def _count_unread_messages_in_list(self, messages: list, username: str) -> int:
-        return sum(1 for m in messages if m["to_user"] == username and not m.get("mark_as_read", False))
-
-    def _get_last_message(self, messages: list):
-        if not messages:
-            return None
-        return max(messages, key=lambda m: m["sent_at"])
+    def _refresh_conversation(self, cursor, user_low, user_high):
+        """Recompute one conversation row from its messages (indexed reads only)."""
+        cursor.execute(
+            """
+            SELECT message_id, sent_at FROM (
+                SELECT * FROM (
+                    SELECT message_id, sent_at FROM messages WHERE from_user = ? AND to_user = ?
+                    ORDER BY sent_at DESC, message_id DESC LIMIT 1
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT message_id, sent_at FROM messages WHERE from_user = ? AND to_user = ?
+                    ORDER BY sent_at DESC, message_id DESC LIMIT 1
+                )
+            )
+            ORDER BY sent_at DESC, message_id DESC LIMIT 1
+            """,
+            (user_low, user_high, user_high, user_low),
+        )
+        last = cursor.fetchone()
+        if last is None:
+            cursor.execute(
+                "DELETE FROM conversations WHERE user_low = ? AND user_high = ?", (user_low, user_high)
+            )
+            return
+
+        unread_sql = "SELECT COUNT(*) FROM messages WHERE to_user = ? AND mark_as_read = 0 AND from_user = ?"
+        cursor.execute(unread_sql, (user_low, user_high))
+        unread_low = cursor.fetchone()[0]
+        if user_low == user_high:
+            unread_high = 0
+        else:
+            cursor.execute(unread_sql, (user_high, user_low))
+            unread_high = cursor.fetchone()[0]
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO conversations (user_low, user_high, last_message_id, last_sent_at, unread_low, unread_high)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (user_low, user_high, last[0], last[1], unread_low, unread_high),
+        )
 
     def _truncate_last_message(self, content: str, max_length: int = 30) -> str:
         if len(content) <= max_length:
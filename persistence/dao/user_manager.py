@@ -8,52 +8,57 @@ class UserManager:
     def __init__(self, db_context=None):
         self.db = db_context or DBContext()
 
-    def read_all(self):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
+    def _all_rows(self, cursor):
+        # Served from the data_version cache; rebuilt whenever any connection writes.
+        def load():
             cursor.execute("SELECT username, password, role, enabled, daily_payment_rate FROM users")
-            rows = cursor.fetchall()
-            users = []
-            for row in rows:
-                user = {
-                    "username": row[0],
-                    "password": row[1],
-                    "role": row[2],
-                    "enabled": bool(row[3])
-                }
-                if row[4] is not None:
-                    user["daily_payment_rate"] = row[4]
-                users.append(user)
-            return users
-        except Exception as exc:
-            logging.error(f"Error reading users: {exc}")
-            return []
-        finally:
-            conn.close()
+            return cursor.fetchall()
+
+        return self.db.cache.get("users", load, copier=None)
+
+    def _row_for(self, cursor, username):
+        # One primary-key lookup per username, cached like _all_rows.
+        def load():
+            cursor.execute(
+                "SELECT username, password, role, enabled, daily_payment_rate FROM users WHERE username = ?",
+                (username,),
+            )
+            return cursor.fetchone()
+
+        return self.db.cache.get(("user", username), load, copier=None)
+
+    @staticmethod
+    def _user_from_row(row):
+        user = {
+            "username": row[0],
+            "password": row[1],
+            "role": row[2],
+            "enabled": bool(row[3])
+        }
+        if row[4] is not None:
+            user["daily_payment_rate"] = row[4]
+        return user
+
+    def read_all(self):
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                return [self._user_from_row(row) for row in self._all_rows(cursor)]
+            except Exception as exc:
+                logging.error(f"Error reading users: {exc}")
+                return []
 
     def find_user(self, username):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT username, password, role, enabled, daily_payment_rate FROM users WHERE username = ?", (username,))
-            row = cursor.fetchone()
-            if not row:
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                row = self._row_for(cursor, username)
+                if not row:
+                    return None
+                return self._user_from_row(row)
+            except Exception as exc:
+                logging.error(f"Error finding user: {exc}")
                 return None
-            user = {
-                "username": row[0],
-                "password": row[1],
-                "role": row[2],
-                "enabled": bool(row[3])
-            }
-            if row[4] is not None:
-                user["daily_payment_rate"] = row[4]
-            return user
-        except Exception as exc:
-            logging.error(f"Error finding user: {exc}")
-            return None
-        finally:
-            conn.close()
 
     def create_user(self, username, password, role, **kwargs):
         if not username or not username.strip():
@@ -66,69 +71,61 @@ class UserManager:
 
         daily_payment_rate = kwargs.get("daily_payment_rate")
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "INSERT INTO users (username, password, role, enabled, daily_payment_rate) VALUES (?, ?, ?, ?, ?)",
-                (username, password, role, 1, daily_payment_rate)
-            )
-            conn.commit()
-            return True, f"User {username} created successfully."
-        except Exception as exc:
-            logging.error(f"Error creating user: {exc}")
-            return False, f"Error creating user: {exc}"
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "INSERT INTO users (username, password, role, enabled, daily_payment_rate) VALUES (?, ?, ?, ?, ?)",
+                    (username, password, role, 1, daily_payment_rate)
+                )
+                conn.commit()
+                return True, f"User {username} created successfully."
+            except Exception as exc:
+                logging.error(f"Error creating user: {exc}")
+                return False, f"Error creating user: {exc}"
 
     def delete_user(self, username):
         if not self.find_user(username):
             return False, "User not found."
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("DELETE FROM users WHERE username = ?", (username,))
-            conn.commit()
-            return True, f"User {username} deleted."
-        except Exception as exc:
-            logging.error(f"Error deleting user: {exc}")
-            return False, f"Error deleting user: {exc}"
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("DELETE FROM users WHERE username = ?", (username,))
+                conn.commit()
+                return True, f"User {username} deleted."
+            except Exception as exc:
+                logging.error(f"Error deleting user: {exc}")
+                return False, f"Error deleting user: {exc}"
 
     def toggle_user_status(self, username, enabled):
         if not self.find_user(username):
             return False, "User not found."
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("UPDATE users SET enabled = ? WHERE username = ?", (1 if enabled else 0, username))
-            conn.commit()
-            state = "enabled" if enabled else "disabled"
-            return True, f"User {username} status set to {state}."
-        except Exception as exc:
-            logging.error(f"Error updating user status: {exc}")
-            return False, f"Error updating user status: {exc}"
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("UPDATE users SET enabled = ? WHERE username = ?", (1 if enabled else 0, username))
+                conn.commit()
+                state = "enabled" if enabled else "disabled"
+                return True, f"User {username} status set to {state}."
+            except Exception as exc:
+                logging.error(f"Error updating user status: {exc}")
+                return False, f"Error updating user status: {exc}"
 
     def update_password(self, username, new_password):
         if not self.find_user(username):
             return False, "User not found."
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("UPDATE users SET password = ? WHERE username = ?", (new_password, username))
-            conn.commit()
-            return True, f"Password updated for {username}."
-        except Exception as exc:
-            logging.error(f"Error updating password: {exc}")
-            return False, f"Error updating password: {exc}"
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("UPDATE users SET password = ? WHERE username = ?", (new_password, username))
+                conn.commit()
+                return True, f"Password updated for {username}."
+            except Exception as exc:
+                logging.error(f"Error updating password: {exc}")
+                return False, f"Error updating password: {exc}"
 
     def update_daily_payment_rate(self, username, new_daily_payment_rate):
         user = self.find_user(username)
@@ -137,17 +134,15 @@ class UserManager:
         if user["role"] != "Leader":
             return False, "User is not a leader"
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("UPDATE users SET daily_payment_rate = ? WHERE username = ?", (new_daily_payment_rate, username))
-            conn.commit()
-            return True, f"Payment rate updated for {username}."
-        except Exception as exc:
-            logging.error(f"Error updating payment rate: {exc}")
-            return False, f"Error updating payment rate: {exc}"
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("UPDATE users SET daily_payment_rate = ? WHERE username = ?", (new_daily_payment_rate, username))
+                conn.commit()
+                return True, f"Payment rate updated for {username}."
+            except Exception as exc:
+                logging.error(f"Error updating payment rate: {exc}")
+                return False, f"Error updating payment rate: {exc}"
 
     def update_username(self, old_username, new_username):
         if self.find_user(new_username):
@@ -156,18 +151,16 @@ class UserManager:
         if not self.find_user(old_username):
             return False, "User not found."
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("PRAGMA foreign_keys = ON")
-            cursor.execute("UPDATE users SET username = ? WHERE username = ?", (new_username, old_username))
-            conn.commit()
-            return True, f"Username updated to {new_username}."
-        except Exception as exc:
-            logging.error(f"Error updating username: {exc}")
-            return False, f"Error updating username: {exc}"
-        finally:
-            conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("PRAGMA foreign_keys = ON")
+                cursor.execute("UPDATE users SET username = ? WHERE username = ?", (new_username, old_username))
+                conn.commit()
+                return True, f"Username updated to {new_username}."
+            except Exception as exc:
+                logging.error(f"Error updating username: {exc}")
+                return False, f"Error updating username: {exc}"
 
     def update_role(self, username, new_role):
         user = self.find_user(username)
@@ -182,16 +175,14 @@ class UserManager:
             case _:
                 return False, "Invalid role."
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("UPDATE users SET role = ? WHERE username = ?", (role_str, username))
-            if role_str == "Leader" and "daily_payment_rate" not in user:
-                cursor.execute("UPDATE users SET daily_payment_rate = 0.0 WHERE username = ?", (username,))
-            conn.commit()
-            return True, f"Role updated to {role_str} for {username}."
-        except Exception as exc:
-            logging.error(f"Error updating role: {exc}")
-            return False, f"Error updating role: {exc}"
-        finally:
-            conn.close()
\ No newline at end of file
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("UPDATE users SET role = ? WHERE username = ?", (role_str, username))
+                if role_str == "Leader" and "daily_payment_rate" not in user:
+                    cursor.execute("UPDATE users SET daily_payment_rate = 0.0 WHERE username = ?", (username,))
+                conn.commit()
+                return True, f"Role updated to {role_str} for {username}."
+            except Exception as exc:
+                logging.error(f"Error updating role: {exc}")
+                return False, f"Error updating role: {exc}"
\ No newline at end of file
@@ -3,11 +3,33 @@ import logging
 import os
 import sys
 import shutil
+import threading
+from contextlib import contextmanager
+
+from persistence.cache import DataVersionCache
+from persistence.migrations import LATEST_VERSION, apply_migrations, get_schema_version, restore_suspended_schema
+
+# Applied to every connection after foreign_keys. Override per context with
+# DBContext(pragmas={...}); a value of None skips that pragma.
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,  # negative = KiB, i.e. ~16 MB of page cache
+    "mmap_size": 128 * 1024 * 1024,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,  # ms
+}
+
 
 class DBContext:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, pragmas=None):
         # Resolve DB path; when frozen (PyInstaller) copy bundled DB to a writable location.
         self.db_path = db_path or self._resolve_db_path()
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self._local = threading.local()
+        self._open_connections = []
+        self._lock = threading.Lock()
+        self.cache = DataVersionCache(self)
         self._ensure_db_dir()
         self.initialize_db()
 
@@ -30,13 +52,63 @@ class DBContext:
     def _ensure_db_dir(self):
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
-    def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
+    def get_connection(self, check_same_thread=True):
+        """Open a new connection owned by the caller, who must close it."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
         conn.execute("PRAGMA foreign_keys = ON")
+        for name, value in self.pragmas.items():
+            if value is not None:
+                conn.execute(f"PRAGMA {name} = {value}")
         return conn
 
+    @contextmanager
+    def connection(self):
+        """
+        Yield this thread's long-lived connection.
+
+        The connection is opened on first use and reused by every later call
+        from the same thread. Callers commit their own work; anything still
+        uncommitted when the outermost block exits is rolled back, matching
+        what closing a per-call connection used to do.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only the owning thread uses it; close() may run from another.
+            conn = self.get_connection(check_same_thread=False)
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._open_connections.append(conn)
+
+        self._local.depth += 1
+        try:
+            yield conn
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0 and conn.in_transaction:
+                conn.rollback()
+
+    def close(self):
+        """Close every pooled connection opened by this context."""
+        with self._lock:
+            connections, self._open_connections = self._open_connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as exc:
+                logging.error(f"Error closing connection: {exc}")
+        self._local = threading.local()
+        self.cache.clear()
+
     def initialize_db(self):
-        conn = self.get_connection()
+        with self.connection() as conn:
+            # An up-to-date database already has every table; skip the DDL.
+            if get_schema_version(conn) < LATEST_VERSION:
+                self._create_schema(conn)
+                apply_migrations(conn)
+            restore_suspended_schema(conn)
+
+    def _create_schema(self, conn):
         cursor = conn.cursor()
 
         # Users
@@ -196,4 +268,3 @@ class DBContext:
         ''')
 
         conn.commit()
-        conn.close()
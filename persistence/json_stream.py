@@ -0,0 +1,76 @@
+"""
+Streaming JSON helpers for files too large to load in one go.
+"""
+import gzip
+import json
+
+CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\r\n"
+
+
+def iter_json_array(path, chunk_size=CHUNK_SIZE):
+    """
+    Yield the elements of the top-level JSON array in path one at a time.
+
+    The file is read in chunks and each element is decoded as soon as it is
+    complete, so memory holds one element plus a chunk rather than the
+    whole document. Files ending in .gz are decompressed on the fly.
+    Raises ValueError if the file is not a JSON array.
+    """
+    decoder = json.JSONDecoder()
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill():
+            nonlocal buffer, pos, eof
+            more = f.read(chunk_size)
+            if not more:
+                eof = True
+                return False
+            buffer = buffer[pos:] + more
+            pos = 0
+            return True
+
+        def next_char():
+            """Skip whitespace and return the next character ('' at end of file)."""
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not fill():
+                    return ""
+
+        if next_char() != "[":
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos += 1
+        if next_char() == "]":
+            return
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # A number or literal ending exactly at the buffer edge may continue in the next chunk.
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                complete = False
+            if not complete:
+                if not fill():
+                    # Decode once more at end of file to raise the real error.
+                    value, end = decoder.raw_decode(buffer, pos)
+                else:
+                    continue
+            yield value
+            pos = end
+
+            delimiter = next_char()
+            if delimiter == "]":
+                return
+            if delimiter != ",":
+                raise ValueError(f"Expected ',' or ']' in {path}, found {delimiter!r}")
+            pos += 1
+            next_char()
@@ -0,0 +1,87 @@
+"""
+Maintenance commands for an existing database.
+
+Run from the repository root:
+    python -m persistence.maintenance rebuild-conversations [--db PATH]
+    python -m persistence.maintenance rebuild-camp-stats [--db PATH]
+    python -m persistence.maintenance rebuild-search [--db PATH]
+    python -m persistence.maintenance backup [--db PATH]
+    python -m persistence.maintenance incremental-backup [--db PATH]
+    python -m persistence.maintenance export-json [--db PATH]
+"""
+import argparse
+import logging
+import os
+import sys
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from persistence import backup as backup_engine
+from persistence.db_context import DBContext
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.message_manager import MessageManager
+from persistence.search import SEARCH_INDEXES, rebuild_search_indexes
+
+logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+
+def rebuild_conversations(db):
+    count = MessageManager(db).rebuild_conversations()
+    logging.info("Rebuilt %d conversations", count)
+
+
+def rebuild_camp_stats(db):
+    count = CampManager(db).rebuild_camp_stats()
+    logging.info("Rebuilt statistics for %d camps", count)
+
+
+def rebuild_search(db):
+    rebuild_search_indexes(db)
+    logging.info("Rebuilt search indexes: %s", ", ".join(SEARCH_INDEXES))
+
+
+def backup(db):
+    path = backup_engine.create_backup(db)
+    logging.info("Wrote backup to %s", path)
+
+
+def incremental_backup(db):
+    path = backup_engine.create_incremental_backup(db)
+    if path:
+        logging.info("Wrote incremental backup to %s", path)
+    else:
+        logging.info("Nothing changed since the last backup")
+
+
+def export_json(db):
+    path = backup_engine.export_json(db)
+    logging.info("Wrote JSON export to %s", path)
+
+
+COMMANDS = {
+    "rebuild-conversations": rebuild_conversations,
+    "rebuild-camp-stats": rebuild_camp_stats,
+    "rebuild-search": rebuild_search,
+    "backup": backup,
+    "incremental-backup": incremental_backup,
+    "export-json": export_json,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CampTrack database maintenance")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("--db", help="Database file (defaults to persistence/data/camptrack.db)")
+    args = parser.parse_args(argv)
+
+    db = DBContext(args.db)
+    try:
+        COMMANDS[args.command](db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+"""
+Numbered schema migrations applied on top of the base tables created by
+DBContext.initialize_db.
+
+The applied version is stored in PRAGMA user_version. Each migration runs in
+its own transaction together with the version bump, so a failure leaves the
+database at the previous version. To change the schema, append a new
+(number, function) pair to MIGRATIONS; never edit one that has shipped.
+"""
+import logging
+
+
+def _add_secondary_indexes(cursor):
+    # Foreign keys and the columns DAOs filter on; SQLite only indexes primary keys by itself.
+    statements = [
+        "CREATE INDEX IF NOT EXISTS idx_messages_to_user ON messages(to_user, mark_as_read)",
+        "CREATE INDEX IF NOT EXISTS idx_messages_from_user ON messages(from_user)",
+        "CREATE INDEX IF NOT EXISTS idx_scheduled_activities_camp_id ON scheduled_activities(camp_id)",
+        "CREATE INDEX IF NOT EXISTS idx_activity_attendance_camper_id ON activity_attendance(camper_id)",
+        "CREATE INDEX IF NOT EXISTS idx_camp_campers_camper_id ON camp_campers(camper_id)",
+        "CREATE INDEX IF NOT EXISTS idx_equipment_camp_id ON equipment(camp_id)",
+        "CREATE INDEX IF NOT EXISTS idx_daily_reports_camp_id ON daily_reports(camp_id)",
+        "CREATE INDEX IF NOT EXISTS idx_audit_logs_username ON audit_logs(username)",
+        "CREATE INDEX IF NOT EXISTS idx_system_notifications_to_user ON system_notifications(to_user)",
+        "CREATE INDEX IF NOT EXISTS idx_camps_camp_leader ON camps(camp_leader)",
+        "CREATE INDEX IF NOT EXISTS idx_announcements_created_at ON announcements(created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_activity_library_name_nocase ON activity_library(name COLLATE NOCASE)",
+    ]
+    for statement in statements:
+        cursor.execute(statement)
+
+
+def _unique_camp_names(cursor):
+    # Camp names identify camps throughout the UI; make any existing duplicates
+    # distinct ("Name (2)", "Name (3)", ...) before enforcing uniqueness.
+    cursor.execute("SELECT name FROM camps")
+    taken = {row[0] for row in cursor.fetchall()}
+    cursor.execute(
+        """
+        SELECT rowid, name FROM camps
+        WHERE name IN (SELECT name FROM camps GROUP BY name HAVING COUNT(*) > 1)
+        ORDER BY name, rowid
+        """
+    )
+    seen = set()
+    for rowid, name in cursor.fetchall():
+        if name not in seen:
+            seen.add(name)
+            continue
+        suffix = 2
+        while f"{name} ({suffix})" in taken:
+            suffix += 1
+        new_name = f"{name} ({suffix})"
+        taken.add(new_name)
+        logging.warning(f"Renaming duplicate camp '{name}' to '{new_name}'")
+        cursor.execute("UPDATE camps SET name = ? WHERE rowid = ?", (new_name, rowid))
+
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_camps_name ON camps(name)")
+
+
+def _message_thread_index(cursor):
+    # Serves get_thread's per-direction keyset scans; message_id breaks ties
+    # between messages sent in the same instant. Its from_user prefix also
+    # covers the old single-column index.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_messages_thread ON messages(from_user, to_user, sent_at, message_id)"
+    )
+    cursor.execute("DROP INDEX IF EXISTS idx_messages_from_user")
+
+
+def _conversations_table(cursor):
+    # One row per pair of users (user_low < user_high) so the inbox does not
+    # have to group every message. unread_low counts unread messages sent to
+    # user_low, unread_high those sent to user_high. Kept up to date by
+    # MessageManager; MessageManager.rebuild_conversations() recomputes it.
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS conversations (
+            user_low TEXT NOT NULL,
+            user_high TEXT NOT NULL,
+            last_message_id TEXT,
+            last_sent_at TEXT,
+            unread_low INTEGER NOT NULL DEFAULT 0,
+            unread_high INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_low, user_high)
+        )
+        """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_conversations_user_high ON conversations(user_high)")
+    cursor.execute(
+        """
+        INSERT INTO conversations (user_low, user_high, last_message_id, last_sent_at, unread_low, unread_high)
+        SELECT user_low, user_high,
+               MAX(CASE WHEN position = 1 THEN message_id END),
+               MAX(CASE WHEN position = 1 THEN sent_at END),
+               SUM(to_user = user_low AND mark_as_read = 0),
+               SUM(to_user <> user_low AND mark_as_read = 0)
+        FROM (
+            SELECT message_id, sent_at, to_user, mark_as_read,
+                   MIN(from_user, to_user) AS user_low, MAX(from_user, to_user) AS user_high,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY MIN(from_user, to_user), MAX(from_user, to_user)
+                       ORDER BY sent_at DESC, message_id DESC
+                   ) AS position
+            FROM messages
+            WHERE from_user IS NOT NULL AND to_user IS NOT NULL
+        )
+        GROUP BY user_low, user_high
+        """
+    )
+
+
+def _full_text_search(cursor):
+    # External-content FTS5 indexes: the text stays in the source tables and
+    # triggers keep the index in step, keyed by the source rowid. Daily report
+    # text lives inside the JSON payload, so it is exposed through a view.
+    cursor.execute(
+        """
+        CREATE VIEW IF NOT EXISTS daily_report_text AS
+        SELECT rowid AS report_rowid,
+               CASE WHEN json_valid(content) THEN json_extract(content, '$.text') ELSE content END AS text,
+               CASE WHEN json_valid(content) THEN json_extract(content, '$.incident_details') END AS incident_details
+        FROM daily_reports
+        """
+    )
+    indexes = [
+        # (fts table, source table, source columns, content table, content rowid, indexed columns, row expressions)
+        ("messages_fts", "messages", "content", "messages", "rowid", ["content"], ["{row}.content"]),
+        (
+            "announcements_fts", "announcements", "author, content", "announcements", "rowid",
+            ["author", "content"], ["{row}.author", "{row}.content"],
+        ),
+        (
+            "daily_reports_fts", "daily_reports", "content", "daily_report_text", "report_rowid", ["text", "incident_details"],
+            [
+                "CASE WHEN json_valid({row}.content) THEN json_extract({row}.content, '$.text') ELSE {row}.content END",
+                "CASE WHEN json_valid({row}.content) THEN json_extract({row}.content, '$.incident_details') END",
+            ],
+        ),
+    ]
+    for fts, source, source_columns, content, content_rowid, columns, expressions in indexes:
+        column_list = ", ".join(columns)
+        new_values = ", ".join(e.format(row="new") for e in expressions)
+        old_values = ", ".join(e.format(row="old") for e in expressions)
+        cursor.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {column_list}, content='{content}', content_rowid='{content_rowid}', tokenize='porter unicode61'
+            )
+            """
+        )
+        insert = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values});"
+        delete = f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});"
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN {insert} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN {delete} END")
+        # Only text edits touch the index; e.g. marking a message read does not.
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {source_columns} ON {source} BEGIN {delete} {insert} END"
+        )
+        cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _daily_report_columns(cursor):
+    # Report figures used by statistics become real columns (kept in step by
+    # DailyReportManager), backfilled from the JSON payload. Rows whose
+    # content is not valid JSON get zeros.
+    columns = [
+        ("daily_participation", "json_extract(content, '$.daily_participation')"),
+        ("injury", "json_extract(content, '$.injury')"),
+        ("injured_count", "json_extract(content, '$.injured_count')"),
+        ("activity_count", "json_array_length(content, '$.activities')"),
+        ("achievement_count", "json_array_length(content, '$.achievements')"),
+    ]
+    existing = {row[1] for row in cursor.execute("PRAGMA table_info(daily_reports)").fetchall()}
+    for column, _ in columns:
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE daily_reports ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+    assignments = ", ".join(
+        f"{column} = COALESCE(CAST({expression} AS INTEGER), 0)" for column, expression in columns
+    )
+    cursor.execute(f"UPDATE daily_reports SET {assignments} WHERE json_valid(content)")
+    # Covering index: per-camp aggregates read only the index.
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_daily_reports_camp_stats ON daily_reports(
+            camp_id, daily_participation, injury, injured_count, activity_count, achievement_count
+        )
+        """
+    )
+
+
+def _daily_report_camp_date_index(cursor):
+    # Per-camp report listings page by date; created_at orders same-day reports.
+    # Its camp_id prefix replaces the single-column index.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_daily_reports_camp_date ON daily_reports(camp_id, date, created_at)"
+    )
+    cursor.execute("DROP INDEX IF EXISTS idx_daily_reports_camp_id")
+
+
+def _camp_stats_table(cursor):
+    # Per-camp statistics kept current by triggers on every write that moves
+    # them: roster changes, daily reports and food stock movements. Food
+    # movements have no history to rebuild from, so existing camps start with
+    # initial minus current stock as consumed.
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS camp_stats (
+            camp_id TEXT PRIMARY KEY,
+            camper_count INTEGER NOT NULL DEFAULT 0,
+            report_count INTEGER NOT NULL DEFAULT 0,
+            participation_total INTEGER NOT NULL DEFAULT 0,
+            injured_total INTEGER NOT NULL DEFAULT 0,
+            activity_total INTEGER NOT NULL DEFAULT 0,
+            achievement_total INTEGER NOT NULL DEFAULT 0,
+            food_consumed INTEGER NOT NULL DEFAULT 0,
+            food_added INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute(
+        """
+        INSERT OR IGNORE INTO camp_stats (
+            camp_id, camper_count, report_count, participation_total, injured_total,
+            activity_total, achievement_total, food_consumed
+        )
+        SELECT c.camp_id,
+               (SELECT COUNT(*) FROM camp_campers cc WHERE cc.camp_id = c.camp_id),
+               COUNT(r.report_id),
+               COALESCE(SUM(r.daily_participation), 0),
+               COALESCE(SUM(r.injured_count), 0),
+               COALESCE(SUM(r.activity_count), 0),
+               COALESCE(SUM(r.achievement_count), 0),
+               MAX(COALESCE(c.initial_food_stock, 0) - COALESCE(c.current_food_stock, 0), 0)
+        FROM camps c LEFT JOIN daily_reports r ON r.camp_id = c.camp_id
+        GROUP BY c.camp_id
+        """
+    )
+
+    def report_delta(row, sign):
+        return f"""
+            UPDATE camp_stats SET
+                report_count = report_count {sign} 1,
+                participation_total = participation_total {sign} {row}.daily_participation,
+                injured_total = injured_total {sign} {row}.injured_count,
+                activity_total = activity_total {sign} {row}.activity_count,
+                achievement_total = achievement_total {sign} {row}.achievement_count
+            WHERE camp_id = {row}.camp_id;
+        """
+
+    triggers = {
+        "camp_stats_camp_ai": "AFTER INSERT ON camps BEGIN INSERT OR IGNORE INTO camp_stats (camp_id) VALUES (new.camp_id); END",
+        "camp_stats_camp_ad": "AFTER DELETE ON camps BEGIN DELETE FROM camp_stats WHERE camp_id = old.camp_id; END",
+        "camp_stats_food_au": """
+            AFTER UPDATE OF current_food_stock ON camps
+            WHEN COALESCE(old.current_food_stock, 0) <> COALESCE(new.current_food_stock, 0)
+            BEGIN
+                UPDATE camp_stats SET
+                    food_consumed = food_consumed + MAX(COALESCE(old.current_food_stock, 0) - COALESCE(new.current_food_stock, 0), 0),
+                    food_added = food_added + MAX(COALESCE(new.current_food_stock, 0) - COALESCE(old.current_food_stock, 0), 0)
+                WHERE camp_id = new.camp_id;
+            END
+        """,
+        "camp_stats_roster_ai": """
+            AFTER INSERT ON camp_campers
+            BEGIN UPDATE camp_stats SET camper_count = camper_count + 1 WHERE camp_id = new.camp_id; END
+        """,
+        "camp_stats_roster_ad": """
+            AFTER DELETE ON camp_campers
+            BEGIN UPDATE camp_stats SET camper_count = camper_count - 1 WHERE camp_id = old.camp_id; END
+        """,
+        "camp_stats_report_ai": f"AFTER INSERT ON daily_reports BEGIN {report_delta('new', '+')} END",
+        "camp_stats_report_ad": f"AFTER DELETE ON daily_reports BEGIN {report_delta('old', '-')} END",
+        "camp_stats_report_au": f"""
+            AFTER UPDATE OF camp_id, daily_participation, injured_count, activity_count, achievement_count ON daily_reports
+            BEGIN {report_delta('old', '-')} {report_delta('new', '+')} END
+        """,
+    }
+    for name, body in triggers.items():
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def _camp_dates_index(cursor):
+    # Overlap checks look for camps starting before a date and ending after another.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_camps_dates ON camps(start_date, end_date)")
+
+
+# Base tables whose writes are captured in change_log for incremental
+# backups: camp data, messages and reports, plus users because camps and
+# messages reference them. Other tables are restored as of the snapshot.
+CHANGE_LOG_TABLES = (
+    "users", "camps", "campers", "camp_campers", "equipment", "scheduled_activities",
+    "activity_attendance", "messages", "daily_reports",
+)
+
+
+def create_change_log_triggers(cursor, table):
+    """
+    (Re)create the triggers that log every write to table. The row image
+    lists the columns the table has now, so a migration that adds a column
+    to a captured table must call this again. Writes are only logged while
+    a backup checkpoint exists: without a full backup to build on, the log
+    would grow with nothing to replay it onto.
+    """
+    info = cursor.execute(f"PRAGMA table_info({table})").fetchall()
+    columns = [row[1] for row in info]
+    key = [row[1] for row in sorted(info, key=lambda row: row[5]) if row[5]]
+    log = "INSERT INTO change_log (changed_at, table_name, op, row_key, row_data) VALUES (strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'), '{table}', '{op}', {key}, {data});"
+
+    def row_key(row):
+        return "json_array(" + ", ".join(f"{row}.{column}" for column in key) + ")"
+
+    def row_data(row):
+        return "json_object(" + ", ".join(f"'{column}', {row}.{column}" for column in columns) + ")"
+
+    statements = {
+        "ai": ("AFTER INSERT", log.format(table=table, op="I", key=row_key("new"), data=row_data("new"))),
+        "au": ("AFTER UPDATE", log.format(table=table, op="U", key=row_key("old"), data=row_data("new"))),
+        "ad": ("AFTER DELETE", log.format(table=table, op="D", key=row_key("old"), data="NULL")),
+    }
+    for suffix, (event, body) in statements.items():
+        name = f"change_log_{table}_{suffix}"
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(
+            f"CREATE TRIGGER {name} {event} ON {table} WHEN EXISTS (SELECT 1 FROM backup_checkpoints) BEGIN {body} END"
+        )
+
+
+def _change_log(cursor):
+    # Every insert, update and delete on the base tables, in commit order.
+    # row_key holds the old primary key (the row to update or delete) and
+    # row_data the new row, so replaying the log reproduces the writes.
+    # Incremental backups copy the rows past the last checkpoint and prune
+    # them; backup_checkpoints records how far each backup chain has got.
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS change_log (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            changed_at TEXT NOT NULL,
+            table_name TEXT NOT NULL,
+            op TEXT NOT NULL,
+            row_key TEXT NOT NULL,
+            row_data TEXT
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS backup_checkpoints (
+            seq INTEGER NOT NULL,
+            base TEXT NOT NULL,
+            file TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """
+    )
+    for table in CHANGE_LOG_TABLES:
+        create_change_log_triggers(cursor, table)
+
+
+def _engagement_cache_version(cursor):
+    # Counters bumped by triggers whenever the tables behind a cached result
+    # change; see CounterCache. Activity engagement depends on enrolment,
+    # scheduled activities and attendance only.
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS cache_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute("INSERT OR IGNORE INTO cache_versions (name) VALUES ('engagement')")
+    bump = "UPDATE cache_versions SET version = version + 1 WHERE name = 'engagement';"
+    for table in ("camp_campers", "scheduled_activities", "activity_attendance"):
+        for suffix, event in (("ai", "AFTER INSERT"), ("ad", "AFTER DELETE"), ("au", "AFTER UPDATE")):
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS cache_version_engagement_{table}_{suffix} {event} ON {table} BEGIN {bump} END"
+            )
+    # Engagement can be filtered by date across all camps.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_activities_date ON scheduled_activities(date)")
+
+
+def _change_log_after_checkpoint(cursor):
+    # Capture only the tables incremental restores replay, and only once a
+    # full backup exists; see create_change_log_triggers.
+    placeholders = ", ".join("?" * len(CHANGE_LOG_TABLES))
+    stale = cursor.execute(
+        rf"""
+        SELECT name FROM sqlite_master
+        WHERE type = 'trigger' AND name LIKE 'change\_log\_%' ESCAPE '\' AND tbl_name NOT IN ({placeholders})
+        """,
+        CHANGE_LOG_TABLES,
+    ).fetchall()
+    for (name,) in stale:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for table in CHANGE_LOG_TABLES:
+        create_change_log_triggers(cursor, table)
+    # Rows logged before any backup was taken can never be replayed.
+    cursor.execute("DELETE FROM change_log WHERE NOT EXISTS (SELECT 1 FROM backup_checkpoints)")
+
+
+def _camper_search_cache_version(cursor):
+    # The camper search index covers enrolled campers with their camp name
+    # and leader, so only those columns and the enrolment rows move it.
+    cursor.execute("INSERT OR IGNORE INTO cache_versions (name) VALUES ('camper_search')")
+    bump = "UPDATE cache_versions SET version = version + 1 WHERE name = 'camper_search';"
+    events = {
+        "camp_campers": (("ai", "AFTER INSERT"), ("ad", "AFTER DELETE"), ("au", "AFTER UPDATE")),
+        "campers": (("ad", "AFTER DELETE"), ("au", "AFTER UPDATE")),
+        "camps": (("ad", "AFTER DELETE"), ("au", "AFTER UPDATE OF name, camp_leader")),
+    }
+    for table, table_events in events.items():
+        for suffix, event in table_events:
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS cache_version_camper_search_{table}_{suffix} {event} ON {table} BEGIN {bump} END"
+            )
+
+
+def _suspended_schema(cursor):
+    # Indexes and triggers a bulk load has dropped, with the SQL to recreate
+    # them; see persistence.bulk_load and restore_suspended_schema().
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS suspended_schema (
+            name TEXT PRIMARY KEY,
+            sql TEXT NOT NULL
+        )
+        """
+    )
+
+
+def _message_search_by_user(cursor):
+    # Index the sender and recipient alongside the text, so a search can be
+    # narrowed to one user's messages inside the index instead of matching
+    # and ranking every user's mail first. rank only weighs the text.
+    for suffix in ("ai", "ad", "au"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS messages_fts_{suffix}")
+    cursor.execute("DROP TABLE IF EXISTS messages_fts")
+    cursor.execute(
+        """
+        CREATE VIRTUAL TABLE messages_fts USING fts5(
+            content, from_user, to_user, content='messages', content_rowid='rowid', tokenize='porter unicode61'
+        )
+        """
+    )
+    insert = "INSERT INTO messages_fts(rowid, content, from_user, to_user) VALUES (new.rowid, new.content, new.from_user, new.to_user);"
+    delete = (
+        "INSERT INTO messages_fts(messages_fts, rowid, content, from_user, to_user) "
+        "VALUES ('delete', old.rowid, old.content, old.from_user, old.to_user);"
+    )
+    cursor.execute(f"CREATE TRIGGER messages_fts_ai AFTER INSERT ON messages BEGIN {insert} END")
+    cursor.execute(f"CREATE TRIGGER messages_fts_ad AFTER DELETE ON messages BEGIN {delete} END")
+    cursor.execute(
+        f"CREATE TRIGGER messages_fts_au AFTER UPDATE OF content, from_user, to_user ON messages BEGIN {delete} {insert} END"
+    )
+    cursor.execute("INSERT INTO messages_fts(messages_fts, rank) VALUES ('rank', 'bm25(1.0, 0.0, 0.0)')")
+    cursor.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+
+
+MIGRATIONS = [
+    (1, _add_secondary_indexes),
+    (2, _unique_camp_names),
+    (3, _message_thread_index),
+    (4, _conversations_table),
+    (5, _full_text_search),
+    (6, _daily_report_columns),
+    (7, _daily_report_camp_date_index),
+    (8, _camp_stats_table),
+    (9, _camp_dates_index),
+    (10, _change_log),
+    (11, _engagement_cache_version),
+    (12, _change_log_after_checkpoint),
+    (13, _camper_search_cache_version),
+    (14, _suspended_schema),
+    (15, _message_search_by_user),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def restore_suspended_schema(conn):
+    """
+    Recreate the indexes and triggers a bulk load dropped and never put
+    back, e.g. because the process was killed mid-load. Returns how many
+    were recreated.
+    """
+    suspended = conn.execute("SELECT name, sql FROM suspended_schema").fetchall()
+    if not suspended:
+        return 0
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')")}
+    try:
+        conn.execute("BEGIN")
+        for name, sql in suspended:
+            if name not in existing:
+                conn.execute(sql)
+        conn.execute("DELETE FROM suspended_schema")
+        conn.execute("COMMIT")
+    except Exception as exc:
+        logging.error(f"Error restoring suspended indexes and triggers: {exc}")
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    logging.warning("Recreated %d indexes and triggers left dropped by an interrupted bulk load", len(suspended))
+    return len(suspended)
+
+
+def apply_migrations(conn):
+    """Apply every migration newer than the database's user_version, in order."""
+    current = get_schema_version(conn)
+    for version, migration in MIGRATIONS:
+        if version <= current:
+            continue
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            migration(cursor)
+            # PRAGMA does not accept bound parameters; version is an int from MIGRATIONS.
+            cursor.execute(f"PRAGMA user_version = {int(version)}")
+            cursor.execute("COMMIT")
+        except Exception as exc:
+            logging.error(f"Error applying migration {version} ({migration.__name__}): {exc}")
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+        current = version
+    return current
@@ -0,0 +1,87 @@
+"""
+Helpers shared by the full-text search APIs on the DAOs.
+
+The FTS5 indexes (messages_fts, announcements_fts, daily_reports_fts) are
+created by migration 5 (messages_fts is recreated with the sender and
+recipient by migration 15) and kept in sync by triggers. Writes that bypass
+triggers (INSERT OR REPLACE, or a VACUUM renumbering rowids) can leave them
+stale; rebuild_search_indexes() recomputes them from the source tables.
+"""
+import logging
+import re
+
+from models.search_snippet import MATCH_END, MATCH_START
+
+SEARCH_INDEXES = ("messages_fts", "announcements_fts", "daily_reports_fts")
+
+SEARCH_LIMIT = 20
+
+
+def to_match_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query: every word must match, as a prefix.
+    Returns "" when the text has no searchable words.
+    """
+    terms = re.findall(r"\w+", text or "")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def snippet_sql(table: str, column: int = -1, tokens: int = 12) -> str:
+    return f"snippet({table}, {column}, '{MATCH_START}', '{MATCH_END}', '…', {tokens})"
+
+
+def rebuild_search_indexes(db):
+    with db.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            for table in SEARCH_INDEXES:
+                cursor.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+            conn.commit()
+        except Exception as exc:
+            logging.error(f"Error rebuilding search indexes: {exc}")
+            raise
+
+
+class NGramIndex:
+    """
+    In-memory substring index over a list of entries.
+
+    Every 1-3 character gram of each entry's texts maps to the entry's
+    position, so a lookup intersects a few posting sets instead of scanning
+    the entries. Texts are matched case-insensitively.
+    """
+
+    MAX_GRAM = 3
+
+    def __init__(self, entries, texts):
+        self.entries = list(entries)
+        self._postings = {}
+        # Each entry's texts joined by a separator no needle can contain, so
+        # verifying a candidate is a single substring test.
+        self._haystacks = []
+        for position, entry in enumerate(self.entries):
+            entry_texts = [(t or "").lower() for t in texts(entry)]
+            self._haystacks.append("\0".join(entry_texts))
+            for text in entry_texts:
+                for size in range(1, self.MAX_GRAM + 1):
+                    for start in range(len(text) - size + 1):
+                        self._postings.setdefault(text[start:start + size], set()).add(position)
+
+    def search(self, needle):
+        """Entries with needle in any of their texts, in their original order."""
+        needle = (needle or "").lower().replace("\0", "")
+        if not needle:
+            return list(self.entries)
+        size = min(len(needle), self.MAX_GRAM)
+        grams = {needle[i:i + size] for i in range(len(needle) - size + 1)}
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        if len(needle) <= self.MAX_GRAM:
+            # The needle is itself a gram, so every candidate contains it.
+            return [self.entries[position] for position in sorted(candidates)]
+        haystacks = self._haystacks
+        return [self.entries[position] for position in sorted(candidates) if needle in haystacks[position]]
@@ -1,29 +1,56 @@
+"""
+Bulk-load the JSON exports in persistence/data into the SQLite database.
+
+Run from the repository root:
+    python -m persistence.seed_from_json [--data-dir DIR] [--db PATH] [--rebuild-indexes]
+
+Each file is streamed element by element and written with executemany in
+one transaction, with foreign keys checked once at commit. Search index
+and camp_stats triggers are suspended during the load and both are rebuilt
+at the end. Seeded rows bypass the change log, so incremental backups only
+resume after the next full backup. Throughput is logged per table.
+--rebuild-indexes drops the non-unique indexes of the seeded tables before
+loading and recreates them afterwards, which is faster for large loads
+into a populated database.
+"""
+import argparse
 import json
 import logging
 import os
 import sys
+import time
+from contextlib import nullcontext
 from datetime import datetime
+from itertools import islice
 
 # Ensure project root is on sys.path when running as a script
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
+from persistence.bulk_load import (
+    change_capture_suspended, derived_triggers_dropped, indexes_dropped, rebuild_derived_tables,
+)
 from persistence.db_context import DBContext
-
-
-def _camp_exists(conn, camp_id):
-    cursor = conn.cursor()
-    cursor.execute("SELECT 1 FROM camps WHERE camp_id = ?", (camp_id,))
-    return cursor.fetchone() is not None
+from persistence.dao.daily_report_manager import INSERT_REPORT_SQL, report_insert_params
+from persistence.json_stream import iter_json_array
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
 DATA_DIR = os.path.join("persistence", "data")
+BATCH_SIZE = 5000
+# Reseeding replaces reports with the same id.
+SEED_REPORT_SQL = INSERT_REPORT_SQL.replace("INSERT INTO", "INSERT OR REPLACE INTO", 1)
 
+SEEDED_TABLES = (
+    "camps", "campers", "camp_campers", "equipment", "scheduled_activities", "activity_attendance",
+    "users", "activity_library", "announcements", "messages", "system_notifications", "audit_logs",
+    "daily_reports",
+)
 
-def _load_json(filename):
-    path = os.path.join(DATA_DIR, filename)
+
+def _load_json(filename, data_dir=DATA_DIR):
+    path = os.path.join(data_dir, filename)
     if not os.path.exists(path):
         logging.warning("Missing %s, skipping", path)
         return None
@@ -35,41 +62,109 @@ def _load_json(filename):
             return None
 
 
-def seed_users(conn):
-    rows = _load_json("users.json")
-    if not rows:
-        return
+def _stream_json(filename, data_dir=DATA_DIR):
+    """Path of a JSON array file to stream, or None (with a warning) if it is missing."""
+    path = os.path.join(data_dir, filename)
+    if not os.path.exists(path):
+        logging.warning("Missing %s, skipping", path)
+        return None
+    return path
+
+
+def _batched(rows, size=BATCH_SIZE):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+class _BatchWriter:
+    """
+    Buffers parameters per statement and runs them with executemany once
+    BATCH_SIZE rows are pending. Statements are flushed in the order they
+    were first added, so deletes registered before inserts run first.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.pending = {}
+        self.pending_count = 0
+        self.counts = {}
+
+    def add(self, sql, params, label=None):
+        self.pending.setdefault(sql, []).append(params)
+        self.pending_count += 1
+        if label:
+            self.counts[label] = self.counts.get(label, 0) + 1
+        if self.pending_count >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        for sql, rows in self.pending.items():
+            if rows:
+                self.cursor.executemany(sql, rows)
+                rows.clear()
+        self.pending_count = 0
+
+
+def _bulk_load(conn, label, load):
+    """
+    Run load(cursor) -> row count in one transaction with foreign keys
+    deferred to commit, and log the throughput. A failure rolls the whole
+    table back.
+    """
+    started = time.perf_counter()
     cursor = conn.cursor()
-    inserted = 0
-    for u in rows:
-        try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO users (username, password, role, enabled, daily_payment_rate)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    u.get("username"),
-                    u.get("password", ""),
-                    u.get("role"),
-                    1 if u.get("enabled", True) else 0,
-                    u.get("daily_payment_rate"),
-                ),
+    try:
+        cursor.execute("BEGIN")
+        cursor.execute("PRAGMA defer_foreign_keys = ON")
+        count = load(cursor)
+        conn.commit()
+    except Exception as exc:
+        conn.rollback()
+        logging.error("Failed to seed %s: %s", label, exc)
+        return 0
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else count
+    logging.info("Seeded %s: %d rows in %.2fs (%d rows/s)", label, count, elapsed, rate)
+    return count
+
+
+def _insert_all(cursor, sql, rows):
+    count = 0
+    for batch in _batched(rows):
+        cursor.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+def seed_users(conn, data_dir=DATA_DIR):
+    path = _stream_json("users.json", data_dir)
+    if not path:
+        return
+    _bulk_load(conn, "users", lambda cursor: _insert_all(
+        cursor,
+        """
+        INSERT OR REPLACE INTO users (username, password, role, enabled, daily_payment_rate)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                u.get("username"),
+                u.get("password", ""),
+                u.get("role"),
+                1 if u.get("enabled", True) else 0,
+                u.get("daily_payment_rate"),
             )
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert user %s: %s", u.get("username"), exc)
-    conn.commit()
-    logging.info("Seeded users: %d", inserted)
+            for u in iter_json_array(path)
+        ),
+    ))
 
 
-def seed_activity_library(conn):
-    data = _load_json("activities.json")
+def seed_activity_library(conn, data_dir=DATA_DIR):
+    # Small and sometimes a dict, so it is loaded whole.
+    data = _load_json("activities.json", data_dir)
     if data is None:
         return
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM activity_library")
-    inserted = 0
     if isinstance(data, list):
         iterable = [(name, False) for name in data]
     elif isinstance(data, dict):
@@ -77,36 +172,39 @@ def seed_activity_library(conn):
     else:
         logging.warning("activities.json format unexpected, skipping")
         return
-    for name, is_indoor in iterable:
-        try:
-            cursor.execute(
-                "INSERT OR REPLACE INTO activity_library (name, is_indoor) VALUES (?, ?)",
-                (name, 1 if is_indoor else 0),
-            )
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert activity %s: %s", name, exc)
-    conn.commit()
-    logging.info("Seeded activities: %d", inserted)
 
+    def load(cursor):
+        cursor.execute("DELETE FROM activity_library")
+        return _insert_all(
+            cursor,
+            "INSERT OR REPLACE INTO activity_library (name, is_indoor) VALUES (?, ?)",
+            ((name, 1 if is_indoor else 0) for name, is_indoor in iterable),
+        )
+
+    _bulk_load(conn, "activities", load)
 
-def seed_camps(conn):
-    camps = _load_json("camps.json")
-    if not camps:
+
+def seed_camps(conn, data_dir=DATA_DIR):
+    path = _stream_json("camps.json", data_dir)
+    if not path:
         return
 
-    cursor = conn.cursor()
-    inserted = 0
-    for camp in camps:
-        try:
-            cursor.execute(
+    def load(cursor):
+        # New activity ids are assigned here so attendance can be batched too.
+        # Activities already stored for a reseeded camp (ids up to last_id) are replaced.
+        last_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM scheduled_activities").fetchone()[0]
+        next_id = last_id + 1
+        writer = _BatchWriter(cursor)
+        for camp in iter_json_array(path):
+            camp_id = camp.get("camp_id")
+            writer.add(
                 """
                 INSERT OR REPLACE INTO camps (camp_id, name, location, camp_type, start_date, end_date, camp_leader,
                                              food_per_camper_per_day, initial_food_stock, current_food_stock)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
-                    camp.get("camp_id"),
+                    camp_id,
                     camp.get("name"),
                     camp.get("location"),
                     camp.get("camp_type"),
@@ -117,13 +215,21 @@ def seed_camps(conn):
                     camp.get("initial_food_stock", 0),
                     camp.get("current_food_stock", camp.get("initial_food_stock", 0)),
                 ),
+                label="camps",
             )
+            writer.add(
+                """
+                DELETE FROM activity_attendance WHERE scheduled_activity_id IN
+                    (SELECT id FROM scheduled_activities WHERE camp_id = ? AND id <= ?)
+                """,
+                (camp_id, last_id),
+            )
+            writer.add("DELETE FROM scheduled_activities WHERE camp_id = ? AND id <= ?", (camp_id, last_id))
 
             # Campers
-            campers = camp.get("campers", [])
             name_to_id = {}
-            for camper in campers:
-                cursor.execute(
+            for camper in camp.get("campers", []):
+                writer.add(
                     "INSERT OR REPLACE INTO campers (camper_id, name, age, contact, medical_info) VALUES (?, ?, ?, ?, ?)",
                     (
                         camper.get("camper_id"),
@@ -132,216 +238,194 @@ def seed_camps(conn):
                         camper.get("contact"),
                         camper.get("medical_info"),
                     ),
+                    label="campers",
                 )
                 name_to_id[camper.get("name")] = camper.get("camper_id")
-                cursor.execute(
+                writer.add(
                     "INSERT OR REPLACE INTO camp_campers (camp_id, camper_id) VALUES (?, ?)",
-                    (camp.get("camp_id"), camper.get("camper_id")),
+                    (camp_id, camper.get("camper_id")),
                 )
 
             # Equipment
             for eq in camp.get("equipment", []):
-                cursor.execute(
+                writer.add(
                     """
                     INSERT OR REPLACE INTO equipment (resource_id, camp_id, name, target_quantity, current_quantity, condition)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
                     (
                         eq.get("resource_id"),
-                        camp.get("camp_id"),
+                        camp_id,
                         eq.get("name"),
                         eq.get("target_quantity"),
                         eq.get("current_quantity"),
                         eq.get("condition"),
                     ),
+                    label="equipment",
                 )
 
             # Activities (scheduled)
             for act in camp.get("activities", []):
-                cursor.execute(
-                    "INSERT INTO scheduled_activities (camp_id, name, date, session, is_indoor) VALUES (?, ?, ?, ?, ?)",
+                writer.add(
+                    "INSERT INTO scheduled_activities (id, camp_id, name, date, session, is_indoor) VALUES (?, ?, ?, ?, ?, ?)",
                     (
-                        camp.get("camp_id"),
+                        next_id,
+                        camp_id,
                         act.get("name"),
                         act.get("date"),
                         act.get("session", "Morning"),
                         1 if act.get("is_indoor") else 0,
                     ),
+                    label="activities",
                 )
-                act_id = cursor.lastrowid
                 for camper_key in act.get("camper_ids", []):
-                    camper_id = name_to_id.get(camper_key, camper_key)
-                    cursor.execute(
+                    writer.add(
                         "INSERT OR IGNORE INTO activity_attendance (scheduled_activity_id, camper_id) VALUES (?, ?)",
-                        (act_id, camper_id),
+                        (next_id, name_to_id.get(camper_key, camper_key)),
                     )
+                next_id += 1
+        writer.flush()
+        logging.info("Camp rows: %s", ", ".join(f"{label} {count}" for label, count in writer.counts.items()))
+        return sum(writer.counts.values())
 
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert camp %s: %s", camp.get("name"), exc)
+    _bulk_load(conn, "camps", load)
 
-    conn.commit()
-    logging.info("Seeded camps: %d", inserted)
 
-
-def seed_announcements(conn):
-    rows = _load_json("announcements.json")
-    if not rows:
+def seed_announcements(conn, data_dir=DATA_DIR):
+    path = _stream_json("announcements.json", data_dir)
+    if not path:
         return
-    cursor = conn.cursor()
-    inserted = 0
-    for a in rows:
-        try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO announcements (announcement_id, author, content, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    a.get("announcement_id"),
-                    a.get("author"),
-                    a.get("content"),
-                    a.get("created_at"),
-                ),
-            )
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert announcement %s: %s", a.get("announcement_id"), exc)
-    conn.commit()
-    logging.info("Seeded announcements: %d", inserted)
-
-
-def seed_messages(conn):
-    rows = _load_json("messages.json")
-    if not rows:
+    _bulk_load(conn, "announcements", lambda cursor: _insert_all(
+        cursor,
+        """
+        INSERT OR REPLACE INTO announcements (announcement_id, author, content, created_at)
+        VALUES (?, ?, ?, ?)
+        """,
+        (
+            (a.get("announcement_id"), a.get("author"), a.get("content"), a.get("created_at"))
+            for a in iter_json_array(path)
+        ),
+    ))
+
+
+def seed_messages(conn, data_dir=DATA_DIR):
+    path = _stream_json("messages.json", data_dir)
+    if not path:
         return
-    cursor = conn.cursor()
-    inserted = 0
-    for m in rows:
-        try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO messages (message_id, from_user, to_user, content, sent_at, mark_as_read)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    m.get("message_id"),
-                    m.get("from_user"),
-                    m.get("to_user"),
-                    m.get("content"),
-                    m.get("sent_at"),
-                    1 if m.get("mark_as_read", False) else 0,
-                ),
+    _bulk_load(conn, "messages", lambda cursor: _insert_all(
+        cursor,
+        """
+        INSERT OR REPLACE INTO messages (message_id, from_user, to_user, content, sent_at, mark_as_read)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                m.get("message_id"),
+                m.get("from_user"),
+                m.get("to_user"),
+                m.get("content"),
+                m.get("sent_at"),
+                1 if m.get("mark_as_read", False) else 0,
             )
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert message %s: %s", m.get("message_id"), exc)
-    conn.commit()
-    logging.info("Seeded messages: %d", inserted)
+            for m in iter_json_array(path)
+        ),
+    ))
 
 
-def seed_system_notifications(conn):
-    rows = _load_json("system_notifications.json")
-    if not rows:
+def seed_system_notifications(conn, data_dir=DATA_DIR):
+    path = _stream_json("system_notifications.json", data_dir)
+    if not path:
         return
-    cursor = conn.cursor()
-    inserted = 0
-    for n in rows:
-        try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO system_notifications (sys_notification_id, to_user, type, content, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    n.get("sys_notification_id"),
-                    n.get("to_user"),
-                    n.get("type"),
-                    n.get("content"),
-                    n.get("created_at"),
-                ),
-            )
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert system notification %s: %s", n.get("sys_notification_id"), exc)
-    conn.commit()
-    logging.info("Seeded system notifications: %d", inserted)
-
-
-def seed_audit_logs(conn):
-    rows = _load_json("audit_logs.json")
-    if not rows:
+    _bulk_load(conn, "system notifications", lambda cursor: _insert_all(
+        cursor,
+        """
+        INSERT OR REPLACE INTO system_notifications (sys_notification_id, to_user, type, content, created_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (
+            (n.get("sys_notification_id"), n.get("to_user"), n.get("type"), n.get("content"), n.get("created_at"))
+            for n in iter_json_array(path)
+        ),
+    ))
+
+
+def seed_audit_logs(conn, data_dir=DATA_DIR):
+    path = _stream_json("audit_logs.json", data_dir)
+    if not path:
         return
-    cursor = conn.cursor()
-    inserted = 0
-    for log in rows:
-        try:
-            cursor.execute(
-                """
-                INSERT INTO audit_logs (timestamp, username, action, details)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    log.get("timestamp") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    log.get("username"),
-                    log.get("action"),
-                    log.get("details", ""),
-                ),
-            )
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert audit log: %s", exc)
-    conn.commit()
-    logging.info("Seeded audit logs: %d", inserted)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    _bulk_load(conn, "audit logs", lambda cursor: _insert_all(
+        cursor,
+        "INSERT INTO audit_logs (timestamp, username, action, details) VALUES (?, ?, ?, ?)",
+        (
+            (log.get("timestamp") or now, log.get("username"), log.get("action"), log.get("details", ""))
+            for log in iter_json_array(path)
+        ),
+    ))
+
+
+def seed_daily_reports(conn, data_dir=DATA_DIR):
+    path = _stream_json("daily_reports.json", data_dir)
+    if not path:
+        return
+    def load(cursor):
+        camp_ids = {row[0] for row in cursor.execute("SELECT camp_id FROM camps")}
+        skipped = 0
 
+        def rows():
+            nonlocal skipped
+            for report in iter_json_array(path):
+                camp_id = report.get("camp_id")
+                if camp_id and camp_id not in camp_ids:
+                    skipped += 1
+                    continue
+                # Same row layout (statistics columns included) as reports saved by the app.
+                yield report_insert_params(report)
 
-def seed_daily_reports(conn):
-    rows = _load_json("daily_reports.json")
-    if not rows:
-        return
-    cursor = conn.cursor()
-    inserted = 0
-    for r in rows:
-        camp_id = r.get("camp_id")
-        if camp_id and not _camp_exists(conn, camp_id):
-            logging.warning("Skip daily report %s: camp %s missing", r.get("report_id"), camp_id)
-            continue
-        try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO daily_reports (report_id, camp_id, date, content, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    r.get("report_id"),
-                    camp_id,
-                    r.get("date"),
-                    r.get("content"),
-                    r.get("created_at"),
-                ),
-            )
-            inserted += 1
-        except Exception as exc:
-            logging.error("Failed to insert daily report %s: %s", r.get("report_id"), exc)
-    conn.commit()
-    logging.info("Seeded daily reports: %d", inserted)
+        count = _insert_all(cursor, SEED_REPORT_SQL, rows())
+        if skipped:
+            logging.warning("Skipped %d daily reports for missing camps", skipped)
+        return count
 
+    _bulk_load(conn, "daily reports", load)
 
-def main():
-    db = DBContext()
+
+def seed(db, data_dir=DATA_DIR, rebuild_indexes=False):
     conn = db.get_connection()
     try:
-        seed_camps(conn)
-        seed_users(conn)
-        seed_activity_library(conn)
-        seed_announcements(conn)
-        seed_messages(conn)
-        seed_system_notifications(conn)
-        seed_audit_logs(conn)
-        seed_daily_reports(conn)
-        logging.info("Seeding complete.")
+        # Users first: camps, messages and announcements reference them.
+        with (
+            change_capture_suspended(conn),
+            derived_triggers_dropped(conn),
+            indexes_dropped(conn, SEEDED_TABLES) if rebuild_indexes else nullcontext(),
+        ):
+            seed_users(conn, data_dir)
+            seed_activity_library(conn, data_dir)
+            seed_camps(conn, data_dir)
+            seed_announcements(conn, data_dir)
+            seed_messages(conn, data_dir)
+            seed_system_notifications(conn, data_dir)
+            seed_audit_logs(conn, data_dir)
+            seed_daily_reports(conn, data_dir)
     finally:
         conn.close()
+    # Rows were inserted directly with the derived-data triggers dropped.
+    rebuild_derived_tables(db)
+    logging.info("Seeding complete.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed the CampTrack database from JSON exports")
+    parser.add_argument("--data-dir", default=DATA_DIR, help=f"Directory of JSON files (defaults to {DATA_DIR})")
+    parser.add_argument("--db", help="Database file (defaults to persistence/data/camptrack.db)")
+    parser.add_argument("--rebuild-indexes", action="store_true", help="Drop and recreate indexes around the load")
+    args = parser.parse_args(argv)
+
+    db = DBContext(args.db)
+    try:
+        seed(db, args.data_dir, args.rebuild_indexes)
+    finally:
+        db.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+import logging
+from contextlib import contextmanager
+
+from models.change_tracking import ChangeTracker
+
+
+class UnitOfWork:
+    """
+    Identity map and deferred writes for one user action.
+
+    Inside scope(), DAOs that support it hand back the same object for the
+    same key and queue updates instead of writing them. Queued changes are
+    flushed in a single transaction when the outermost scope exits, after
+    which the identity map is cleared. DAOs flush early before reads that
+    SQL computes from committed rows (aggregates, trigger-maintained
+    tables), so those never see stale data. Outside a scope DAOs behave as
+    if no unit of work existed.
+
+    Entities are keyed by (kind, key), e.g. ("camp", camp_id). Each kind that
+    can be queued needs a writer registered with register_writer(); it
+    receives the open cursor and the entity.
+    """
+
+    def __init__(self, db_context):
+        self.db = db_context
+        self._writers = {}
+        self._identity = {}
+        self._pending = {}
+        self._depth = 0
+
+    @property
+    def active(self) -> bool:
+        return self._depth > 0
+
+    def register_writer(self, kind, writer):
+        self._writers[kind] = writer
+
+    @contextmanager
+    def scope(self):
+        """Begin (or join) a unit of work; flush when the outermost scope exits."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                try:
+                    self.flush()
+                finally:
+                    self._identity.clear()
+                    self._pending.clear()
+
+    def get(self, kind, key):
+        return self._identity.get((kind, key))
+
+    def find(self, kind, predicate):
+        """First mapped entity of kind matching predicate, or None."""
+        for (entity_kind, _), entity in self._identity.items():
+            if entity_kind == kind and predicate(entity):
+                return entity
+        return None
+
+    def attach(self, kind, key, entity):
+        """Return the mapped entity for key, mapping entity if there is none yet."""
+        return self._identity.setdefault((kind, key), entity)
+
+    def mark_dirty(self, kind, key, entity):
+        if kind not in self._writers:
+            raise ValueError(f"No writer registered for '{kind}'")
+        self._identity[(kind, key)] = entity
+        self._pending[(kind, key)] = entity
+
+    def evict(self, kind, key):
+        """Forget an entity so the next read reloads it (pending changes are dropped)."""
+        self._identity.pop((kind, key), None)
+        self._pending.pop((kind, key), None)
+
+    def discard(self):
+        """Forget every mapped entity and queued change, e.g. after the database was replaced."""
+        self._identity.clear()
+        self._pending.clear()
+
+    def flush(self):
+        """Write every queued change in one transaction."""
+        if not self._pending:
+            return
+        pending = list(self._pending.items())
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for (kind, _), entity in pending:
+                    self._writers[kind](cursor, entity)
+                conn.commit()
+            except Exception as exc:
+                logging.error(f"Error flushing unit of work: {exc}")
+                conn.rollback()
+                raise
+        self._pending.clear()
+        for _, entity in pending:
+            if isinstance(entity, ChangeTracker):
+                entity.mark_clean()
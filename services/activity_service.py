@@ -45,7 +45,7 @@ class ActivityService:
         Returns (success, message, conflict_activity_data).
         If conflict exists and force_replace is False, returns conflict data.
         """
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found.", None
 
@@ -93,7 +93,7 @@ class ActivityService:
         return True, f"Successfully scheduled '{activity_name}' for {date_str} ({session_name}).", None
 
     def remove_activity(self, camp_name: str, activity_index: int) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
 
@@ -107,7 +107,7 @@ class ActivityService:
         return True, f"Activity '{removed.name}' removed."
 
     def add_camper_to_activity(self, camp_name: str, activity_index: int, camper_identifier: str) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
 
@@ -130,7 +130,7 @@ class ActivityService:
         return True, f"Added {camper.name} to activity."
 
     def remove_camper_from_activity(self, camp_name: str, activity_index: int, camper_identifier: str) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
 
@@ -152,7 +152,7 @@ class ActivityService:
         return True, f"Removed {camper.name} from activity."
 
     def add_all_campers_to_activity(self, camp_name: str, activity_index: int) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
 
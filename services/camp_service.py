@@ -14,8 +14,7 @@ class CampService:
 
     def is_name_unique(self, name: str) -> bool:
         """Check if a camp name is unique across the system."""
-        camps = self.camp_manager.read_all()
-        return not any(c.name == name for c in camps)
+        return not self.camp_manager.name_exists(name)
 
     def validate_dates(self, start_date: date, end_date: date):
         """
@@ -60,7 +59,7 @@ class CampService:
         return camp
 
     def top_up_food(self, camp_name: str, amount: int) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
         
@@ -72,7 +71,7 @@ class CampService:
             return False, str(e)
 
     def update_location(self, camp_name: str, new_location: str) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
         
@@ -84,7 +83,7 @@ class CampService:
         return True, f"Location for '{camp.name}' updated to '{new_location}'."
 
     def get_conflicting_camps(self, leader_username: str, start_date: date, end_date: date, exclude_camp_id: str = None) -> List[Camp]:
-        leader_camps = self.camp_manager.get_camps_by_leader(leader_username)
+        leader_camps = self.camp_manager.get_camps_by_leader(leader_username, lazy=True)
         conflicts = []
 
         for other_camp in leader_camps:
@@ -103,7 +102,7 @@ class CampService:
         If conflicts found and force_unassign_leader is False, returns (False, "Conflict", conflicts).
         If force_unassign_leader is True, unassigns leader and updates dates.
         """
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found.", []
 
@@ -131,7 +130,7 @@ class CampService:
         return True, f"Dates for '{camp.name}' updated to {new_start} - {new_end}.", []
 
     def assign_leader(self, camp_name: str, leader_username: str) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
         
@@ -146,7 +145,7 @@ class CampService:
         return True, f"Leader '{leader_username}' assigned to '{camp.name}'."
 
     def add_equipment(self, camp_name: str, name: str, target: int, current: int, condition: str) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
         
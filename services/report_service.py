@@ -24,7 +24,7 @@ class ReportService:
         }
 
     def create_report(self, camp_name: str, leader_username: str, text: str, daily_participation: int, injury_flag: bool, injured_count: int, details: str) -> Tuple[bool, str]:
-        camp = self.camp_manager.find_camp(camp_name)
+        camp = self.camp_manager.find_camp(camp_name, lazy=True)
         if not camp:
             return False, f"Camp '{camp_name}' not found."
 
@@ -60,66 +60,64 @@ class ReportService:
         self.daily_report_manager.add_report(report)
         return True, "Report saved."
 
-    def get_reports_for_camp(self, camp_id: str) -> List[Dict[str, Any]]:
-        reports = [
-            r for r in self.daily_report_manager.read_all()
-            if r["camp_id"] == camp_id
-        ]
-        reports.sort(key=lambda r: (r.get("date", ""), r.get("created_at", "")), reverse=True)
+    def get_reports_for_camp(self, camp_id: str, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        return self.daily_report_manager.get_reports_for_camp(camp_id, limit=limit, offset=offset)
+
+    def get_reports_between(self, camp_id: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        return self.daily_report_manager.get_reports_between(camp_id, start_date, end_date)
+
+    def search_reports(self, leader_username: str, text: str) -> List[Dict[str, Any]]:
+        """Full-text search over reports of the leader's camps, best match first."""
+        camps = {c.camp_id: c.name for c in self.camp_manager.list_summaries(leader_username)}
+        reports = self.daily_report_manager.search(text, camp_ids=list(camps))
+        for report in reports:
+            report["camp_name"] = camps.get(report["camp_id"], "")
         return reports
 
     def delete_report(self, report_id: str) -> Tuple[bool, str]:
-        all_reports = self.daily_report_manager.read_all()
-        new_reports = [x for x in all_reports if x.get("report_id") != report_id]
-        
-        if len(all_reports) == len(new_reports):
+        if not self.daily_report_manager.delete_report(report_id):
             return False, "Report not found."
-            
-        self.daily_report_manager.save_all(new_reports)
         return True, "Report deleted."
 
     # Statistics Logic
-    def get_camp_statistics(self, camp: Camp, leader_username: str) -> Dict[str, Any]:
-        total_participants = len(camp.campers)
-        
+    def get_camp_statistics(self, camp, leader_username: str) -> Dict[str, Any]:
+        """Statistics for a Camp or CampSummary, read from the precomputed camp_stats row."""
+        stats = self.camp_manager.get_camp_stats(camp.camp_id)
+
         if not camp.has_camp_started():
             avg_rate = 0
             earnings = 0
         else:
-            avg_rate = self._get_average_participation_rate(camp)
+            avg_rate = self._get_average_participation_rate(camp, stats)
             earnings = self._get_earnings(leader_username, camp)
 
-        food_usage = self._get_food_usage(camp)
+        food_usage = self._get_food_usage(camp, stats["campers"])
         
-        all_reports = self.daily_report_manager.read_all()
-        camp_reports = [r for r in all_reports if r["camp_id"] == camp.camp_id]
-        
-        incident_count = sum(int(r.get("injured_count", 0)) for r in camp_reports)
-        activity_count = sum(len(r.get("activities", [])) for r in camp_reports)
-        achievement_count = sum(len(r.get("achievements", [])) for r in camp_reports)
+        incident_count = stats["injured"]
+        activity_count = stats["activities"]
+        achievement_count = stats["achievements"]
 
         return {
             "camp_name": camp.name,
-            "campers": total_participants,
+            "campers": stats["campers"],
             "participation_rate": avg_rate,
             "food_used": food_usage,
+            "food_consumed": stats["food_consumed"],
             "incidents": incident_count,
             "activities": activity_count,
             "achievements": achievement_count,
             "earnings": earnings
         }
 
-    def _get_average_participation_rate(self, camp: Camp) -> float:
-        total = len(camp.campers)
-        if total == 0: return 0
+    def _get_average_participation_rate(self, camp, stats: Optional[Dict[str, Any]] = None) -> float:
+        if stats is None:
+            stats = self.camp_manager.get_camp_stats(camp.camp_id)
 
-        reports = self.daily_report_manager.read_all()
-        daily_list = [r.get("daily_participation", 0) for r in reports if r.get("camp_id") == camp.camp_id]
-        
-        if not daily_list: return 0
+        total = stats["campers"]
+        if total == 0: return 0
+        if not stats["reports"]: return 0
 
-        avg_daily = sum(daily_list) / len(daily_list)
-        return round(avg_daily / total, 2)
+        return round(stats["average_participation"] / total, 2)
 
     def _get_earnings(self, leader_username: str, camp: Camp) -> float:
         user = self.user_manager.find_user(leader_username)
@@ -129,8 +127,7 @@ class ReportService:
         days = self._get_camp_days(camp)
         return daily_rate * days
 
-    def _get_food_usage(self, camp: Camp) -> int:
-        num_campers = len(camp.campers)
+    def _get_food_usage(self, camp, num_campers: int) -> int:
         food_per_camper = camp.food_per_camper_per_day
         if num_campers == 0 or food_per_camper == 0: return 0
         days = self._get_camp_days(camp)
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app_context import AppContext
+from models.users import register_user_types
+from models.users.class_map import user_from_dict
+from persistence.db_context import DBContext
+
+
+class TestAppContext(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_create_shares_one_db_context(self):
+        context = AppContext.create(self.db)
+
+        self.assertIs(context.db_context, self.db)
+        for manager in (context.user_manager, context.camp_manager, context.message_manager, context.audit_log_manager):
+            self.assertIs(manager.db, self.db)
+
+    def test_initialize_db_skips_ddl_when_schema_is_current(self):
+        statements = []
+        with self.db.connection() as conn:
+            conn.set_trace_callback(statements.append)
+            self.db.initialize_db()
+            conn.set_trace_callback(None)
+
+        self.assertFalse([s for s in statements if "CREATE" in s.upper()])
+
+    def test_user_from_dict_injects_user_manager(self):
+        register_user_types()
+        context = AppContext.create(self.db)
+
+        admin = user_from_dict({"username": "a", "password": "pw", "role": "Admin"}, user_manager=context.user_manager)
+        leader = user_from_dict({"username": "l", "password": "pw", "role": "Leader"}, user_manager=context.user_manager)
+
+        self.assertIs(admin.user_manager, context.user_manager)
+        self.assertEqual(leader.username, "l")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,273 @@
+import unittest
+import sys
+import os
+import gzip
+import json
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from persistence import backup
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.message_manager import MessageManager
+from persistence.dao.user_manager import UserManager
+from persistence.db_context import DBContext
+from persistence.json_stream import iter_json_array
+from tests.test_camp_manager import make_camp
+
+
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.backup_dir = os.path.join(self.tmp_dir, "backups")
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        UserManager(self.db).create_user("leader1", "pw", "Leader")
+        camps = CampManager(self.db)
+        for i in range(3):
+            camp = make_camp(i, camper_count=5)
+            camp.camp_leader = "leader1"
+            camps.add(camp)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _count(self, conn, table):
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_snapshot_is_a_complete_database(self):
+        steps = []
+        path = backup.create_backup(self.db, self.backup_dir, pages=1, progress=lambda done, total: steps.append(done))
+
+        self.assertTrue(path.endswith(".db.gz"))
+        self.assertEqual(os.listdir(self.backup_dir), [os.path.basename(path)])
+        self.assertGreater(len(steps), 1)
+
+        restored = os.path.join(self.tmp_dir, "restored.db")
+        with gzip.open(path, "rb") as src, open(restored, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        conn = sqlite3.connect(restored)
+        try:
+            self.assertEqual(conn.execute("PRAGMA integrity_check").fetchone()[0], "ok")
+            self.assertEqual(self._count(conn, "camps"), 3)
+            self.assertEqual(self._count(conn, "camp_campers"), 15)
+        finally:
+            conn.close()
+
+    def test_json_export_streams_every_table_in_chunks(self):
+        original_chunk = backup.EXPORT_CHUNK_ROWS
+        backup.EXPORT_CHUNK_ROWS = 4
+        try:
+            path = backup.export_json(self.db, self.backup_dir, compress=True)
+        finally:
+            backup.EXPORT_CHUNK_ROWS = original_chunk
+
+        elements = iter_json_array(path)
+        header = next(elements)
+        self.assertEqual(header["format"], backup.EXPORT_FORMAT)
+        self.assertEqual(header["tables"], list(backup.EXPORT_TABLES))
+
+        rows = {}
+        for chunk in elements:
+            self.assertLessEqual(len(chunk["rows"]), 4)
+            rows.setdefault(chunk["table"], []).extend(chunk["rows"])
+        self.assertEqual(len(rows["camps"]), 3)
+        self.assertEqual(len(rows["campers"]), 15)
+        self.assertEqual(list(rows)[:3], ["users", "camps", "campers"])
+
+        with self.db.connection() as conn:
+            self.assertEqual(
+                sorted(map(tuple, rows["camp_campers"])),
+                sorted(conn.execute("SELECT * FROM camp_campers").fetchall()),
+            )
+
+
+class TestRestore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.backup_dir = os.path.join(self.tmp_dir, "backups")
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        UserManager(self.db).create_user("leader1", "pw", "Leader")
+        UserManager(self.db).create_user("coord", "pw", "Coordinator")
+        self.camps = CampManager(self.db)
+        for i in range(2):
+            camp = make_camp(i, camper_count=4)
+            camp.camp_leader = "leader1"
+            self.camps.add(camp)
+        MessageManager(self.db).add({
+            "message_id": "m1", "from_user": "coord", "to_user": "leader1",
+            "content": "canoe trip moved", "sent_at": "2030-01-01 09:00:00",
+        })
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _replace_data(self):
+        """Change the live data after the backup was taken."""
+        camp = make_camp(9, camper_count=1)
+        camp.camp_leader = "leader1"
+        self.camps.add(camp)
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM camp_campers WHERE camp_id = (SELECT camp_id FROM camps WHERE name = 'Camp 0')")
+            conn.execute("DELETE FROM messages")
+            conn.commit()
+
+    def _assert_original_data(self):
+        self.assertEqual(sorted(c.name for c in self.camps.read_all()), ["Camp 0", "Camp 1"])
+        self.assertFalse(os.path.exists(self.db.db_path + ".restore"))
+        with self.db.connection() as conn:
+            self.assertEqual(conn.execute("SELECT SUM(camper_count) FROM camp_stats").fetchone()[0], 8)
+            self.assertEqual(conn.execute("PRAGMA foreign_key_check").fetchall(), [])
+        self.assertEqual(len(MessageManager(self.db).search("leader1", "canoe")), 1)
+
+    def test_restore_snapshot(self):
+        path = backup.create_backup(self.db, self.backup_dir)
+        self._replace_data()
+
+        counts = backup.restore_backup(self.db, path)
+
+        self.assertEqual((counts["camps"], counts["camp_campers"]), (2, 8))
+        self._assert_original_data()
+
+    def test_restore_json_export_rebuilds_derived_tables(self):
+        path = backup.export_json(self.db, self.backup_dir, compress=True)
+        self._replace_data()
+
+        loaded = []
+        backup.restore_backup(self.db, path, progress=lambda table, rows: loaded.append(table))
+
+        self.assertIn("campers", loaded)
+        self._assert_original_data()
+        with self.db.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0], 1)
+
+    def test_invalid_files_leave_the_database_untouched(self):
+        export = backup.export_json(self.db, self.backup_dir)
+        elements = list(iter_json_array(export))
+        elements.append({"table": "camp_campers", "columns": ["camp_id", "camper_id"], "rows": [["nope", "nope"]]})
+        broken = os.path.join(self.backup_dir, "broken.json")
+        legacy = os.path.join(self.backup_dir, "legacy.json")
+        with open(broken, "w", encoding="utf-8") as f:
+            json.dump(elements, f)
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump({"timestamp": "20240101_000000", "users": []}, f)
+
+        for path in (broken, legacy):
+            with self.assertRaises(ValueError):
+                backup.restore_backup(self.db, path)
+            self._assert_original_data()
+
+        self.assertEqual(
+            sorted(backup.list_backups(self.backup_dir)),
+            sorted(["broken.json", "legacy.json", os.path.basename(export)]),
+        )
+
+
+class TestIncrementalBackup(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.backup_dir = os.path.join(self.tmp_dir, "backups")
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        UserManager(self.db).create_user("leader1", "pw", "Leader")
+        self.camps = CampManager(self.db)
+        self._add_camp(0)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _add_camp(self, index):
+        camp = make_camp(index, camper_count=2)
+        camp.camp_leader = "leader1"
+        self.camps.add(camp)
+        return camp
+
+    def _state(self):
+        with self.db.connection() as conn:
+            return {
+                "camps": sorted(row[0] for row in conn.execute("SELECT name FROM camps")),
+                "food": conn.execute("SELECT current_food_stock FROM camps WHERE name = 'Camp 0'").fetchone()[0],
+                "campers": conn.execute("SELECT SUM(camper_count) FROM camp_stats").fetchone()[0],
+            }
+
+    def _logged(self):
+        with self.db.connection() as conn:
+            return conn.execute("SELECT table_name, op FROM change_log").fetchall()
+
+    def test_change_log_captures_writes_after_a_full_backup(self):
+        camp = self.camps.find_camp("Camp 0")
+        camp.current_food_stock = 10
+        self.camps.update(camp)
+        self.assertEqual(self._logged(), [])
+        with self.assertRaises(ValueError):
+            backup.create_incremental_backup(self.db, self.backup_dir)
+
+        backup.create_backup(self.db, self.backup_dir)
+        self.assertIsNone(backup.create_incremental_backup(self.db, self.backup_dir))
+        self._add_camp(1)
+        camp.current_food_stock = 5
+        self.camps.update(camp)
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM camp_campers WHERE camp_id = ?", (camp.camp_id,))
+            conn.execute("INSERT INTO audit_logs (username, action, timestamp) VALUES ('leader1', 'login', '2030-01-01')")
+            conn.commit()
+
+        ops = self._logged()
+        self.assertIn(("camps", "I"), ops)
+        self.assertIn(("camps", "U"), ops)
+        self.assertEqual(ops.count(("camp_campers", "D")), 2)
+        self.assertNotIn("audit_logs", {table for table, _ in ops})
+        backup.create_incremental_backup(self.db, self.backup_dir)
+        self.assertEqual(self._logged(), [])
+
+    def test_point_in_time_restore(self):
+        snapshot = backup.create_backup(self.db, self.backup_dir)
+        self._add_camp(1)
+        backup.create_incremental_backup(self.db, self.backup_dir)
+        time.sleep(0.01)
+        cutoff = datetime.now()
+        time.sleep(0.01)
+
+        camp = self.camps.find_camp("Camp 0")
+        camp.current_food_stock = 5
+        self.camps.update(camp)
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM camp_campers WHERE camp_id = ?", (camp.camp_id,))
+            conn.commit()
+        backup.create_incremental_backup(self.db, self.backup_dir)
+        self._add_camp(2)
+        self.assertEqual(len(backup.change_files_for(snapshot)), 2)
+        self.assertEqual(backup.list_backups(self.backup_dir), [os.path.basename(snapshot)])
+
+        backup.restore_backup(self.db, snapshot)
+        self.assertEqual(self._state(), {"camps": ["Camp 0"], "food": 80, "campers": 2})
+
+        backup.restore_backup(self.db, snapshot, replay=True, until=cutoff)
+        self.assertEqual(self._state(), {"camps": ["Camp 0", "Camp 1"], "food": 80, "campers": 4})
+
+        backup.restore_backup(self.db, snapshot, replay=True)
+        self.assertEqual(self._state(), {"camps": ["Camp 0", "Camp 1"], "food": 5, "campers": 2})
+
+        # The restored data starts a new chain.
+        with self.assertRaises(ValueError):
+            backup.create_incremental_backup(self.db, self.backup_dir)
+
+    def test_missing_incremental_backup_fails_the_restore(self):
+        snapshot = backup.create_backup(self.db, self.backup_dir)
+        self._add_camp(1)
+        first = backup.create_incremental_backup(self.db, self.backup_dir)
+        self._add_camp(2)
+        backup.create_incremental_backup(self.db, self.backup_dir)
+        os.remove(first)
+
+        with self.assertRaises(ValueError):
+            backup.restore_backup(self.db, snapshot, replay=True)
+        self.assertEqual(self._state()["camps"], ["Camp 0", "Camp 1", "Camp 2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
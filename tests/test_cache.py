@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from persistence.dao.activity_manager import ActivityManager
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.user_manager import UserManager
+from persistence.db_context import DBContext
+from tests.test_camp_manager import CountingDBContext, make_camp
+
+
+class TestDataVersionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        path = os.path.join(self.tmp_dir, "test.db")
+        self.db = CountingDBContext(path)
+        # A second context on the same file stands in for another CLI process.
+        self.other_db = DBContext(path)
+
+    def tearDown(self):
+        self.db.close()
+        self.other_db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _selects(self):
+        return [s for s in self.db.statements if s.lstrip().upper().startswith("SELECT")]
+
+    def test_hit_costs_only_the_version_check(self):
+        users = UserManager(self.db)
+        users.create_user("alice", "pw", "Admin")
+        users.read_all()
+        users.find_user("alice")
+
+        self.db.statements.clear()
+        self.assertEqual([u["username"] for u in users.read_all()], ["alice"])
+        self.assertEqual(users.find_user("alice")["role"], "Admin")
+        self.assertEqual(self._selects(), [])
+        self.assertTrue(all(s.startswith("PRAGMA data_version") for s in self.db.statements))
+
+    def test_find_user_reads_one_row(self):
+        users = UserManager(self.db)
+        users.create_user("alice", "pw", "Admin")
+        users.create_user("bob", "pw", "Leader")
+
+        self.db.statements.clear()
+        self.assertEqual(users.find_user("bob")["role"], "Leader")
+        self.assertIsNone(users.find_user("nobody"))
+        self.assertEqual(len(self._selects()), 2)
+        self.assertTrue(all("WHERE username =" in s for s in self._selects()))
+
+    def test_writes_from_another_connection_are_seen(self):
+        users = UserManager(self.db)
+        library = ActivityManager(self.db)
+        self.assertEqual(users.read_all(), [])
+        self.assertEqual(library.load_library(), {})
+
+        UserManager(self.other_db).create_user("bob", "pw", "Leader")
+        ActivityManager(self.other_db).add_activity("Archery", is_indoor=True)
+
+        self.assertEqual(users.find_user("bob")["role"], "Leader")
+        self.assertEqual(library.load_library(), {"Archery": {"is_indoor": True}})
+
+    def test_camp_reads_return_fresh_objects_and_see_own_writes(self):
+        camps = CampManager(self.db)
+        camps.add(make_camp(1))
+        first = camps.read_all()[0]
+
+        self.db.statements.clear()
+        second = camps.read_all()[0]
+        self.assertEqual(self._selects(), [])
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.campers[0], second.campers[0])
+
+        second.location = "Lake"
+        camps.update(second)
+        self.assertEqual(camps.read_all()[0].location, "Lake")
+
+        CampManager(self.other_db).add(make_camp(2))
+        self.assertEqual(len(camps.read_all(lazy=True)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
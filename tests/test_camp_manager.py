@@ -0,0 +1,319 @@
+import unittest
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from datetime import date
+from models.activity import Activity, Session
+from models.camp import Camp
+from models.camper import Camper
+from models.resource import Equipment
+from persistence.db_context import DBContext
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.daily_report_manager import DailyReportManager
+from persistence.dao.user_manager import UserManager
+
+
+class CountingDBContext(DBContext):
+    """DBContext that records every SQL statement executed on its connections."""
+
+    def __init__(self, db_path):
+        self.statements = []
+        super().__init__(db_path)
+
+    def get_connection(self, *args, **kwargs):
+        conn = super().get_connection(*args, **kwargs)
+        conn.set_trace_callback(self._record)
+        return conn
+
+    def _record(self, statement):
+        # Trigger programs are traced again under the SQL of the statement
+        # that fired them; keep one entry per executed statement.
+        if not self.statements or self.statements[-1] != statement:
+            self.statements.append(statement)
+
+
+def make_camp(index, camper_count=3):
+    campers = [Camper(name=f"Camper {index}-{i}", age=10 + i, contact="555", medical_info="None") for i in range(camper_count)]
+    activity = Activity("Archery", "2030-01-01", Session.Morning, is_indoor=False)
+    activity.campers = [c.camper_id for c in campers[:2]]
+    camp = Camp(
+        camp_id=None,
+        name=f"Camp {index}",
+        location="Forest",
+        camp_type="Adventure",
+        start_date=date(2030, 1, 1),
+        end_date=date(2030, 1, 3),
+        camp_leader=None,
+        campers=campers,
+        initial_food_stock=100,
+        equipment=[],
+        activities=[activity],
+    )
+    camp.equipment = [Equipment(f"eq-{index}", "Tent", camp.camp_id, target_quantity=5, current_quantity=3)]
+    camp.current_food_stock = 80
+    return camp
+
+
+class TestCampManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = CountingDBContext(os.path.join(self.tmp_dir, "test.db"))
+        self.camp_manager = CampManager(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _count_read_all_queries(self):
+        self.db.statements.clear()
+        camps = self.camp_manager.read_all()
+        selects = [s for s in self.db.statements if s.lstrip().upper().startswith("SELECT")]
+        return camps, len(selects)
+
+    def test_read_all_round_trips_camp_graph(self):
+        original = make_camp(1)
+        self.camp_manager.add(original)
+
+        camps = self.camp_manager.read_all()
+
+        self.assertEqual(len(camps), 1)
+        camp = camps[0]
+        self.assertEqual(camp.name, "Camp 1")
+        self.assertEqual(camp.current_food_stock, 80)
+        self.assertEqual({c.camper_id for c in camp.campers}, {c.camper_id for c in original.campers})
+        self.assertEqual(len(camp.activities), 1)
+        self.assertEqual(sorted(camp.activities[0].campers), sorted(original.activities[0].campers))
+        self.assertEqual([e.resource_id for e in camp.equipment], ["eq-1"])
+
+    def test_read_all_query_count_is_constant(self):
+        for i in range(3):
+            self.camp_manager.add(make_camp(i))
+        _, small_count = self._count_read_all_queries()
+
+        for i in range(3, 40):
+            self.camp_manager.add(make_camp(i))
+        camps, large_count = self._count_read_all_queries()
+
+        self.assertEqual(len(camps), 40)
+        self.assertEqual(small_count, large_count)
+
+    def test_get_camps_by_leader_only_hydrates_leader_camps(self):
+        UserManager(self.db).create_user("leader1", "pw", "Leader")
+        mine = make_camp(1)
+        mine.camp_leader = "leader1"
+        other = make_camp(2)
+        self.camp_manager.add(mine)
+        self.camp_manager.add(other)
+
+        camps = self.camp_manager.get_camps_by_leader("leader1")
+
+        self.assertEqual([c.name for c in camps], ["Camp 1"])
+        self.assertEqual(len(camps[0].campers), 3)
+        self.assertEqual(len(camps[0].activities[0].campers), 2)
+        self.assertEqual(self.camp_manager.get_camp_by_id(other.camp_id).name, "Camp 2")
+
+    def _writes(self):
+        return [s for s in self.db.statements if not s.lstrip().upper().startswith(("SELECT", "BEGIN", "COMMIT"))]
+
+    def test_update_of_one_field_writes_one_statement(self):
+        self.camp_manager.add(make_camp(1))
+        camp = self.camp_manager.read_all()[0]
+        camp.location = "Lake"
+
+        self.db.statements.clear()
+        self.camp_manager.update(camp)
+
+        writes = self._writes()
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].startswith("UPDATE camps SET location="))
+        self.assertEqual(self.camp_manager.get_camp_by_id(camp.camp_id).location, "Lake")
+
+    def test_update_applies_collection_changes_and_keeps_activity_ids(self):
+        self.camp_manager.add(make_camp(1))
+        camp = self.camp_manager.read_all()[0]
+        activity_id = camp.activities[0].activity_id
+        removed = camp.campers.pop()
+        camp.activities[0].campers.append(removed.camper_id)
+        camp.activities.append(Activity("Kayaking", "2030-01-02", Session.Afternoon, is_indoor=False))
+        camp.equipment[0].current_quantity = 5
+
+        self.camp_manager.update(camp)
+        self.db.statements.clear()
+        self.camp_manager.update(camp)
+        self.assertEqual(self._writes(), [])
+
+        reloaded = self.camp_manager.get_camp_by_id(camp.camp_id)
+        self.assertNotIn(removed.camper_id, {c.camper_id for c in reloaded.campers})
+        self.assertEqual(reloaded.activities[0].activity_id, activity_id)
+        self.assertEqual(len(reloaded.activities[0].campers), 3)
+        self.assertEqual([a.name for a in reloaded.activities], ["Archery", "Kayaking"])
+        self.assertEqual(reloaded.equipment[0].current_quantity, 5)
+
+    def test_update_of_untracked_camp_diffs_against_database(self):
+        original = make_camp(1)
+        self.camp_manager.add(original)
+        detached = Camp.from_dict(original.to_dict())
+        detached.name = "Renamed"
+
+        self.camp_manager.update(detached)
+
+        reloaded = self.camp_manager.get_camp_by_id(original.camp_id)
+        self.assertEqual(reloaded.name, "Renamed")
+        self.assertEqual(len(reloaded.campers), 3)
+        self.assertEqual(len(reloaded.activities), 1)
+
+    def _selects(self):
+        return [s for s in self.db.statements if s.lstrip().upper().startswith("SELECT")]
+
+    def test_lazy_read_all_loads_each_collection_once_for_all_camps(self):
+        for i in range(5):
+            self.camp_manager.add(make_camp(i))
+
+        self.db.statements.clear()
+        camps = self.camp_manager.read_all(lazy=True)
+        self.assertEqual(len(self._selects()), 1)
+
+        self.assertEqual(len(camps[0].campers), 3)
+        self.assertEqual([len(c.campers) for c in camps], [3] * 5)
+        self.assertEqual(len(self._selects()), 2)
+
+        self.assertEqual(len(camps[3].activities[0].campers), 2)
+        self.assertEqual(camps[4].equipment[0].resource_id, "eq-4")
+        self.assertEqual(len(self._selects()), 5)
+
+    def test_lazy_camp_update_only_writes_loaded_changes(self):
+        self.camp_manager.add(make_camp(1))
+        camp = self.camp_manager.read_all(lazy=True)[0]
+        camp.current_food_stock = 200
+
+        self.db.statements.clear()
+        self.camp_manager.update(camp)
+        self.assertEqual(len(self._writes()), 1)
+        self.assertEqual(self._selects(), [])
+
+        camp.campers.pop()
+        self.camp_manager.update(camp)
+
+        reloaded = self.camp_manager.get_camp_by_id(camp.camp_id)
+        self.assertEqual(reloaded.current_food_stock, 200)
+        self.assertEqual(len(reloaded.campers), 2)
+        self.assertEqual(len(reloaded.activities), 1)
+
+    def test_find_camp_hydrates_only_the_named_camp(self):
+        for i in range(20):
+            self.camp_manager.add(make_camp(i))
+
+        self.db.statements.clear()
+        camp = self.camp_manager.find_camp("Camp 7")
+
+        self.assertEqual(camp.name, "Camp 7")
+        self.assertEqual(len(camp.campers), 3)
+        self.assertEqual(len(self._selects()), 5)
+        self.assertTrue(all("Camp 1" not in s for s in self._selects()))
+        self.assertIsNone(self.camp_manager.find_camp("Missing"))
+        self.assertTrue(self.camp_manager.name_exists("Camp 19"))
+        self.assertFalse(self.camp_manager.name_exists("camp 19"))
+
+    def test_camp_names_are_unique(self):
+        self.camp_manager.add(make_camp(1))
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.camp_manager.add(make_camp(1))
+
+    def test_list_summaries_matches_hydrated_camps(self):
+        UserManager(self.db).create_user("leader1", "pw", "Leader")
+        for i in range(4):
+            camp = make_camp(i, camper_count=i)
+            if i % 2:
+                camp.camp_leader = "leader1"
+            if i == 3:
+                camp.activities.append(Activity("Kayak", "2030-01-02", Session.Morning, is_indoor=False))
+                camp.activities.append(Activity("Hike", "2030-01-03", Session.Morning, is_indoor=False))
+            self.camp_manager.add(camp)
+
+        self.db.statements.clear()
+        summaries = self.camp_manager.list_summaries()
+        self.assertEqual(len(self._selects()), 1)
+
+        camps = {c.camp_id: c for c in self.camp_manager.read_all()}
+        for summary in summaries:
+            camp = camps[summary.camp_id]
+            self.assertEqual(summary.name, camp.name)
+            self.assertEqual(summary.start_date, camp.start_date)
+            self.assertEqual(summary.camper_count, len(camp.campers))
+            self.assertEqual(summary.activity_count, len(camp.activities))
+            self.assertEqual(summary.current_food_stock, camp.current_food_stock)
+            self.assertEqual(summary.get_schedule_status(), camp.get_schedule_status())
+            self.assertEqual(summary.is_food_shortage(), camp.is_food_shortage())
+
+        mine = self.camp_manager.list_summaries("leader1")
+        self.assertEqual(sorted(s.name for s in mine), ["Camp 1", "Camp 3"])
+        self.assertEqual([s.get_schedule_status() for s in mine if s.name == "Camp 3"], ["Full"])
+
+    def test_camp_stats_follow_roster_report_and_food_writes(self):
+        reports = DailyReportManager(self.db)
+        camp = make_camp(1)
+        self.camp_manager.add(camp)
+        other = make_camp(2)
+        self.camp_manager.add(other)
+
+        reports.add_report({"report_id": "r1", "camp_id": camp.camp_id, "date": "2030-01-01", "text": "x",
+                            "daily_participation": 3, "injured_count": 1, "activities": ["Archery"]})
+        reports.add_report({"report_id": "r2", "camp_id": camp.camp_id, "date": "2030-01-02", "text": "x",
+                            "daily_participation": 2, "achievements": ["award"]})
+        reports.delete_report("r2")
+
+        loaded = self.camp_manager.get_camp_by_id(camp.camp_id)
+        loaded.campers.pop()
+        loaded.current_food_stock = 70
+        self.camp_manager.update(loaded)
+        loaded.current_food_stock = 75
+        self.camp_manager.update(loaded)
+
+        stats = self.camp_manager.get_camp_stats(camp.camp_id)
+        self.assertEqual(stats["campers"], 2)
+        self.assertEqual(
+            {key: stats[key] for key in ("reports", "participation_total", "average_participation", "injured", "activities", "achievements")},
+            {"reports": 1, "participation_total": 3, "average_participation": 3, "injured": 1, "activities": 1, "achievements": 0},
+        )
+        self.assertEqual((stats["food_consumed"], stats["food_added"]), (10, 5))
+
+        self.assertEqual(self.camp_manager.rebuild_camp_stats(), 2)
+        self.assertEqual(self.camp_manager.get_camp_stats(camp.camp_id), stats)
+        self.assertEqual(self.camp_manager.get_camp_stats(other.camp_id)["campers"], 3)
+        self.assertEqual(self.camp_manager.get_camp_stats("missing")["reports"], 0)
+
+    def test_activity_engagement_counts_campers_by_id_and_caches_until_attendance_changes(self):
+        camp = make_camp(1)
+        self.camp_manager.add(camp)
+        other = make_camp(2)
+        # Same names as the first camp's campers, but different people.
+        for i, camper in enumerate(other.campers):
+            camper.name = f"Camper 1-{i}"
+        kayak = Activity("Kayak", "2030-01-02", Session.Afternoon, is_indoor=False)
+        kayak.campers = [other.campers[2].camper_id]
+        other.activities.append(kayak)
+        self.camp_manager.add(other)
+
+        self.assertEqual(self.camp_manager.get_global_activity_engagement(), {"Archery": 0.67, "Kayak": 0.17})
+        self.assertEqual(
+            self.camp_manager.get_global_activity_engagement(camp_id=other.camp_id), {"Archery": 0.67, "Kayak": 0.33}
+        )
+        self.assertEqual(self.camp_manager.get_global_activity_engagement(start_date=date(2030, 1, 2)), {"Kayak": 0.17})
+
+        DailyReportManager(self.db).add_report({"report_id": "r1", "camp_id": camp.camp_id, "date": "2030-01-01"})
+        self.db.statements.clear()
+        self.camp_manager.get_global_activity_engagement()
+        self.assertFalse([s for s in self.db.statements if "activity_attendance" in s])
+
+        loaded = self.camp_manager.get_camp_by_id(camp.camp_id)
+        loaded.activities[0].campers.pop()
+        self.camp_manager.update(loaded)
+        self.assertEqual(self.camp_manager.get_global_activity_engagement()["Archery"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,7 +15,7 @@ class TestCampService(unittest.TestCase):
 
     def test_create_camp_success(self):
         # Setup
-        self.mock_camp_manager.read_all.return_value = []
+        self.mock_camp_manager.name_exists.return_value = False
         start_date = date.today() + timedelta(days=1)
         end_date = date.today() + timedelta(days=5)
         
@@ -36,9 +36,7 @@ class TestCampService(unittest.TestCase):
 
     def test_create_camp_duplicate_name(self):
         # Setup
-        existing_camp = MagicMock(spec=Camp)
-        existing_camp.name = "Existing Camp"
-        self.mock_camp_manager.read_all.return_value = [existing_camp]
+        self.mock_camp_manager.name_exists.return_value = True
         
         start_date = date.today() + timedelta(days=1)
         end_date = date.today() + timedelta(days=5)
@@ -54,6 +52,7 @@ class TestCampService(unittest.TestCase):
                 initial_food_stock=100
             )
         self.assertIn("already exists", str(context.exception))
+        self.mock_camp_manager.name_exists.assert_called_once_with("Existing Camp")
 
     def test_validate_dates_past_start_date(self):
         start_date = date.today() - timedelta(days=1)
@@ -0,0 +1,195 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from datetime import date
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.activity import Activity, Session
+from models.camper import Camper
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.camper_manager import CamperManager
+from persistence.dao.user_manager import UserManager
+from persistence.db_context import DBContext
+from tests.test_camp_manager import make_camp
+
+
+class TestCamperSearch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        UserManager(self.db).create_user("leader1", "pw", "Leader")
+        UserManager(self.db).create_user("leader2", "pw", "Leader")
+        self.camps = CampManager(self.db)
+        self.campers = CamperManager(self.db)
+
+        self.mine = make_camp(1, camper_count=0)
+        self.mine.camp_leader = "leader1"
+        self.mine.campers = [
+            Camper("Annabel Lee", 11, contact="07700 900123"),
+            Camper("Ann", 12, contact="ann@example.com"),
+            Camper("Joanna Smith", 10, contact="07700 900456"),
+            Camper("Bob Marley", 13, contact="Annie (mum)"),
+        ]
+        self.camps.add(self.mine)
+
+        other = make_camp(2, camper_count=0)
+        other.camp_leader = "leader2"
+        other.campers = [Camper("Ann Other", 12, contact="none")]
+        self.camps.add(other)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _names(self, results):
+        return [camper.name for _, camper in results]
+
+    def test_ranks_exact_then_prefix_then_substring_then_contact(self):
+        results = self.campers.search("ANN", leader_username="leader1")
+
+        self.assertEqual(self._names(results), ["Ann", "Annabel Lee", "Joanna Smith", "Bob Marley"])
+        camp_name, camper = results[0]
+        self.assertEqual(camp_name, "Camp 1")
+        self.assertEqual(camper.contact, "ann@example.com")
+        self.assertEqual(camper.camper_id, self.mine.campers[1].camper_id)
+
+    def test_filters_by_leader_and_matches_contacts(self):
+        self.assertEqual(self._names(self.campers.search("ann oth")), ["Ann Other"])
+        self.assertEqual(self.campers.search("ann oth", leader_username="leader1"), [])
+        self.assertEqual(self._names(self.campers.search("900456", leader_username="leader1")), ["Joanna Smith"])
+
+    def test_short_queries_and_new_campers(self):
+        self.assertEqual(self._names(self.campers.search("an", leader_username="leader1", limit=2)), ["Ann", "Annabel Lee"])
+
+        camp = self.camps.get_camp_by_id(self.mine.camp_id)
+        camp.campers.append(Camper("Zara Quinn", 9, contact="01632 960000"))
+        self.camps.update(camp)
+        self.assertEqual(self._names(self.campers.search("quinn", leader_username="leader1")), ["Zara Quinn"])
+
+    def test_index_survives_unrelated_writes(self):
+        self.campers.search("ann", leader_username="leader1")
+        index = self.campers.search_cache._entries["leader1"][1]
+
+        camp = self.camps.get_camp_by_id(self.mine.camp_id)
+        camp.current_food_stock = 5
+        self.camps.update(camp)
+        UserManager(self.db).create_user("leader3", "pw", "Leader")
+        self.campers.search("ann", leader_username="leader1")
+        self.assertIs(self.campers.search_cache._entries["leader1"][1], index)
+
+        camp.name = "Lakeside"
+        self.camps.update(camp)
+        self.assertEqual(self.campers.search("ann", leader_username="leader1")[0][0], "Lakeside")
+
+
+class TestCamperImport(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        self.camps = CampManager(self.db)
+        self.campers = CamperManager(self.db)
+        self.campers.DEF_PATH = self.tmp_dir
+
+        self.camp = make_camp(1, camper_count=2)
+        self.camps.add(self.camp)
+        self.camps.add(make_camp(2, camper_count=2))
+        later = make_camp(3, camper_count=0)
+        later.start_date, later.end_date = date(2031, 1, 1), date(2031, 1, 2)
+        later.campers = [Camper("Zed", 9)]
+        self.camps.add(later)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write_csv(self, filename, rows):
+        with open(os.path.join(self.tmp_dir, filename), "w", newline="", encoding="utf-8") as f:
+            f.write("name,age,contact,medical_info\n")
+            f.writelines(f"{row}\n" for row in rows)
+
+    def test_import_skips_registered_names_and_inserts_in_chunks(self):
+        self._write_csv("campers.csv", [
+            "camper 1-0,10,1,", "Camper 2-1,11,2,", "Zed,9,3,", "New Kid,x,4,Asthma", "new kid,12,5,", ",13,6,",
+        ])
+        progress = []
+
+        results = self.campers.import_campers_from_csv(
+            self.camp, "campers.csv", progress=lambda *counts: progress.append(counts), chunk_size=1
+        )
+
+        self.assertEqual((results["imported_count"], results["skipped_count"], results["errors"]), (2, 3, []))
+        self.assertIn("Skipping 'Camper 2-1': Already registered in overlapping camp 'Camp 2'.", results["warnings"])
+        self.assertEqual(progress, [(3, 1), (4, 2), (6, 2)])
+
+        campers = {c.name: c for c in self.camps.get_camp_by_id(self.camp.camp_id).campers}
+        self.assertEqual(sorted(campers), ["Camper 1-0", "Camper 1-1", "New Kid", "Zed"])
+        self.assertEqual((campers["New Kid"].age, campers["New Kid"].medical_info), (0, "Asthma"))
+        self.assertEqual(self.camps.get_camp_stats(self.camp.camp_id)["campers"], 4)
+
+    def test_failed_import_writes_nothing(self):
+        self._write_csv("bad.csv", ["Amy,10,1,", "Ben,11,2,"])
+        with open(os.path.join(self.tmp_dir, "bad.csv"), "ab") as f:
+            f.write(b"\xff\xfe,12,3,\n")
+
+        results = self.campers.import_campers_from_csv(self.camp, "bad.csv", chunk_size=1)
+
+        self.assertEqual(results["imported_count"], 0)
+        self.assertEqual(len(results["errors"]), 1)
+        self.assertEqual(len(self.camps.get_camp_by_id(self.camp.camp_id).campers), 2)
+
+    def test_bulk_import_resolves_conflicts_in_file_order(self):
+        second = make_camp(4, camper_count=0)
+        self.camps.add(second)
+        self._write_csv("camp_1.csv", ["Amy,10,1,", "AMY,10,1,", "Ben,11, 2 ,"])
+        self._write_csv("camp_4.csv", ["ben,12,3,", "Cal,13,4,"])
+
+        matched, unmatched = self.campers.match_roster_files(["camp_4.csv", "Camp-1.csv", "other.csv"], [self.camp, second])
+        self.assertEqual([(camp.name, f) for camp, f in matched], [("Camp 4", "camp_4.csv"), ("Camp 1", "Camp-1.csv")])
+        self.assertEqual(unmatched, ["other.csv"])
+
+        report = self.campers.import_campers_bulk(
+            [(self.camp, "camp_1.csv"), (second, "camp_4.csv"), (second, "missing.csv")], max_workers=2
+        )
+
+        self.assertEqual(
+            [(r["file"], r["imported_count"], r["skipped_count"], len(r["errors"])) for r in report["files"]],
+            [("camp_1.csv", 2, 1, 0), ("camp_4.csv", 1, 1, 0), ("missing.csv", 0, 0, 1)],
+        )
+        self.assertEqual((report["imported_count"], report["skipped_count"], report["error_count"]), (3, 2, 1))
+        self.assertIn("Skipping 'ben': Already registered in overlapping camp 'Camp 1'.", report["files"][1]["warnings"])
+        ben = [c for c in self.camps.get_camp_by_id(self.camp.camp_id).campers if c.name == "Ben"]
+        self.assertEqual(ben[0].contact, "2")
+        self.assertEqual([c.name for c in self.camps.get_camp_by_id(second.camp_id).campers], ["Cal"])
+
+    def test_roster_import_fills_selected_activities(self):
+        camp = self.camps.get_camp_by_id(self.camp.camp_id)
+        camp.activities.append(Activity("Canoe", "2030-01-02", Session.Afternoon, is_indoor=False))
+        self.camps.update(camp)
+        archery, canoe = self.camps.get_camp_by_id(self.camp.camp_id).activities
+        self._write_csv("roster.csv", ["CAMPER 1-0", "camper 1-1", "Ghost", ""])
+        with open(os.path.join(self.tmp_dir, "routed.csv"), "w", encoding="utf-8") as f:
+            f.write("name,activity\nCamper 1-1,canoe\nCamper 1-0,Swim\n")
+
+        results = self.campers.import_roster_to_activities(self.camp, "roster.csv", chunk_size=1)
+
+        self.assertEqual(
+            [(a["name"], a["imported_count"], a["skipped_count"]) for a in results["activities"]],
+            [("Archery", 0, 2), ("Canoe", 2, 0)],
+        )
+        self.assertEqual((results["skipped_count"], results["errors"]), (1, []))
+
+        results = self.campers.import_roster_to_activities(self.camp, "routed.csv", activity_ids=[archery.activity_id])
+        self.assertEqual(
+            [(a["name"], a["imported_count"]) for a in results["activities"]], [("Archery", 0)]
+        )
+        self.assertEqual(results["skipped_count"], 2)
+
+        reloaded = self.camps.get_camp_by_id(self.camp.camp_id)
+        self.assertEqual(len(reloaded.activities[1].campers), 2)
+        self.assertEqual(set(reloaded.activities[0].campers), set(archery.campers))
+
+
+if __name__ == "__main__":
+    unittest.main()
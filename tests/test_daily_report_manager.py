@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.daily_report_manager import DailyReportManager
+from persistence.db_context import DBContext
+from services.report_service import ReportService
+from tests.test_camp_manager import make_camp
+
+
+class TestDailyReportManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        self.camps = CampManager(self.db)
+        self.camp = make_camp(1)
+        self.camps.add(self.camp)
+        other = make_camp(2)
+        self.camps.add(other)
+        self.reports = DailyReportManager(self.db)
+
+        self._report("r1", self.camp.camp_id, "2030-01-01", daily_participation=3, injury=True, injured_count=2,
+                     activities=["Archery"], achievements=["award", "improved"])
+        self._report("r2", self.camp.camp_id, "2030-01-02", daily_participation=1, injury=False, injured_count=0,
+                     activities=["Archery", "Canoe"], achievements=[])
+        self._report("r3", other.camp_id, "2030-01-01", daily_participation=9, injured_count=5, activities=["Hike"])
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _report(self, report_id, camp_id, date, **fields):
+        self.reports.add_report({"report_id": report_id, "camp_id": camp_id, "date": date, "text": "x", **fields})
+
+    def test_statistics_come_from_report_columns(self):
+        camp = self.camps.get_camp_by_id(self.camp.camp_id)
+        service = ReportService(self.reports, self.camps, user_manager=None)
+
+        self.assertEqual(service._get_average_participation_rate(camp), round(2 / len(camp.campers), 2))
+        stats = service.get_camp_statistics(camp, "nobody")
+        self.assertEqual((stats["incidents"], stats["activities"], stats["achievements"]), (2, 3, 2))
+        days = service._get_camp_days(camp)
+        self.assertEqual(stats["food_used"], len(camp.campers) * camp.food_per_camper_per_day * days)
+        self.assertEqual(stats["food_consumed"], 0)
+        self.assertEqual(self.camps.get_camp_stats("missing")["reports"], 0)
+
+    def test_camp_reports_are_paged_newest_first(self):
+        self._report("r4", self.camp.camp_id, "2030-01-03")
+        ids = lambda reports: [r["report_id"] for r in reports]
+
+        self.assertEqual(ids(self.reports.get_reports_for_camp(self.camp.camp_id)), ["r4", "r2", "r1"])
+        self.assertEqual(ids(self.reports.get_reports_for_camp(self.camp.camp_id, limit=2, offset=2)), ["r1"])
+        self.assertEqual(ids(self.reports.get_reports_between(self.camp.camp_id, "2030-01-02", "2030-01-03")), ["r4", "r2"])
+        self.assertEqual(self.reports.get_reports_for_camp(self.camp.camp_id, limit=2)[1]["daily_participation"], 1)
+
+    def test_delete_removes_only_that_report(self):
+        service = ReportService(self.reports, self.camps, user_manager=None)
+
+        self.assertEqual(service.delete_report("r1"), (True, "Report deleted."))
+        self.assertEqual(service.delete_report("r1"), (False, "Report not found."))
+        self.assertEqual(sorted(r["report_id"] for r in self.reports.read_all()), ["r2", "r3"])
+        self.assertEqual(self.camps.get_camp_stats(self.camp.camp_id)["injured"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from persistence.db_context import DBContext
+
+
+class TestDBContext(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"), pragmas={"cache_size": -2000})
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_connection_is_reused_within_a_thread(self):
+        with self.db.connection() as first:
+            pass
+        with self.db.connection() as second:
+            self.assertIs(first, second)
+
+        other = []
+
+        def worker():
+            with self.db.connection() as conn:
+                other.append(conn)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], first)
+
+    def test_pragmas_are_applied(self):
+        with self.db.connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -2000)
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+
+    def test_uncommitted_work_is_rolled_back_on_exit(self):
+        with self.db.connection() as conn:
+            conn.execute("INSERT INTO users (username, password, role) VALUES ('a', 'pw', 'Admin')")
+            with self.db.connection():
+                pass
+            self.assertTrue(conn.in_transaction)
+
+        with self.db.connection() as conn:
+            self.assertFalse(conn.in_transaction)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM users").fetchone()[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from persistence.dao.message_manager import MessageManager
+from persistence.dao.user_manager import UserManager
+from persistence.db_context import DBContext
+
+
+class MessageTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        users = UserManager(self.db)
+        for username in ("alice", "bob", "carol"):
+            users.create_user(username, "pw", "Leader")
+        self.messages = MessageManager(self.db)
+
+        # 30 alternating messages between alice and bob, two per minute so
+        # sent_at ties are broken by message_id, plus noise from carol.
+        for i in range(30):
+            sender, recipient = ("alice", "bob") if i % 2 else ("bob", "alice")
+            self._send(f"m{i:03}", sender, recipient, f"2030-01-01T10:{i // 2:02}:00")
+        for i in range(10):
+            self._send(f"c{i:03}", "carol", "alice", f"2030-01-01T11:{i:02}:00")
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _send(self, message_id, sender, recipient, sent_at):
+        self.messages.add({
+            "message_id": message_id,
+            "from_user": sender,
+            "to_user": recipient,
+            "content": message_id,
+            "sent_at": sent_at,
+        })
+
+
+class TestMessageThread(MessageTestCase):
+    def test_latest_page_is_oldest_first(self):
+        page = self.messages.get_thread("alice", "bob", limit=5)
+        self.assertEqual([m["message_id"] for m in page], ["m025", "m026", "m027", "m028", "m029"])
+        self.assertEqual(page, self.messages.get_thread("bob", "alice", limit=5))
+
+    def test_pages_walk_back_through_history_without_gaps(self):
+        loaded = self.messages.get_thread("alice", "bob", limit=7)
+        while True:
+            oldest = loaded[0]
+            older = self.messages.get_thread("alice", "bob", before=(oldest["sent_at"], oldest["message_id"]), limit=7)
+            if not older:
+                break
+            loaded = older + loaded
+
+        self.assertEqual([m["message_id"] for m in loaded], [f"m{i:03}" for i in range(30)])
+
+    def test_mark_thread_as_read_only_touches_that_thread(self):
+        self.messages.mark_thread_as_read("alice", "bob")
+
+        self.assertEqual(self.messages.get_unread_message_count("alice"), 10)
+        self.assertEqual(self.messages.get_unread_message_count("bob"), 15)
+
+
+class TestConversations(MessageTestCase):
+    def _conversation_rows(self):
+        with self.db.connection() as conn:
+            return conn.execute("SELECT * FROM conversations ORDER BY user_low, user_high").fetchall()
+
+    def assertMatchesRebuild(self):
+        maintained = self._conversation_rows()
+        self.messages.rebuild_conversations()
+        self.assertEqual(maintained, self._conversation_rows())
+
+    def test_inbox_is_read_from_conversations(self):
+        summaries = self.messages.get_conversation_summaries("alice")
+
+        self.assertEqual([s["partner"] for s in summaries], ["carol", "bob"])
+        self.assertEqual([s["unread_count"] for s in summaries], [10, 15])
+        self.assertEqual(summaries[0]["last_message"]["message_id"], "c009")
+        self.assertEqual(summaries[1]["preview"], "m029")
+        self.assertEqual(self.messages.get_conversation_summaries("bob")[0]["unread_count"], 15)
+
+    def test_counters_follow_every_write(self):
+        self.assertMatchesRebuild()
+
+        self.messages.mark_as_read_batch(["m000", "m002", "m001", "c000", "m000"])
+        self.assertEqual(self.messages.get_conversation_summaries("alice")[1]["unread_count"], 13)
+        self.assertMatchesRebuild()
+
+        moved = self.messages.get_thread("alice", "bob", limit=1)[0]
+        self.messages.update({**moved, "from_user": "carol", "sent_at": "2030-01-02T09:00:00"})
+        self.assertMatchesRebuild()
+        latest = {s["partner"]: s["last_message"]["message_id"] for s in self.messages.get_conversation_summaries("bob")}
+        self.assertEqual(latest, {"alice": "m028", "carol": "m029"})
+
+        self.messages.mark_thread_as_read("alice", "carol")
+        self.assertMatchesRebuild()
+        self.assertEqual(self.messages.get_unread_message_count("alice"), 13)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from persistence.db_context import DBContext
+from persistence.migrations import LATEST_VERSION, apply_migrations, get_schema_version
+
+
+class TestMigrations(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_unique_name_migration_renames_duplicates(self):
+        with self.db.connection() as conn:
+            conn.execute("DROP INDEX idx_camps_name")
+            conn.execute("PRAGMA user_version = 1")
+            conn.executemany(
+                "INSERT INTO camps (camp_id, name) VALUES (?, ?)",
+                [("a", "Lakeside"), ("b", "Lakeside"), ("c", "Lakeside (2)"), ("d", "Lakeside")],
+            )
+            conn.commit()
+
+            apply_migrations(conn)
+
+            names = dict(conn.execute("SELECT camp_id, name FROM camps").fetchall())
+            self.assertEqual(names, {"a": "Lakeside", "b": "Lakeside (3)", "c": "Lakeside (2)", "d": "Lakeside (4)"})
+            self.assertEqual(get_schema_version(conn), LATEST_VERSION)
+
+    def test_conversations_migration_backfills_existing_messages(self):
+        with self.db.connection() as conn:
+            conn.execute("DROP TABLE conversations")
+            conn.execute("PRAGMA user_version = 3")
+            conn.executemany("INSERT INTO users (username, password, role) VALUES (?, 'pw', 'Leader')", [("amy",), ("ben",)])
+            conn.executemany(
+                "INSERT INTO messages (message_id, from_user, to_user, content, sent_at, mark_as_read) VALUES (?, ?, ?, 'x', ?, ?)",
+                [("m1", "amy", "ben", "2030-01-01", 0), ("m2", "ben", "amy", "2030-01-02", 1), ("m3", "amy", "ben", "2030-01-02", 0)],
+            )
+            conn.commit()
+
+            apply_migrations(conn)
+
+            rows = conn.execute("SELECT * FROM conversations").fetchall()
+            self.assertEqual(rows, [("amy", "ben", "m3", "2030-01-02", 0, 2)])
+
+    def test_report_columns_migration_backfills_from_json(self):
+        with self.db.connection() as conn:
+            conn.execute("INSERT INTO camps (camp_id, name) VALUES ('c', 'Camp')")
+            conn.executemany(
+                "INSERT INTO daily_reports (report_id, camp_id, date, content) VALUES (?, 'c', '2030-01-01', ?)",
+                [
+                    ("r1", '{"daily_participation": 4, "injury": true, "injured_count": 1, "activities": ["Hike"], "achievements": ["award", "improved"]}'),
+                    ("r2", "plain text report"),
+                ],
+            )
+            conn.execute("PRAGMA user_version = 5")
+            conn.commit()
+
+            apply_migrations(conn)
+
+            rows = conn.execute(
+                "SELECT report_id, daily_participation, injury, injured_count, activity_count, achievement_count FROM daily_reports ORDER BY report_id"
+            ).fetchall()
+            self.assertEqual(rows, [("r1", 4, 1, 1, 1, 2), ("r2", 0, 0, 0, 0, 0)])
+
+    def test_camp_stats_migration_backfills_existing_camps(self):
+        with self.db.connection() as conn:
+            conn.execute("INSERT INTO camps (camp_id, name, initial_food_stock, current_food_stock) VALUES ('c', 'Camp', 50, 35)")
+            conn.execute("INSERT INTO campers (camper_id, name) VALUES ('k', 'Kim')")
+            conn.execute("INSERT INTO camp_campers (camp_id, camper_id) VALUES ('c', 'k')")
+            conn.execute(
+                "INSERT INTO daily_reports (report_id, camp_id, date, content, daily_participation, injured_count) "
+                "VALUES ('r', 'c', '2030-01-01', 'x', 6, 2)"
+            )
+            conn.execute("DELETE FROM camp_stats")
+            conn.execute("PRAGMA user_version = 7")
+            conn.commit()
+
+            apply_migrations(conn)
+
+            row = conn.execute("SELECT * FROM camp_stats").fetchone()
+            self.assertEqual(row, ("c", 1, 1, 6, 2, 0, 0, 15, 0))
+
+    def test_change_log_migration_limits_capture_to_replayed_tables(self):
+        with self.db.connection() as conn:
+            conn.execute(
+                "CREATE TRIGGER change_log_audit_logs_ai AFTER INSERT ON audit_logs BEGIN "
+                "INSERT INTO change_log (changed_at, table_name, op, row_key) VALUES ('now', 'audit_logs', 'I', '[]'); END"
+            )
+            conn.execute("INSERT INTO audit_logs (username, action) VALUES ('amy', 'login')")
+            conn.execute("PRAGMA user_version = 11")
+            conn.commit()
+
+            apply_migrations(conn)
+
+            triggers = {row[0] for row in conn.execute("SELECT tbl_name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'change_log_%'")}
+            self.assertNotIn("audit_logs", triggers)
+            self.assertIn("camps", triggers)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM change_log").fetchone()[0], 0)
+
+            conn.execute("INSERT INTO camps (camp_id, name) VALUES ('c', 'Camp')")
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM change_log").fetchone()[0], 0)
+            conn.execute("INSERT INTO backup_checkpoints (seq, base, file, created_at) VALUES (0, 'b', 'b', 'now')")
+            conn.execute("UPDATE camps SET name = 'Lake' WHERE camp_id = 'c'")
+            self.assertEqual(conn.execute("SELECT table_name, op FROM change_log").fetchall(), [("camps", "U")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import unittest
+import sys
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.sys_notification import SystemNotification
+from persistence.db_context import DBContext
+from persistence.migrations import LATEST_VERSION, get_schema_version
+from persistence.dao.activity_manager import ActivityManager
+from persistence.dao.announcement_manager import AnnouncementManager
+from persistence.dao.audit_log_manager import AuditLogManager
+from persistence.dao.camp_manager import CampManager
+from persistence.dao.camper_manager import CamperManager
+from persistence.dao.daily_report_manager import DailyReportManager
+from persistence.dao.message_manager import MessageManager
+from persistence.dao.system_notification_manager import SystemNotificationManager
+from persistence.dao.user_manager import UserManager
+from tests.test_camp_manager import make_camp
+
+# Tables that grow with usage; a lookup on any of these must not scan the whole table.
+HOT_TABLES = {
+    "camps",
+    "campers",
+    "camp_campers",
+    "scheduled_activities",
+    "activity_attendance",
+    "equipment",
+    "messages",
+    "conversations",
+    "camp_stats",
+    "daily_reports",
+    "audit_logs",
+    "system_notifications",
+}
+
+BARE_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+class RecordingDBContext(DBContext):
+    def __init__(self, db_path):
+        self.statements = []
+        super().__init__(db_path)
+
+    def get_connection(self, *args, **kwargs):
+        conn = super().get_connection(*args, **kwargs)
+        conn.set_trace_callback(self.statements.append)
+        return conn
+
+
+class TestQueryPlans(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "test.db")
+        self.db = RecordingDBContext(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _exercise_daos(self):
+        users = UserManager(self.db)
+        users.create_user("leader1", "pw", "Leader")
+        users.create_user("coord", "pw", "Coordinator")
+        users.find_user("leader1")
+        users.update_password("leader1", "pw2")
+        users.toggle_user_status("leader1", True)
+
+        camps = CampManager(self.db)
+        camp = make_camp(1)
+        camp.camp_leader = "leader1"
+        camps.add(camp)
+        camps.read_all()
+        camps.get_camp_by_id(camp.camp_id)
+        camps.find_camp(camp.name)
+        camps.name_exists(camp.name)
+        camps.list_summaries("leader1")
+        camps.get_camp_stats(camp.camp_id)
+        loaded = camps.get_camps_by_leader("leader1")[0]
+        loaded.location = "Lake"
+        loaded.campers.pop()
+        loaded.activities[0].campers.pop()
+        loaded.equipment[0].current_quantity = 1
+        camps.update(loaded)
+        camps.get_global_activity_engagement(camp_id=camp.camp_id)
+        camps.get_global_activity_engagement(start_date="2030-01-01", end_date="2030-01-31")
+
+        messages = MessageManager(self.db)
+        message = {"message_id": "m1", "from_user": "coord", "to_user": "leader1", "content": "hi", "sent_at": "2030-01-01T10:00:00"}
+        messages.add(message)
+        messages.update({**message, "content": "hello"})
+        messages.mark_as_read_batch(["m1"])
+        messages.get_unread_message_count("leader1")
+        messages.get_conversation_summaries("leader1")
+        messages.get_thread("leader1", "coord")
+        messages.get_thread("leader1", "coord", before=("2030-01-01T10:00:00", "m1"))
+        messages.mark_thread_as_read("leader1", "coord")
+        messages.search("leader1", "hello")
+
+        notifications = SystemNotificationManager(self.db)
+        notifications.add(SystemNotification("n1", "leader1", "info", "note"))
+        notifications.get_user_notifications("leader1")
+
+        audit = AuditLogManager(self.db)
+        audit.log_event("coord", "login")
+        audit.get_logs_by_user("coord")
+
+        DailyReportManager(self.db).add_report({"report_id": "r1", "camp_id": camp.camp_id, "date": "2030-01-01"})
+        AnnouncementManager(self.db).add({"announcement_id": "a1", "author": "coord", "content": "x", "created_at": "2030-01-01"})
+        AnnouncementManager(self.db).get_latest()
+        AnnouncementManager(self.db).search("x")
+        DailyReportManager(self.db).search("hike", camp_ids=[camp.camp_id])
+        DailyReportManager(self.db).get_reports_for_camp(camp.camp_id, limit=10, offset=10)
+        DailyReportManager(self.db).get_reports_between(camp.camp_id, "2030-01-01", "2030-01-31")
+        DailyReportManager(self.db).delete_report("r1")
+        ActivityManager(self.db).add_activity("Archery")
+        CamperManager(self.db).search("camper", leader_username="leader1")
+
+        importer = CamperManager(self.db)
+        importer.DEF_PATH = self.tmp_dir
+        with open(os.path.join(self.tmp_dir, "campers.csv"), "w", encoding="utf-8") as f:
+            f.write("name,age\nNew Kid,10\n")
+        importer.import_campers_from_csv(camp, "campers.csv")
+        importer.import_roster_to_activities(camp, "campers.csv")
+
+    def test_migrations_record_schema_version(self):
+        with self.db.connection() as conn:
+            self.assertEqual(get_schema_version(conn), LATEST_VERSION)
+
+    def test_hot_queries_do_not_scan_tables(self):
+        self.db.statements.clear()
+        self._exercise_daos()
+
+        queries = {
+            s for s in self.db.statements
+            if s.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")) and " WHERE " in " ".join(s.upper().split())
+        }
+        self.assertTrue(queries)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            offenders = []
+            for query in sorted(queries):
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {query}"):
+                    match = BARE_SCAN.match(row[3])
+                    if match and match.group(1) in HOT_TABLES:
+                        offenders.append(f"{row[3]}: {' '.join(query.split())}")
+        finally:
+            conn.close()
+
+        self.assertEqual(offenders, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.search_snippet import MATCH_END, MATCH_START
+from persistence.dao.announcement_manager import AnnouncementManager
+from persistence.dao.daily_report_manager import DailyReportManager
+from persistence.dao.message_manager import MessageManager
+from persistence.dao.user_manager import UserManager
+from persistence.db_context import DBContext
+from persistence.search import rebuild_search_indexes, to_match_query
+
+
+class TestFullTextSearch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+        users = UserManager(self.db)
+        for username in ("alice", "bob", "carol"):
+            users.create_user(username, "pw", "Leader")
+        self.messages = MessageManager(self.db)
+        self.reports = DailyReportManager(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _send(self, message_id, sender, recipient, content):
+        self.messages.add({
+            "message_id": message_id,
+            "from_user": sender,
+            "to_user": recipient,
+            "content": content,
+            "sent_at": f"2030-01-01T10:00:{message_id}",
+        })
+
+    def _ids(self, results, key="message_id"):
+        return [r[key] for r in results]
+
+    def test_match_query_ignores_fts_syntax(self):
+        self.assertEqual(to_match_query("don't  hike-NEAR"), '"don"* "t"* "hike"* "NEAR"*')
+        self.assertEqual(to_match_query(" -*() "), "")
+
+    def test_message_search_is_ranked_and_scoped_to_the_user(self):
+        self._send("01", "alice", "bob", "Canoe trip at the lake, bring a canoe paddle for the canoe")
+        self._send("02", "bob", "alice", "The lake is cold")
+        self._send("03", "carol", "bob", "Canoe canoe canoe")
+
+        results = self.messages.search("alice", "canoe")
+        self.assertEqual(self._ids(results), ["01"])
+        self.assertIn(f"{MATCH_START}canoe{MATCH_END}", results[0]["snippet"])
+
+        self.assertEqual(self._ids(self.messages.search("bob", "canoe")), ["03", "01"])
+        self.assertEqual(self._ids(self.messages.search("alice", "lake cold")), ["02"])
+        self.assertEqual(self.messages.search("alice", "???"), [])
+        # Search terms only match the text, never the sender or recipient.
+        self.assertEqual(self.messages.search("bob", "carol"), [])
+
+    def test_index_follows_edits_and_deletes(self):
+        self._send("01", "alice", "bob", "Meet at the archery range")
+        self.messages.update({
+            "message_id": "01", "from_user": "alice", "to_user": "bob",
+            "content": "Meet at the climbing wall", "sent_at": "2030-01-01T10:00:01",
+        })
+        self.messages.mark_as_read_batch(["01"])
+        self.assertEqual(self.messages.search("bob", "archery"), [])
+        self.assertEqual(self._ids(self.messages.search("bob", "climb")), ["01"])
+
+        self.reports.add_report({"report_id": "r1", "camp_id": None, "date": "2030-01-01", "text": "Long hike", "incident_details": "Twisted ankle"})
+        self.assertEqual(self._ids(self.reports.search("ankle"), "report_id"), ["r1"])
+        self.assertEqual(self.reports.search("ankle", camp_ids=[]), [])
+        self.reports.save_all([])
+        self.assertEqual(self.reports.search("ankle"), [])
+
+        with self.db.connection() as conn:
+            for table in ("messages_fts", "daily_reports_fts"):
+                conn.execute(f"INSERT INTO {table}({table}) VALUES ('integrity-check')")
+
+    def test_rebuild_recovers_rows_written_without_triggers(self):
+        announcements = AnnouncementManager(self.db)
+        announcements.add({"announcement_id": "a1", "author": "alice", "content": "Lights out at ten", "created_at": "2030-01-01"})
+        with self.db.connection() as conn:
+            # REPLACE deletes the old row without firing delete triggers.
+            conn.execute("INSERT OR REPLACE INTO announcements VALUES ('a1', 'alice', 'Breakfast at eight', '2030-01-01')")
+            conn.commit()
+
+        rebuild_search_indexes(self.db)
+        self.assertEqual(announcements.search("lights"), [])
+        self.assertEqual(self._ids(announcements.search("breakfast"), "announcement_id"), ["a1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
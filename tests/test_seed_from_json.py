@@ -0,0 +1,154 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from persistence import seed_from_json
+from persistence.dao.camp_manager import CampManager
+from persistence.db_context import DBContext
+from persistence.json_stream import iter_json_array
+
+
+class TestJsonStream(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "data.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_elements_survive_any_chunk_boundary(self):
+        data = [{"text": "a ] , [ b", "n": [1, {"x": None}]}, 12345, "ü" * 40, True, []]
+        self._write(json.dumps(data, indent=2))
+        for chunk_size in (1, 2, 5, 64):
+            self.assertEqual(list(iter_json_array(self.path, chunk_size)), data)
+
+        self._write("  [ ]  ")
+        self.assertEqual(list(iter_json_array(self.path, 1)), [])
+
+    def test_rejects_non_arrays_and_truncated_files(self):
+        for text in ('{"a": 1}', "[1, 2", "[1 2]", ""):
+            self._write(text)
+            with self.assertRaises(ValueError):
+                list(iter_json_array(self.path, 2))
+
+
+class TestSeedFromJson(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.tmp_dir, "data")
+        os.makedirs(self.data_dir)
+        self.db = DBContext(os.path.join(self.tmp_dir, "test.db"))
+
+        self._write("users.json", [
+            {"username": "leader1", "password": "pw", "role": "Leader"},
+            {"username": "coord", "password": "pw", "role": "Coordinator"},
+        ])
+        self._write("activities.json", {"Archery": {"is_indoor": False}})
+        self._write("camps.json", [{
+            "camp_id": "c1", "name": "Lakeside", "start_date": "2030-01-01", "end_date": "2030-01-03",
+            "camp_leader": "leader1", "initial_food_stock": 50,
+            "campers": [{"camper_id": "k1", "name": "Amy", "age": 10}, {"camper_id": "k2", "name": "Ben", "age": 11}],
+            "equipment": [{"resource_id": "e1", "name": "Tent", "target_quantity": 2, "current_quantity": 2}],
+            "activities": [{"name": "Archery", "date": "2030-01-01", "session": "Morning", "camper_ids": ["Amy", "k2"]}],
+        }])
+        self._write("messages.json", [
+            {"message_id": "m1", "from_user": "coord", "to_user": "leader1", "content": "hello", "sent_at": "2030-01-01"},
+        ])
+        self._write("daily_reports.json", [
+            {"id": "r1", "camp_id": "c1", "date": "2030-01-01", "text": "hike", "daily_participation": 2, "activities": ["Hike"]},
+            {"id": "r2", "camp_id": "gone", "date": "2030-01-01", "text": "lost"},
+        ])
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _write(self, filename, data):
+        with open(os.path.join(self.data_dir, filename), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def _count(self, conn, table):
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_seed_loads_every_table_and_reseeds_in_place(self):
+        with self.db.connection() as conn:
+            indexes = self._count(conn, "sqlite_master WHERE type = 'index'")
+            triggers = self._count(conn, "sqlite_master WHERE type = 'trigger'")
+
+        seed_from_json.seed(self.db, self.data_dir)
+        seed_from_json.seed(self.db, self.data_dir, rebuild_indexes=True)
+
+        with self.db.connection() as conn:
+            counts = {table: self._count(conn, table) for table in (
+                "users", "activity_library", "camps", "campers", "camp_campers", "equipment",
+                "scheduled_activities", "activity_attendance", "messages", "conversations", "daily_reports",
+            )}
+            self.assertEqual(counts, {
+                "users": 2, "activity_library": 1, "camps": 1, "campers": 2, "camp_campers": 2, "equipment": 1,
+                "scheduled_activities": 1, "activity_attendance": 2, "messages": 1, "conversations": 1,
+                "daily_reports": 1,
+            })
+            self.assertEqual(self._count(conn, "sqlite_master WHERE type = 'index'"), indexes)
+            self.assertEqual(self._count(conn, "sqlite_master WHERE type = 'trigger'"), triggers)
+            self.assertEqual(self._count(conn, "messages_fts WHERE messages_fts MATCH 'hello'"), 1)
+            self.assertEqual(conn.execute("PRAGMA foreign_key_check").fetchall(), [])
+            report = conn.execute("SELECT report_id, daily_participation, activity_count FROM daily_reports").fetchone()
+            self.assertEqual(report, ("r1", 2, 1))
+
+        stats = CampManager(self.db).get_camp_stats("c1")
+        self.assertEqual((stats["campers"], stats["reports"]), (2, 1))
+
+    def test_failed_table_is_rolled_back_whole(self):
+        self._write("messages.json", [
+            {"message_id": "m1", "from_user": "coord", "to_user": "leader1", "content": "ok", "sent_at": "2030-01-01"},
+            {"message_id": "m2", "from_user": "nobody", "to_user": "leader1", "content": "bad", "sent_at": "2030-01-02"},
+        ])
+
+        seed_from_json.seed(self.db, self.data_dir)
+
+        with self.db.connection() as conn:
+            # Foreign keys are checked at commit, so the valid message is rolled back too.
+            self.assertEqual(self._count(conn, "messages"), 0)
+            self.assertEqual(self._count(conn, "camps"), 1)
+
+    def test_interrupted_load_gets_its_indexes_and_triggers_back(self):
+        with self.db.connection() as conn:
+            schema = conn.execute("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger') ORDER BY name").fetchall()
+
+        # A loader killed midway never gets to recreate what it dropped.
+        script = (
+            "import os, sys\n"
+            "from persistence import bulk_load, seed_from_json\n"
+            "from persistence.db_context import DBContext\n"
+            "conn = DBContext(sys.argv[1]).get_connection()\n"
+            "with bulk_load.derived_triggers_dropped(conn), bulk_load.indexes_dropped(conn, seed_from_json.SEEDED_TABLES):\n"
+            "    os._exit(1)\n"
+        )
+        self.db.close()
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        subprocess.run([sys.executable, "-c", script, self.db.db_path], cwd=root, check=False)
+        raw = sqlite3.connect(self.db.db_path)
+        try:
+            self.assertGreater(self._count(raw, "suspended_schema"), 0)
+            self.assertLess(self._count(raw, "sqlite_master WHERE type IN ('index', 'trigger')"), len(schema))
+        finally:
+            raw.close()
+
+        self.db = DBContext(self.db.db_path)
+        with self.db.connection() as conn:
+            self.assertEqual(conn.execute("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger') ORDER BY name").fetchall(), schema)
+            self.assertEqual(self._count(conn, "suspended_schema"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
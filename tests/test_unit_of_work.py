@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app_context import AppContext
+from services.camp_service import CampService
+from models.activity import Activity, Session
+from tests.test_camp_manager import CountingDBContext, make_camp
+
+
+class TestUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = CountingDBContext(os.path.join(self.tmp_dir, "test.db"))
+        self.context = AppContext.create(self.db)
+        self.camp_manager = self.context.camp_manager
+        self.uow = self.context.unit_of_work
+        self.camp = make_camp(1)
+        self.camp_manager.add(self.camp)
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _statements(self, prefix):
+        return [s for s in self.db.statements if s.lstrip().upper().startswith(prefix)]
+
+    def test_scope_returns_same_camp_for_same_id(self):
+        with self.uow.scope():
+            listed = self.camp_manager.read_all(lazy=True)[0]
+            self.db.statements.clear()
+
+            self.assertIs(self.camp_manager.find_camp("Camp 1", lazy=True), listed)
+            self.assertIs(self.camp_manager.get_camp_by_id(self.camp.camp_id), listed)
+            self.assertEqual(self._statements("SELECT"), [])
+
+        self.assertIsNot(self.camp_manager.get_camp_by_id(self.camp.camp_id), listed)
+
+    def test_updates_are_flushed_together_when_scope_exits(self):
+        service = CampService(self.camp_manager)
+        self.db.statements.clear()
+
+        with self.uow.scope():
+            service.update_location("Camp 1", "Lake")
+            service.top_up_food("Camp 1", 5)
+            with self.uow.scope():
+                service.add_equipment("Camp 1", "Canoe", 2, 2, "Good")
+            self.assertEqual(self._statements(("UPDATE", "INSERT")), [])
+
+        writes = self._statements(("UPDATE", "INSERT"))
+        self.assertEqual(len(writes), 2)
+        self.assertEqual(len(self._statements("COMMIT")), 1)
+
+        reloaded = self.camp_manager.get_camp_by_id(self.camp.camp_id)
+        self.assertEqual(reloaded.location, "Lake")
+        self.assertEqual(reloaded.current_food_stock, 85)
+        self.assertEqual(sorted(e.name for e in reloaded.equipment), ["Canoe", "Tent"])
+
+    def test_aggregate_reads_flush_pending_changes_first(self):
+        service = CampService(self.camp_manager)
+
+        with self.uow.scope():
+            service.update_location("Camp 1", "Lake")
+            camp = self.camp_manager.find_camp("Camp 1")
+            camp.campers.pop()
+            self.camp_manager.update(camp)
+
+            self.assertEqual(self.camp_manager.list_summaries()[0].location, "Lake")
+            self.assertEqual(self.camp_manager.get_camp_stats(camp.camp_id)["campers"], len(camp.campers))
+            self.assertIs(self.camp_manager.find_camp("Camp 1"), camp)
+
+            self.db.statements.clear()
+            camp.current_food_stock = 1
+            self.camp_manager.update(camp)
+            self.camp_manager.get_global_activity_engagement(camp.camp_id)
+            self.assertEqual(len(self._statements("COMMIT")), 1)
+
+        self.assertEqual(self.camp_manager.get_camp_by_id(camp.camp_id).current_food_stock, 1)
+
+    def test_update_outside_scope_writes_immediately(self):
+        camp = self.camp_manager.get_camp_by_id(self.camp.camp_id)
+        camp.location = "Hill"
+        self.camp_manager.update(camp)
+
+        self.assertEqual(self.camp_manager.get_camp_by_id(self.camp.camp_id).location, "Hill")
+
+    def test_activities_added_inside_scope_have_ids_for_roster_import(self):
+        roster = os.path.join(self.tmp_dir, "roster.csv")
+        with open(roster, "w", encoding="utf-8") as f:
+            f.write("name\nCamper 1-0\n")
+
+        with self.uow.scope():
+            camp = self.camp_manager.find_camp("Camp 1")
+            camp.activities.append(Activity("Canoe", "2030-01-02", Session.Afternoon, is_indoor=False))
+            self.camp_manager.update(camp)
+            self.uow.flush()
+            canoe = camp.activities[-1]
+            self.assertIsNotNone(canoe.activity_id)
+
+            results = self.context.camper_manager.import_roster_to_activities(
+                camp, roster, activity_ids=[canoe.activity_id], context=self.context
+            )
+
+        self.assertEqual([(a["name"], a["imported_count"]) for a in results["activities"]], [("Canoe", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()